@@ -0,0 +1,71 @@
+"""Add reference_versions table with write-counting triggers.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-03-05 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "023"
+down_revision: str | None = "022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+REFERENCE_TABLES = (
+    "zone_definitions",
+    "questions",
+    "boxes",
+    "box_assignments",
+    "payment_methods",
+    "roles",
+    "packs",
+    "promotions",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reference_versions",
+        sa.Column("table_name", sa.String(64), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    for table in REFERENCE_TABLES:
+        op.execute(
+            sa.text("INSERT INTO reference_versions (table_name, version) VALUES (:t, 0)")
+            .bindparams(t=table)
+        )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_reference_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE reference_versions SET version = version + 1
+            WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in REFERENCE_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_reference_version "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_version()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in REFERENCE_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_reference_version ON {table}")
+        op.execute("DROP FUNCTION IF EXISTS bump_reference_version()")
+    op.drop_table("reference_versions")
@@ -0,0 +1,38 @@
+"""Add patient_alert_state table with precomputed alert counts.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-03-06 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "024"
+down_revision: str | None = "023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "patient_alert_state",
+        sa.Column(
+            "patient_id",
+            sa.String(36),
+            sa.ForeignKey("patients.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("alert_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("warning_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("computed_on", sa.Date(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("patient_alert_state")
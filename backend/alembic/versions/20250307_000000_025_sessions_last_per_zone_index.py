@@ -0,0 +1,30 @@
+"""Add composite index for the last session per patient zone.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-03-07 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "025"
+down_revision: str | None = "024"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sessions_patient_zone_date",
+        "sessions",
+        ["patient_id", "patient_zone_id", sa.text("date_seance DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_patient_zone_date", table_name="sessions")
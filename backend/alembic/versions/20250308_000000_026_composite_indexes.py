@@ -0,0 +1,55 @@
+"""Add composite indexes for the hot query shapes.
+
+Single-column indexes that become a prefix of a new composite index are
+dropped.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-03-08 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "026"
+down_revision: str | None = "025"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COMPOSITE_INDEXES = (
+    ("ix_sessions_praticien_date", "sessions", ["praticien_id", "date_seance"]),
+    ("ix_sessions_patient_date", "sessions", ["patient_id", "date_seance"]),
+    ("ix_paiements_date_type", "paiements", ["date_paiement", "type"]),
+    (
+        "ix_waiting_queue_status_checkin_position",
+        "waiting_queue",
+        ["status", "checked_in_at", "position"],
+    ),
+    ("ix_daily_schedules_date_start", "daily_schedules", ["date", "start_time"]),
+    ("ix_daily_schedules_status_patient", "daily_schedules", ["status", "patient_id"]),
+    ("ix_session_side_effects_created_at", "session_side_effects", ["created_at"]),
+)
+
+# Covered by the composite indexes above
+REDUNDANT_INDEXES = (
+    ("ix_sessions_praticien_id", "sessions", ["praticien_id"]),
+    ("ix_sessions_patient_id", "sessions", ["patient_id"]),
+    ("ix_paiements_date_paiement", "paiements", ["date_paiement"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in COMPOSITE_INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in reversed(COMPOSITE_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,33 @@
+"""Add content_hash to photo and document tables for the blob store.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-03-09 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "027"
+down_revision: str | None = "026"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose rows reference blobs; files stored before keep a NULL hash
+TABLES = ("session_photos", "side_effect_photos", "patient_documents")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("content_hash", sa.String(64), nullable=True))
+        op.create_index(f"ix_{table}_content_hash", table, ["content_hash"])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_content_hash", table_name=table)
+        op.drop_column(table, "content_hash")
@@ -0,0 +1,42 @@
+"""Track users in reference_versions for the cached box board.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-03-11 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "029"
+down_revision: str | None = "028"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "users"
+
+
+def upgrade() -> None:
+    op.execute(
+        sa.text("INSERT INTO reference_versions (table_name, version) VALUES (:t, 0)")
+        .bindparams(t=TABLE)
+    )
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        f"CREATE TRIGGER trg_{TABLE}_reference_version "
+        f"AFTER INSERT OR UPDATE OR DELETE ON {TABLE} "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_reference_version()"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{TABLE}_reference_version ON {TABLE}")
+    op.execute(
+        sa.text("DELETE FROM reference_versions WHERE table_name = :t").bindparams(t=TABLE)
+    )
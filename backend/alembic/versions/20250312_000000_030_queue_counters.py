@@ -0,0 +1,36 @@
+"""Add queue_counters for race-free waiting queue positions.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-03-12 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "030"
+down_revision: str | None = "029"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "queue_counters",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("last_position", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Continue today's numbering so entries checked in before the upgrade keep their place
+    op.execute(
+        "INSERT INTO queue_counters (day, last_position) "
+        "SELECT CURRENT_DATE, COALESCE(MAX(position), 0) FROM waiting_queue "
+        "WHERE checked_in_at >= CURRENT_DATE"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("queue_counters")
@@ -0,0 +1,40 @@
+"""Add change_log for delta sync of patients, schedule, queue, sessions and payments.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-03-13 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: str | None = "030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "change_log",
+        sa.Column(
+            "version",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            primary_key=True,
+            autoincrement=True,
+        ),
+        sa.Column("entity", sa.String(20), nullable=False),
+        sa.Column("entity_id", sa.String(36), nullable=False),
+        sa.Column("op", sa.String(10), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_change_log_created_at", "change_log", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_change_log_created_at", table_name="change_log")
+    op.drop_table("change_log")
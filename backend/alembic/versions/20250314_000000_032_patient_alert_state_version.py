@@ -0,0 +1,124 @@
+"""Version patient_alert_state with triggers on the alert sources.
+
+Every patient gets a state row. Writes to sessions, side effects,
+pre-consultations and their zones bump the patient's ``version`` (by
+trigger, so Core and bulk statements count too), and counts are only
+valid while ``computed_version`` equals it.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-03-14 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "032"
+down_revision: str | None = "031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ALERT_SOURCE_TABLES = (
+    "sessions",
+    "session_side_effects",
+    "pre_consultations",
+    "pre_consultation_zones",
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("patient_alert_state") as batch:
+        batch.add_column(
+            sa.Column("version", sa.BigInteger(), nullable=False, server_default="0")
+        )
+        batch.add_column(sa.Column("computed_version", sa.BigInteger(), nullable=True))
+        batch.alter_column("computed_on", existing_type=sa.Date(), nullable=True)
+
+    # Existing counts have no computed_version, so they are recomputed once
+    op.execute(
+        """
+        INSERT INTO patient_alert_state (patient_id, alert_count, error_count, warning_count)
+        SELECT p.id, 0, 0, 0 FROM patients p
+        WHERE NOT EXISTS (SELECT 1 FROM patient_alert_state s WHERE s.patient_id = p.id)
+        """
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_patient_alert_state() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO patient_alert_state (patient_id, alert_count, error_count, warning_count)
+            VALUES (NEW.id, 0, 0, 0)
+            ON CONFLICT (patient_id) DO NOTHING;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_patients_alert_state AFTER INSERT ON patients "
+        "FOR EACH ROW EXECUTE FUNCTION create_patient_alert_state()"
+    )
+
+    # Only existing rows are bumped (no insert), so cascaded deletes of a
+    # patient's sessions never reference the patient being deleted.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_patient_alert_version() RETURNS trigger AS $$
+        DECLARE
+            changed jsonb[] := '{}';
+            row_data jsonb;
+        BEGIN
+            IF TG_OP <> 'DELETE' THEN
+                changed := array_append(changed, to_jsonb(NEW));
+            END IF;
+            IF TG_OP <> 'INSERT' THEN
+                changed := array_append(changed, to_jsonb(OLD));
+            END IF;
+            FOREACH row_data IN ARRAY changed LOOP
+                UPDATE patient_alert_state SET version = version + 1
+                WHERE patient_id = CASE TG_TABLE_NAME
+                    WHEN 'session_side_effects' THEN (
+                        SELECT patient_id FROM sessions
+                        WHERE id = row_data ->> 'session_id'
+                    )
+                    WHEN 'pre_consultation_zones' THEN (
+                        SELECT patient_id FROM pre_consultations
+                        WHERE id = row_data ->> 'pre_consultation_id'
+                    )
+                    ELSE row_data ->> 'patient_id'
+                END;
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in ALERT_SOURCE_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_alert_version "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION bump_patient_alert_version()"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for table in ALERT_SOURCE_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_alert_version ON {table}")
+        op.execute("DROP FUNCTION IF EXISTS bump_patient_alert_version()")
+        op.execute("DROP TRIGGER IF EXISTS trg_patients_alert_state ON patients")
+        op.execute("DROP FUNCTION IF EXISTS create_patient_alert_state()")
+
+    op.execute("DELETE FROM patient_alert_state WHERE computed_on IS NULL")
+    with op.batch_alter_table("patient_alert_state") as batch:
+        batch.alter_column("computed_on", existing_type=sa.Date(), nullable=False)
+        batch.drop_column("computed_version")
+        batch.drop_column("version")
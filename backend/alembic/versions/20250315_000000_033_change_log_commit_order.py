@@ -0,0 +1,61 @@
+"""Number change_log entries in commit order.
+
+Versions came from the sequence at insert time, so a transaction that
+committed after a later-numbered one became visible below a cursor
+already handed out, and its changes were skipped. A deferred trigger now
+renumbers each entry at commit, under a lock held until the commit
+completes: an entry is visible only once every lower version is.
+
+SQLite allows a single writer at a time, so its versions already follow
+commit order.
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-03-15 00:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "033"
+down_revision: str | None = "032"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION change_log_commit_version() RETURNS trigger AS $$
+        BEGIN
+            -- Transaction-level: released only once the commit is visible
+            PERFORM pg_advisory_xact_lock(hashtext('change_log'));
+            UPDATE change_log
+            SET version = nextval(pg_get_serial_sequence('change_log', 'version'))
+            WHERE version = NEW.version;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE CONSTRAINT TRIGGER trg_change_log_commit_version
+        AFTER INSERT ON change_log
+        DEFERRABLE INITIALLY DEFERRED
+        FOR EACH ROW EXECUTE FUNCTION change_log_commit_version()
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS trg_change_log_commit_version ON change_log")
+    op.execute("DROP FUNCTION IF EXISTS change_log_commit_version()")
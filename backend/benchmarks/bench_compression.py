@@ -0,0 +1,90 @@
+"""Report bytes saved and latency added by CompressionMiddleware.
+
+Serves representative payloads (a page of sessions as JSON, a patient CSV
+export streamed in chunks) through a bare Starlette app wrapped in the
+middleware, once per available encoding.
+
+Usage (from backend/):
+    python -m benchmarks.bench_compression [--items 100] [--rounds 100]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import time
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from benchmarks.bench_serialization import build_payload
+from src.core.compression import CompressionMiddleware, available_encodings
+
+
+def build_csv(rows: int) -> list[str]:
+    """Build a patient export split in chunks of 100 rows."""
+    chunks = []
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["Code carte", "Nom", "Prenom", "Telephone", "Ville", "Statut"])
+    for i in range(rows):
+        writer.writerow([f"P{i:06d}", "Martin", "Sophie", f"06{i:08d}", "Paris", "actif"])
+        if i % 100 == 99:
+            chunks.append(output.getvalue())
+            output = io.StringIO()
+            writer = csv.writer(output)
+    chunks.append(output.getvalue())
+    return chunks
+
+
+def build_app(items: int) -> Starlette:
+    json_body = build_payload(items).model_dump_json().encode()
+    csv_chunks = build_csv(items * 10)
+
+    async def sessions(_request):
+        return Response(json_body, media_type="application/json")
+
+    async def export(_request):
+        return StreamingResponse(iter(csv_chunks), media_type="text/csv")
+
+    app = Starlette(routes=[Route("/sessions", sessions), Route("/export", export)])
+    return CompressionMiddleware(app)
+
+
+async def measure(app, path: str, encoding: str, rounds: int) -> tuple[int, float]:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept-Encoding": encoding}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(path, headers=headers)  # warm up
+        size = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            async with client.stream("GET", path, headers=headers) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            size = len(raw)
+        elapsed = (time.perf_counter() - start) / rounds * 1000
+    return size, elapsed
+
+
+async def run(items: int, rounds: int) -> None:
+    app = build_app(items)
+    for path in ("/sessions", "/export"):
+        identity_size, identity_ms = await measure(app, path, "identity", rounds)
+        print(f"{path}: {identity_size} B uncompressed, {identity_ms:.3f} ms")
+        for encoding in available_encodings():
+            size, ms = await measure(app, path, encoding, rounds)
+            saved = 100 * (1 - size / identity_size)
+            print(
+                f"  {encoding:<5} {size:>8} B  saved {saved:5.1f}%  "
+                f"+{ms - identity_ms:.3f} ms/request"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.items, args.rounds))
@@ -0,0 +1,415 @@
+"""EXPLAIN ANALYZE harness for the hot repository queries.
+
+Seeds realistic volumes with the helpers from ``src.db.seed``, then runs each
+repository method, records its median latency and the plan of every
+statement it issues, and writes a JSON report.
+
+``--indexes before`` reverts the indexes of migration 026 for the run and
+``--indexes after`` applies them; nothing else in the schema changes, so
+later migrations stay in place. The run leaves the database in the state
+it measured.
+
+Runs against DATABASE_URL: use a disposable database. On PostgreSQL, create
+the schema with ``alembic upgrade head`` first; on an empty database --seed
+falls back to ``create_all``.
+
+Usage (from backend/):
+    alembic upgrade head
+    python -m benchmarks.bench_queries --seed [--patients 3000]
+    python -m benchmarks.bench_queries --indexes before --output before.json
+    python -m benchmarks.bench_queries --indexes after --output after.json
+    python -m benchmarks.bench_queries --compare before.json after.json
+
+Reports from the last run are kept in ``benchmarks/reports/``.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from random import choice, randint, random
+from random import seed as random_seed
+from uuid import uuid4
+
+from sqlalchemy import event, func, insert, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.services.dashboard_service import DashboardService
+from src.db.seed import (
+    SAMPLE_NOMS,
+    SAMPLE_PRENOMS_F,
+    create_patient_zones_and_sessions,
+    create_questions,
+    create_roles,
+    create_sample_patients,
+    create_user,
+    create_zone_definitions,
+)
+from src.infrastructure.database.connection import async_session_factory, engine
+from src.infrastructure.database.models import (
+    Base,
+    DailyScheduleModel,
+    PaiementModel,
+    PatientModel,
+    SessionModel,
+    SessionSideEffectModel,
+    WaitingQueueModel,
+)
+from src.infrastructure.database.repositories import (
+    PaiementRepository,
+    PatientRepository,
+    ScheduleRepository,
+    SessionRepository,
+    SideEffectRepository,
+    WaitingQueueRepository,
+)
+
+SCHEDULE_DAYS = 365
+SCHEDULE_PER_DAY = 40
+BATCH_SIZE = 1000
+
+
+def _load_migration_026():
+    versions = Path(__file__).resolve().parents[1] / "alembic" / "versions"
+    (path,) = versions.glob("*_026_*.py")
+    spec = importlib.util.spec_from_file_location("migration_026", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+async def _bulk_insert(session: AsyncSession, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute(insert(model), rows[start : start + BATCH_SIZE])
+
+
+async def seed(patients: int) -> None:
+    """Seed reference data, patients and sessions, then the operational tables."""
+    random_seed(42)
+    async with engine.begin() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+        if not tables:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async with async_session_factory() as session:
+        existing = await session.execute(select(func.count(PatientModel.id)))
+        if existing.scalar():
+            raise SystemExit("Database already has patients; seed a fresh database.")
+
+        roles = await create_roles(session)
+        praticiens = [
+            await create_user(
+                session,
+                username=f"bench_praticien_{i}",
+                password=uuid4().hex,
+                nom=choice(SAMPLE_NOMS),
+                prenom=choice(SAMPLE_PRENOMS_F),
+                role_id=roles["Praticien"],
+            )
+            for i in range(6)
+        ]
+        zones = await create_zone_definitions(session)
+        await create_questions(session)
+        patient_models = await create_sample_patients(session, patients, praticiens[0].id)
+        await create_patient_zones_and_sessions(
+            session, patient_models, zones, praticiens, praticiens[0].id
+        )
+
+        sessions = (
+            await session.execute(
+                select(SessionModel.id, SessionModel.patient_id, SessionModel.date_seance)
+            )
+        ).all()
+
+        side_effects = [
+            {
+                "id": str(uuid4()),
+                "session_id": session_id,
+                "description": "Rougeur persistante",
+                "severity": choice(["mild", "moderate", "severe"]),
+                "created_at": date_seance + timedelta(hours=2),
+            }
+            for session_id, _, date_seance in sessions
+            if random() < 0.15
+        ]
+        await _bulk_insert(session, SessionSideEffectModel, side_effects)
+
+        paiements = [
+            {
+                "id": str(uuid4()),
+                "patient_id": patient_id,
+                "session_id": session_id,
+                "montant": randint(30, 250) * 100,
+                "type": choice(["encaissement", "prise_en_charge", "hors_carte"]),
+                "mode_paiement": choice(["especes", "carte", "virement"]),
+                "date_paiement": date_seance,
+                "created_at": date_seance,
+            }
+            for session_id, patient_id, date_seance in sessions
+        ]
+        await _bulk_insert(session, PaiementModel, paiements)
+
+        today = date.today()
+        schedules, queue = [], []
+        for day_offset in range(SCHEDULE_DAYS):
+            day = today - timedelta(days=day_offset)
+            for slot in range(SCHEDULE_PER_DAY):
+                patient = choice(patient_models)
+                doctor = choice(praticiens)
+                start = dt_time(8 + slot // 4, (slot % 4) * 15)
+                status = (
+                    "expected"
+                    if day == today
+                    else choice(["checked_in", "checked_in", "checked_in", "no_show"])
+                )
+                schedule_id = str(uuid4())
+                schedules.append(
+                    {
+                        "id": schedule_id,
+                        "date": day,
+                        "patient_nom": patient.nom,
+                        "patient_prenom": patient.prenom,
+                        "patient_id": patient.id,
+                        "doctor_name": f"{doctor.prenom} {doctor.nom}",
+                        "doctor_id": doctor.id,
+                        "start_time": start,
+                        "status": status,
+                    }
+                )
+                if status == "checked_in" or (day == today and slot < SCHEDULE_PER_DAY // 2):
+                    queue.append(
+                        {
+                            "id": str(uuid4()),
+                            "schedule_id": schedule_id,
+                            "patient_id": patient.id,
+                            "patient_name": f"{patient.prenom} {patient.nom}",
+                            "doctor_id": doctor.id,
+                            "doctor_name": f"{doctor.prenom} {doctor.nom}",
+                            "checked_in_at": datetime.combine(day, start),
+                            "position": slot + 1,
+                            "status": "waiting" if day == today else "done",
+                        }
+                    )
+        await _bulk_insert(session, DailyScheduleModel, schedules)
+        await _bulk_insert(session, WaitingQueueModel, queue)
+        await session.commit()
+    await engine.dispose()
+
+    print(
+        f"Seeded {patients} patients, {len(sessions)} sessions, {len(side_effects)} side "
+        f"effects, {len(paiements)} payments, {len(schedules)} schedule entries, "
+        f"{len(queue)} queue entries"
+    )
+
+
+async def set_indexes(state: str) -> None:
+    """Put the indexes of migration 026 in their ``before`` or ``after`` state."""
+    migration = _load_migration_026()
+    if state == "after":
+        wanted, unwanted = migration.COMPOSITE_INDEXES, migration.REDUNDANT_INDEXES
+    else:
+        wanted, unwanted = migration.REDUNDANT_INDEXES, migration.COMPOSITE_INDEXES
+
+    def existing(sync_conn) -> set[str]:
+        inspector = inspect(sync_conn)
+        tables = {table for _, table, _ in wanted + unwanted}
+        return {index["name"] for table in tables for index in inspector.get_indexes(table)}
+
+    async with engine.begin() as conn:
+        present = await conn.run_sync(existing)
+        for name, table, columns in wanted:
+            if name not in present:
+                await conn.exec_driver_sql(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+        for name, _, _ in unwanted:
+            if name in present:
+                await conn.exec_driver_sql(f"DROP INDEX {name}")
+        # Fresh statistics so both runs plan on the same footing
+        await conn.exec_driver_sql("ANALYZE")
+
+
+async def _sample_ids(session: AsyncSession) -> dict:
+    """Pick the busiest practitioner and patient as query parameters."""
+    praticien_id = (
+        await session.execute(
+            select(SessionModel.praticien_id)
+            .group_by(SessionModel.praticien_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+    ).scalar()
+    patient_id = (
+        await session.execute(
+            select(SessionModel.patient_id)
+            .group_by(SessionModel.patient_id)
+            .order_by(func.count().desc())
+            .limit(1)
+        )
+    ).scalar()
+    return {"praticien_id": praticien_id, "patient_id": patient_id}
+
+
+def _cases(ids: dict) -> dict[str, Callable[[AsyncSession], Awaitable]]:
+    """Repository calls behind the hot endpoints, keyed by a stable name."""
+    now = _now()
+    month_ago = now - timedelta(days=30)
+
+    def dashboard(session: AsyncSession) -> DashboardService:
+        return DashboardService(
+            PatientRepository(session),
+            SessionRepository(session),
+            SideEffectRepository(session),
+            PaiementRepository(session),
+        )
+
+    return {
+        "sessions.find_all(praticien, last 30 days)": lambda s: SessionRepository(s).find_all(
+            1, 20, praticien_id=ids["praticien_id"], date_from=month_ago
+        ),
+        "sessions.find_by_patient": lambda s: SessionRepository(s).find_by_patient(
+            ids["patient_id"], 1, 20
+        ),
+        "sessions.find_last_session_per_zone": lambda s: SessionRepository(
+            s
+        ).find_last_session_per_zone(ids["patient_id"]),
+        "paiements.find_all(type, last 30 days)": lambda s: PaiementRepository(s).find_all(
+            type="encaissement", date_from=month_ago
+        ),
+        "paiements.get_revenue_by_type(last 30 days)": lambda s: PaiementRepository(
+            s
+        ).get_revenue_by_type(date_from=month_ago, date_to=now),
+        "waiting_queue.find_active": lambda s: WaitingQueueRepository(s).find_active(),
+        "waiting_queue.find_display": lambda s: WaitingQueueRepository(s).find_display(),
+        "schedule.find_by_date(today)": lambda s: ScheduleRepository(s).find_by_date(date.today()),
+        "schedule.find_no_shows(patient)": lambda s: ScheduleRepository(s).find_no_shows(
+            ids["patient_id"]
+        ),
+        "dashboard.get_side_effect_stats": lambda s: dashboard(s).get_side_effect_stats(),
+    }
+
+
+async def _explain(session: AsyncSession, statement: str, parameters) -> list[str]:
+    conn = await session.connection()
+    if conn.dialect.name == "postgresql":
+        result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+        return [row[0] for row in result.all()]
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[-1] for row in result.all()]
+
+
+async def run(rounds: int, indexes: str | None = None) -> dict:
+    """Time every case and capture the plans of the statements it issues."""
+    if indexes:
+        await set_indexes(indexes)
+    captured: list[tuple[str, object]] = []
+    capturing = False
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if capturing:
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    report = {"dialect": engine.dialect.name, "rounds": rounds, "indexes": indexes, "cases": {}}
+    try:
+        async with async_session_factory() as session:
+            ids = await _sample_ids(session)
+
+        for name, case in _cases(ids).items():
+            async with async_session_factory() as session:
+                captured.clear()
+                capturing = True
+                try:
+                    await case(session)
+                except Exception as exc:
+                    report["cases"][name] = {"error": f"{type(exc).__name__}: {exc}"}
+                    continue
+                finally:
+                    capturing = False
+                statements = list(captured)
+
+                timings = []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    await case(session)
+                    timings.append((time.perf_counter() - started) * 1000)
+                    session.expunge_all()
+
+                plans = [
+                    {"sql": statement, "plan": await _explain(session, statement, parameters)}
+                    for statement, parameters in statements
+                ]
+            report["cases"][name] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "p95_ms": round(sorted(timings)[int(len(timings) * 0.95) - 1], 3),
+                "statements": plans,
+            }
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+        await engine.dispose()
+    return report
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = json.load(f)["cases"]
+    with open(after_path) as f:
+        after = json.load(f)["cases"]
+
+    print(f"{'case':50} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+    for name, result in after.items():
+        old = before.get(name, {})
+        if "median_ms" not in result or "median_ms" not in old:
+            print(f"{name:50} {'n/a':>10} {'n/a':>10}")
+            continue
+        speedup = old["median_ms"] / result["median_ms"] if result["median_ms"] else 0
+        print(
+            f"{name:50} {old['median_ms']:>10.2f} {result['median_ms']:>10.2f} " f"{speedup:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="seed a fresh database and exit")
+    parser.add_argument("--patients", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--indexes",
+        choices=("before", "after"),
+        help="revert (before) or apply (after) the indexes of migration 026 first",
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.seed:
+        asyncio.run(seed(args.patients))
+        return
+
+    report = asyncio.run(run(args.rounds, args.indexes))
+    for name, result in report["cases"].items():
+        if "error" in result:
+            print(f"{name:50} {result['error']}")
+            continue
+        print(f"{name:50} median {result['median_ms']:8.2f} ms  p95 {result['p95_ms']:8.2f} ms")
+        for statement in result["statements"]:
+            print("    " + "\n    ".join(statement["plan"]))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
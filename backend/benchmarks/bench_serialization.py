@@ -0,0 +1,95 @@
+"""Benchmark JSON serialization paths for large list responses.
+
+Compares FastAPI's default response_model pipeline (validate + jsonable_encoder
++ json.dumps) with direct pydantic-core serialization and orjson.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serialization [--items 100] [--rounds 200]
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.core.responses import FastJSONResponse, PydanticResponse
+from src.schemas.session import SessionListResponse, SessionPhotoResponse, SessionResponse
+
+
+def build_payload(items: int) -> SessionListResponse:
+    """Build a session list similar to a full page of /sessions."""
+    now = datetime.now(UTC).replace(tzinfo=None)
+    sessions = [
+        SessionResponse(
+            id=f"session-{i}",
+            patient_id=f"patient-{i}",
+            patient_zone_id=f"zone-{i}",
+            zone_nom="Aisselles",
+            praticien_id="praticien-1",
+            praticien_nom="Jean Dupont",
+            patient_nom="Martin",
+            patient_prenom="Sophie",
+            date_seance=now,
+            type_laser="Alexandrite (755nm)",
+            parametres={"fluence": "18 J/cm²", "spot_size": "12 mm", "frequence": "2 Hz"},
+            notes="Bonne tolérance",
+            duree_minutes=30,
+            photos=[
+                SessionPhotoResponse(
+                    id=f"photo-{i}-{j}",
+                    filename=f"photo-{j}.jpg",
+                    url=f"/api/v1/photos/session-{i}/photo-{j}.jpg",
+                    created_at=now,
+                )
+                for j in range(2)
+            ],
+            created_at=now,
+        )
+        for i in range(items)
+    ]
+    return SessionListResponse(sessions=sessions, total=items, page=1, size=items, pages=1)
+
+
+def default_path(payload: SessionListResponse) -> bytes:
+    """Approximate FastAPI's serialize_response for a response_model route."""
+    validated = SessionListResponse.model_validate(payload.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def orjson_path(payload: SessionListResponse) -> bytes:
+    return FastJSONResponse(jsonable_encoder(payload)).body
+
+
+def pydantic_path(payload: SessionListResponse) -> bytes:
+    return PydanticResponse(payload).body
+
+
+def run(items: int, rounds: int) -> None:
+    payload = build_payload(items)
+    results = {}
+    for name, fn in (
+        ("default (validate + jsonable_encoder)", default_path),
+        ("FastJSONResponse (jsonable_encoder + orjson)", orjson_path),
+        ("PydanticResponse (model_dump_json)", pydantic_path),
+    ):
+        fn(payload)  # warm up
+        start = time.perf_counter()
+        for _ in range(rounds):
+            body = fn(payload)
+        elapsed = (time.perf_counter() - start) / rounds * 1000
+        results[name] = (elapsed, len(body))
+
+    baseline = results["default (validate + jsonable_encoder)"][0]
+    print(f"{items} sessions, {rounds} rounds")
+    for name, (ms, size) in results.items():
+        print(f"  {name:<48} {ms:8.3f} ms  {size:>8} B  x{baseline / ms:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    run(args.items, args.rounds)
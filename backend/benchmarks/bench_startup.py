@@ -0,0 +1,81 @@
+"""Profile the import time of the API with ``python -X importtime``.
+
+Imports ``src.main`` in fresh interpreters and reports the total import
+time, the slowest top-level packages and any heavy library (reportlab,
+Pillow...) loaded at startup although only needed on first use.
+``tests/integration/test_full_api.py`` checks that no heavy library is
+loaded and that the number of modules imported stays within
+IMPORT_MODULE_BUDGET, which does not depend on the machine's load.
+IMPORT_BUDGET_MS is only reported here.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup [--rounds 3] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import Counter
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries imported on first use only; none may load with src.main
+HEAVY_MODULES = ("reportlab", "qrcode", "PIL", "openpyxl", "sse_starlette")
+
+# Cumulative import time allowed for src.main (best of the rounds)
+IMPORT_BUDGET_MS = 4000
+
+# Modules imported with src.main (754 when set), with headroom for growth
+IMPORT_MODULE_BUDGET = 900
+
+
+def profile_import(module: str = "src.main") -> dict[str, tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter; module -> (self, cumulative) µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONPATH": BACKEND_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def heavy_modules(timings: dict[str, tuple[int, int]]) -> list[str]:
+    """Heavy libraries present in an import profile."""
+    return [name for name in HEAVY_MODULES if name in timings]
+
+
+def run(rounds: int, top: int) -> None:
+    profiles = [profile_import() for _ in range(rounds)]
+    totals = [timings["src.main"][1] / 1000 for timings in profiles]
+    best = min(totals)
+    print(f"import src.main, {rounds} rounds")
+    print(f"  best {best:8.1f} ms  worst {max(totals):8.1f} ms  budget {IMPORT_BUDGET_MS} ms")
+    print(f"  modules {len(profiles[0]):8d}  budget {IMPORT_MODULE_BUDGET}")
+
+    packages: Counter[str] = Counter()
+    for name, (self_us, _) in profiles[totals.index(best)].items():
+        packages[name.split(".")[0]] += self_us
+    print("  slowest packages (self time):")
+    for name, self_us in packages.most_common(top):
+        print(f"    {name:<24} {self_us / 1000:8.1f} ms")
+
+    loaded = heavy_modules(profiles[0])
+    print(f"  heavy libraries at startup: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    run(args.rounds, args.top)
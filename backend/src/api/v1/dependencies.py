@@ -1,9 +1,11 @@
 """API dependencies for dependency injection."""
 
+from contextlib import asynccontextmanager
+from datetime import date
 from typing import Annotated, Optional
 
 import jwt as pyjwt
-from fastapi import Cookie, Depends, HTTPException, Request, status
+from fastapi import Cookie, Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,19 +25,27 @@ from src.application.services.alert_service import AlertService
 from src.application.services.box_service import BoxService
 from src.application.services.pack_service import PackService, SubscriptionService
 from src.application.services.paiement_service import PaiementService
+from src.application.services.patient_overview_service import PatientOverviewService
 from src.application.services.pre_consultation_service import PreConsultationService
 from src.application.services.promotion_service import PromotionService
 from src.application.services.schedule_service import ScheduleService
-from src.infrastructure.database.connection import get_session
+from src.application.services.sync_service import SyncService
+from src.core.config import settings
+from src.core.exceptions import NotModifiedError
+from src.infrastructure.database.connection import async_session_factory, get_session
 from src.domain.exceptions import AuthenticationError
+from src.infrastructure.cache import table_versions
 from src.infrastructure.database.repositories import (
     BoxAssignmentRepository,
     BoxRepository,
+    ChangeLogRepository,
     PackRepository,
     PaiementRepository,
+    PatientAlertStateRepository,
     PatientRepository,
     PatientSubscriptionRepository,
     PatientZoneRepository,
+    PaymentMethodRepository,
     PreConsultationRepository,
     PromotionRepository,
     QuestionRepository,
@@ -56,7 +66,8 @@ security = HTTPBearer(auto_error=False)
 # Database session
 async def get_db() -> AsyncSession:
     """Get database session."""
-    async for session in get_session():
+    # Entered as a context manager so errors reach its rollback
+    async with asynccontextmanager(get_session)() as session:
         yield session
 
 
@@ -123,6 +134,13 @@ def get_side_effect_repository(
     return SideEffectRepository(session)
 
 
+def get_patient_alert_state_repository(
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> PatientAlertStateRepository:
+    """Get patient alert state repository."""
+    return PatientAlertStateRepository(session)
+
+
 def get_pack_repository(session: Annotated[AsyncSession, Depends(get_db)]) -> PackRepository:
     """Get pack repository."""
     return PackRepository(session)
@@ -142,6 +160,13 @@ def get_paiement_repository(
     return PaiementRepository(session)
 
 
+def get_payment_method_repository(
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> PaymentMethodRepository:
+    """Get payment method repository."""
+    return PaymentMethodRepository(session)
+
+
 def get_promotion_repository(
     session: Annotated[AsyncSession, Depends(get_db)],
 ) -> PromotionRepository:
@@ -175,6 +200,13 @@ def get_waiting_queue_repository(
     return WaitingQueueRepository(session)
 
 
+def get_change_log_repository(
+    session: Annotated[AsyncSession, Depends(get_db)],
+) -> ChangeLogRepository:
+    """Get change log repository."""
+    return ChangeLogRepository(session)
+
+
 # Service dependencies
 def get_auth_service(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
@@ -279,9 +311,12 @@ def get_alert_service(
     ],
     session_repo: Annotated[SessionRepository, Depends(get_session_repository)],
     side_effect_repo: Annotated[SideEffectRepository, Depends(get_side_effect_repository)],
+    alert_state_repo: Annotated[
+        PatientAlertStateRepository, Depends(get_patient_alert_state_repository)
+    ],
 ) -> AlertService:
     """Get alert service."""
-    return AlertService(pre_consultation_repo, session_repo, side_effect_repo)
+    return AlertService(pre_consultation_repo, session_repo, side_effect_repo, alert_state_repo)
 
 
 def get_pack_service(
@@ -312,9 +347,11 @@ def get_paiement_service(
 
 def get_promotion_service(
     promotion_repo: Annotated[PromotionRepository, Depends(get_promotion_repository)],
+    zone_repo: Annotated[ZoneDefinitionRepository, Depends(get_zone_definition_repository)],
+    pack_repo: Annotated[PackRepository, Depends(get_pack_repository)],
 ) -> PromotionService:
     """Get promotion service."""
-    return PromotionService(promotion_repo)
+    return PromotionService(promotion_repo, zone_repo, pack_repo)
 
 
 def get_box_service(
@@ -343,6 +380,28 @@ def get_schedule_service(
     )
 
 
+def get_patient_overview_service() -> PatientOverviewService:
+    """Get patient overview service (opens its own sessions)."""
+    # A SQLite connection is shared by every session, so sections run one by one
+    concurrency = 1 if settings.database_url.startswith("sqlite") else settings.overview_concurrency
+    return PatientOverviewService(async_session_factory, concurrency)
+
+
+def get_sync_service(
+    change_log_repo: Annotated[ChangeLogRepository, Depends(get_change_log_repository)],
+    patient_repo: Annotated[PatientRepository, Depends(get_patient_repository)],
+    schedule_repo: Annotated[ScheduleRepository, Depends(get_schedule_repository)],
+    queue_repo: Annotated[WaitingQueueRepository, Depends(get_waiting_queue_repository)],
+    session_repo: Annotated[SessionRepository, Depends(get_session_repository)],
+    paiement_repo: Annotated[PaiementRepository, Depends(get_paiement_repository)],
+) -> SyncService:
+    """Get delta sync service."""
+    return SyncService(
+        change_log_repo, patient_repo, schedule_repo, queue_repo, session_repo,
+        paiement_repo, settings.sync_page_size,
+    )
+
+
 # Authentication dependency
 async def get_current_user(
     request: Request,
@@ -417,6 +476,76 @@ def require_permission(permission: str):
     return check_permission
 
 
+def permitted_sections(
+    requested: str | None,
+    section_permissions: dict[str, str],
+    current_user: dict,
+    label: str = "Sections",
+    implicit: tuple[str, ...] = (),
+) -> list[str]:
+    """Sections named in a comma-separated query parameter, checked against permissions.
+
+    ``section_permissions`` maps each section to the permission it requires.
+    Without ``requested``, every section the user may see is returned. An
+    unknown name is a 400 and a section the user may not see a 403; names in
+    ``implicit`` are always part of the response and are skipped.
+    """
+    permissions = set(current_user.get("permissions", []))
+    if requested is None:
+        return [name for name, perm in section_permissions.items() if perm in permissions]
+    names = [n.strip() for n in requested.split(",") if n.strip() not in ("", *implicit)]
+    unknown = [name for name in names if name not in section_permissions]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{label} inconnues : {', '.join(unknown)}",
+        )
+    if any(section_permissions[name] not in permissions for name in names):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Permission insuffisante",
+        )
+    return names
+
+
+# Reference data is private to the clinic and must be revalidated on each use;
+# revalidation is cheap since a matching ETag short-circuits to 304.
+REFERENCE_CACHE_CONTROL = "private, no-cache"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: compressed responses carry the ETag as W/"..."
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def conditional_get(*tables: str, daily: bool = False):
+    """Create a dependency answering If-None-Match for data read from ``tables``.
+
+    The ETag derives from the in-memory table versions and the query string, so
+    a matching request is answered with 304 before any reference data is
+    loaded. Declare it after the permission dependency.
+    """
+
+    async def check_etag(request: Request, response: Response) -> str:
+        variant = "&".join(sorted(request.url.query.split("&")))
+        if daily:
+            # Results depend on the current date (e.g. promotion validity).
+            variant += f"@{date.today().isoformat()}"
+        etag = table_versions.etag(tables, variant)
+        headers = {"ETag": etag, "Cache-Control": REFERENCE_CACHE_CONTROL}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedError(headers)
+        response.headers.update(headers)
+        return etag
+
+    return check_etag
+
+
 # Type aliases for common dependencies
 CurrentUser = Annotated[dict, Depends(get_current_user)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
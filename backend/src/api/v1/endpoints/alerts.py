@@ -9,7 +9,11 @@ from src.api.v1.dependencies import (
     require_permission,
 )
 from src.application.services.alert_service import AlertService
-from src.schemas.alert import AlertResponse, PatientAlertsResponse
+from src.schemas.alert import (
+    BulkAlertsRequest,
+    BulkAlertsResponse,
+    PatientAlertsResponse,
+)
 
 router = APIRouter(tags=["Alerts"])
 
@@ -22,27 +26,7 @@ async def get_patient_alerts(
 ):
     """Get all alerts for a patient."""
     alerts = await alert_service.get_patient_alerts(patient_id)
-    error_count, warning_count = await alert_service.count_alerts(patient_id)
-
-    return PatientAlertsResponse(
-        patient_id=patient_id,
-        alerts=[
-            AlertResponse(
-                type=a.type,
-                severity=a.severity,
-                message=a.message,
-                zone_id=a.zone_id,
-                zone_nom=a.zone_nom,
-                details=a.details,
-            )
-            for a in alerts
-        ],
-        has_alerts=len(alerts) > 0,
-        has_errors=error_count > 0,
-        has_warnings=warning_count > 0,
-        error_count=error_count,
-        warning_count=warning_count,
-    )
+    return PatientAlertsResponse.from_alerts(patient_id, alerts)
 
 
 @router.get(
@@ -57,28 +41,7 @@ async def get_zone_alerts(
 ):
     """Get alerts for a specific zone of a patient."""
     alerts = await alert_service.get_zone_alerts(patient_id, zone_id)
-    errors = sum(1 for a in alerts if a.is_error)
-    warnings = sum(1 for a in alerts if a.is_warning)
-
-    return PatientAlertsResponse(
-        patient_id=patient_id,
-        alerts=[
-            AlertResponse(
-                type=a.type,
-                severity=a.severity,
-                message=a.message,
-                zone_id=a.zone_id,
-                zone_nom=a.zone_nom,
-                details=a.details,
-            )
-            for a in alerts
-        ],
-        has_alerts=len(alerts) > 0,
-        has_errors=errors > 0,
-        has_warnings=warnings > 0,
-        error_count=errors,
-        warning_count=warnings,
-    )
+    return PatientAlertsResponse.from_alerts(patient_id, alerts)
 
 
 @router.get("/patients/{patient_id}/alerts/summary")
@@ -88,14 +51,28 @@ async def get_alerts_summary(
     alert_service: Annotated[AlertService, Depends(get_alert_service)],
 ):
     """Get a summary of alerts for a patient (counts only)."""
-    has_alerts = await alert_service.has_alerts(patient_id)
-    has_errors = await alert_service.has_errors(patient_id)
-    error_count, warning_count = await alert_service.count_alerts(patient_id)
+    summary = await alert_service.get_alert_summary(patient_id)
 
     return {
         "patient_id": patient_id,
-        "has_alerts": has_alerts,
-        "has_errors": has_errors,
-        "error_count": error_count,
-        "warning_count": warning_count,
+        "has_alerts": summary.has_alerts,
+        "has_errors": summary.has_errors,
+        "error_count": summary.error_count,
+        "warning_count": summary.warning_count,
     }
+
+
+@router.post("/alerts/batch", response_model=BulkAlertsResponse)
+async def get_alerts_for_patients(
+    request: BulkAlertsRequest,
+    _: Annotated[dict, Depends(require_permission("patients.view"))],
+    alert_service: Annotated[AlertService, Depends(get_alert_service)],
+):
+    """Get alerts for many patients at once (e.g. today's schedule)."""
+    alerts_by_patient = await alert_service.get_alerts_for_patients(request.patient_ids)
+    return BulkAlertsResponse(
+        patients={
+            patient_id: PatientAlertsResponse.from_alerts(patient_id, alerts)
+            for patient_id, alerts in alerts_by_patient.items()
+        }
+    )
@@ -4,7 +4,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from src.api.v1.dependencies import CurrentUser, get_box_service, require_permission
+from src.api.v1.dependencies import (
+    CurrentUser,
+    conditional_get,
+    get_box_service,
+    require_permission,
+)
 from src.application.services.box_service import BoxService
 from src.domain.exceptions import BusinessRuleError, DuplicateError, NotFoundError
 from src.schemas.base import MessageResponse
@@ -35,6 +40,7 @@ def _box_response(data: dict) -> BoxResponse:
 @router.get("", response_model=BoxListResponse)
 async def list_boxes(
     current_user: Annotated[dict, Depends(require_permission("boxes.view"))],
+    _etag: Annotated[str, Depends(conditional_get("boxes", "box_assignments", "users"))],
     box_service: Annotated[BoxService, Depends(get_box_service)],
 ):
     """List all boxes with occupancy info."""
@@ -1,32 +1,50 @@
 """Document generation, QR code, temp photo, and patient document endpoints."""
 
-import io
+import datetime as dt
 import os
-import time
-from typing import Annotated
+import zipfile
+from typing import Annotated, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.api.v1.dependencies import CurrentUser, DbSession, get_patient_service, require_permission
 from src.application.services.patient_service import PatientService
-from src.application.services.pdf_service import PDFService
-from src.application.services.qr_service import QRService
+from src.application.services.qr_service import QR_MEDIA_TYPES, qr_codes
 from src.core.config import get_settings
-from src.application.services.pdf_service import DEFAULT_TEMPLATES
-from src.domain.exceptions import PatientNotFoundError
+from src.core.responses import file_response
+from src.application.services.pdf_service import DEFAULT_TEMPLATES, pdf_renderer
+from src.domain.exceptions import FileTooLargeError, PatientNotFoundError
 from src.infrastructure.database.models import DocumentTemplateModel, PatientDocumentModel
+from src.infrastructure.cache import reference_catalog
+from src.infrastructure.database.repositories import (
+    BlobReferenceRepository,
+    DocumentTemplateRepository,
+    PatientDocumentRepository,
+    PatientRepository,
+    ScheduleRepository,
+)
+from src.infrastructure.storage import blob_store, temp_photos
+from src.schemas.patient import PatientDocumentResponse
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 settings = get_settings()
 
-TEMP_PHOTOS_DIR = os.path.join(settings.photos_path, "temp-photos")
-PATIENT_DOCS_DIR = os.path.join(settings.photos_path, "patient-documents")
 
 ALLOWED_CONTENT_TYPES = {
     "image/jpeg",
@@ -37,6 +55,20 @@ ALLOWED_CONTENT_TYPES = {
 }
 
 
+# Download file name prefix of each generated document type
+DOCUMENT_FILE_PREFIXES = {
+    "consent": "consentement",
+    "rules": "reglement",
+    "precautions": "precautions",
+}
+
+# Upper bound on the patients of one batch request
+MAX_BATCH_PATIENTS = 200
+
+# Upper bound on the cards of one QR card sheet
+MAX_SHEET_CARDS = 500
+
+
 def _patient_to_dict(patient) -> dict:
     """Convert a Patient entity to a dict for PDF generation."""
     return {
@@ -47,24 +79,23 @@ def _patient_to_dict(patient) -> dict:
 
 
 async def _get_template_content(db: AsyncSession, document_type: str) -> dict | None:
-    """Load custom template from DB, or return None for defaults."""
-    result = await db.execute(
-        select(DocumentTemplateModel).where(
-            DocumentTemplateModel.document_type == document_type
-        )
-    )
-    tpl = result.scalar_one_or_none()
-    return tpl.content if tpl else None
+    """Load custom template (cached in memory), or return None for defaults."""
+    templates = await reference_catalog.document_templates(DocumentTemplateRepository(db))
+    template = templates.get(document_type)
+    return template.content if template else None
 
 
-@router.get("/patients/{patient_id}/documents/consent")
-async def get_consent_form(
+def _document_filename(document_type: str, patient) -> str:
+    return f"{DOCUMENT_FILE_PREFIXES[document_type]}_{patient.code_carte}.pdf"
+
+
+async def _document_response(
+    db: AsyncSession,
+    patient_service: PatientService,
     patient_id: str,
-    _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
-    db: DbSession,
-    patient_service: Annotated[PatientService, Depends(get_patient_service)],
-):
-    """Generate and return the consent form PDF for a patient."""
+    document_type: str,
+) -> Response:
+    """Render (or reuse) a patient's PDF document."""
     try:
         patient = await patient_service.get_patient(patient_id)
     except PatientNotFoundError:
@@ -73,19 +104,33 @@ async def get_consent_form(
             detail="Patient non trouve",
         )
 
-    template_content = await _get_template_content(db, "consent")
-    pdf_service = PDFService()
-    pdf_bytes = pdf_service.generate_consent_form(_patient_to_dict(patient), template_content)
+    template_content = await _get_template_content(db, document_type)
+    pdf_bytes = await pdf_renderer.render(
+        document_type, _patient_to_dict(patient), template_content
+    )
 
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    return Response(
+        pdf_bytes,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": (f'inline; filename="consentement_{patient.code_carte}.pdf"')
+            "Content-Disposition": (
+                f'inline; filename="{_document_filename(document_type, patient)}"'
+            )
         },
     )
 
 
+@router.get("/patients/{patient_id}/documents/consent")
+async def get_consent_form(
+    patient_id: str,
+    _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
+    db: DbSession,
+    patient_service: Annotated[PatientService, Depends(get_patient_service)],
+):
+    """Generate and return the consent form PDF for a patient."""
+    return await _document_response(db, patient_service, patient_id, "consent")
+
+
 @router.get("/patients/{patient_id}/documents/rules")
 async def get_clinic_rules(
     patient_id: str,
@@ -94,23 +139,7 @@ async def get_clinic_rules(
     patient_service: Annotated[PatientService, Depends(get_patient_service)],
 ):
     """Generate and return the clinic rules PDF for a patient."""
-    try:
-        patient = await patient_service.get_patient(patient_id)
-    except PatientNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient non trouve",
-        )
-
-    template_content = await _get_template_content(db, "rules")
-    pdf_service = PDFService()
-    pdf_bytes = pdf_service.generate_clinic_rules(_patient_to_dict(patient), template_content)
-
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
-        media_type="application/pdf",
-        headers={"Content-Disposition": (f'inline; filename="reglement_{patient.code_carte}.pdf"')},
-    )
+    return await _document_response(db, patient_service, patient_id, "rules")
 
 
 @router.get("/patients/{patient_id}/documents/precautions")
@@ -121,24 +150,104 @@ async def get_precautions(
     patient_service: Annotated[PatientService, Depends(get_patient_service)],
 ):
     """Generate and return the treatment precautions PDF for a patient."""
-    try:
-        patient = await patient_service.get_patient(patient_id)
-    except PatientNotFoundError:
+    return await _document_response(db, patient_service, patient_id, "precautions")
+
+
+class DocumentBatchRequest(BaseModel):
+    date: dt.date | None = None
+    patient_ids: list[str] | None = Field(None, max_length=MAX_BATCH_PATIENTS)
+    document_types: list[Literal["consent", "rules", "precautions"]] = Field(
+        default=["consent", "precautions"], min_length=1
+    )
+    format: Literal["pdf", "zip"] = "zip"
+
+
+class _ZipStream:
+    """Write-only sink for ZipFile; ``pop`` hands over what was written so far."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+@router.post("/batch")
+async def generate_document_batch(
+    body: DocumentBatchRequest,
+    _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
+    db: DbSession,
+):
+    """Generate documents for a day's scheduled patients or a list of patients.
+
+    By default returns a ZIP, rendered in parallel and streamed as documents
+    finish. ``format="pdf"`` returns one merged PDF instead, rendered
+    serially in a single worker and sent once complete.
+    """
+    if (body.date is None) == (body.patient_ids is None):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient non trouve",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Indiquez une date ou une liste de patients",
         )
 
-    template_content = await _get_template_content(db, "precautions")
-    pdf_service = PDFService()
-    pdf_bytes = pdf_service.generate_precautions(_patient_to_dict(patient), template_content)
+    if body.date is not None:
+        entries = await ScheduleRepository(db).find_by_date(body.date)
+        patient_ids = [e.patient_id for e in entries if e.patient_id]
+        label = body.date.isoformat()
+    else:
+        patient_ids = body.patient_ids or []
+        label = "selection"
+    patient_ids = list(dict.fromkeys(patient_ids))
+    if len(patient_ids) > MAX_BATCH_PATIENTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Trop de patients pour un lot (max {MAX_BATCH_PATIENTS})",
+        )
+    patients = await PatientRepository(db).find_by_ids(patient_ids)
+    if not patients:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aucun patient trouve")
+
+    templates = {t: await _get_template_content(db, t) for t in body.document_types}
+    documents = [
+        (document_type, _patient_to_dict(patient), templates[document_type])
+        for patient in patients
+        for document_type in body.document_types
+    ]
+
+    if body.format == "pdf":
+        pdf_bytes = await pdf_renderer.render_combined(documents)
+        return Response(
+            pdf_bytes,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'inline; filename="documents_{label}.pdf"'},
+        )
+
+    names = [
+        _document_filename(document_type, patient)
+        for patient in patients
+        for document_type in body.document_types
+    ]
+
+    async def zip_stream():
+        sink = _ZipStream()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+            async for index, pdf_bytes in pdf_renderer.render_as_completed(documents):
+                archive.writestr(names[index], pdf_bytes)
+                yield sink.pop()
+        yield sink.pop()
 
     return StreamingResponse(
-        io.BytesIO(pdf_bytes),
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": (f'inline; filename="precautions_{patient.code_carte}.pdf"')
-        },
+        zip_stream(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="documents_{label}.zip"'},
     )
 
 
@@ -147,8 +256,10 @@ async def get_patient_qr_code(
     patient_id: str,
     _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
     patient_service: Annotated[PatientService, Depends(get_patient_service)],
+    size: Annotated[int, Query(ge=1, le=40)] = 10,
+    format: Literal["png", "svg"] = "png",
 ):
-    """Generate and return a QR code PNG containing the patient's card code."""
+    """Return a QR code (PNG or SVG) containing the patient's card code."""
     try:
         patient = await patient_service.get_patient(patient_id)
     except PatientNotFoundError:
@@ -157,13 +268,53 @@ async def get_patient_qr_code(
             detail="Patient non trouve",
         )
 
-    qr_service = QRService()
-    qr_bytes = qr_service.generate_qr_code(patient.code_carte)
+    qr_bytes = await qr_codes.get(patient.code_carte, size, format)
 
-    return StreamingResponse(
-        io.BytesIO(qr_bytes),
-        media_type="image/png",
-        headers={"Content-Disposition": (f'inline; filename="qr_{patient.code_carte}.png"')},
+    return Response(
+        qr_bytes,
+        media_type=QR_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'inline; filename="qr_{patient.code_carte}.{format}"'
+        },
+    )
+
+
+class QRSheetRequest(BaseModel):
+    patient_ids: list[str] | None = Field(None, max_length=MAX_SHEET_CARDS)
+    code_prefix: str | None = Field(None, min_length=1, max_length=20)
+
+
+@router.post("/qr-codes/sheet")
+async def generate_qr_sheet(
+    body: QRSheetRequest,
+    _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
+    db: DbSession,
+):
+    """Printable A4 sheet of QR cards, for a list of patients or a card code prefix.
+
+    For example ``code_prefix="IMP"`` prints the cards of patients created
+    by a schedule import.
+    """
+    if (body.patient_ids is None) == (body.code_prefix is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Indiquez une liste de patients ou un prefixe de code",
+        )
+
+    repo = PatientRepository(db)
+    if body.patient_ids is not None:
+        patients = await repo.find_by_ids(list(dict.fromkeys(body.patient_ids)))
+    else:
+        patients = await repo.find_by_card_prefix(body.code_prefix, MAX_SHEET_CARDS)
+    if not patients:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aucun patient trouve")
+
+    cards = [(p.code_carte, f"{p.prenom} {p.nom}") for p in patients]
+    pdf_bytes = await pdf_renderer.render_card_sheet(cards)
+    return Response(
+        pdf_bytes,
+        media_type="application/pdf",
+        headers={"Content-Disposition": 'inline; filename="cartes_qr.pdf"'},
     )
 
 
@@ -268,6 +419,7 @@ async def update_template(
 
     await db.commit()
     await db.refresh(db_tpl)
+    await pdf_renderer.invalidate(document_type)
 
     return {
         "document_type": document_type,
@@ -300,51 +452,28 @@ async def reset_template(
     if db_tpl:
         await db.delete(db_tpl)
         await db.commit()
+        await pdf_renderer.invalidate(document_type)
 
 
 # --- Temp Photo endpoints ---
 
 
-def _cleanup_old_temp_photos(max_age_hours: int = 24) -> None:
-    """Remove temp photos older than max_age_hours."""
-    if not os.path.exists(TEMP_PHOTOS_DIR):
-        return
-    cutoff = time.time() - (max_age_hours * 3600)
-    for filename in os.listdir(TEMP_PHOTOS_DIR):
-        filepath = os.path.join(TEMP_PHOTOS_DIR, filename)
-        try:
-            if os.path.getmtime(filepath) < cutoff:
-                os.remove(filepath)
-        except OSError:
-            pass
-
-
 @router.post("/temp-photo", status_code=status.HTTP_201_CREATED)
 async def upload_temp_photo(
     _current_user: Annotated[dict, Depends(require_permission("documents.manage"))],
     photo: UploadFile = File(...),
 ):
     """Upload a temporary photo. Returns ID and URL for retrieval."""
-    # Cleanup old photos opportunistically
-    _cleanup_old_temp_photos()
-
-    os.makedirs(TEMP_PHOTOS_DIR, exist_ok=True)
-
-    photo_id = uuid4().hex
     ext = os.path.splitext(photo.filename or "photo.jpg")[1] or ".jpg"
-    filename = f"{photo_id}{ext}"
-    filepath = os.path.join(TEMP_PHOTOS_DIR, filename)
 
-    content = await photo.read()
-    if len(content) > settings.max_photo_size_mb * 1024 * 1024:
+    try:
+        photo_id = await temp_photos.create(photo, ext, max_size_mb=settings.max_photo_size_mb)
+    except FileTooLargeError as e:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Photo trop volumineuse (max {settings.max_photo_size_mb}MB)",
+            detail=f"Photo trop volumineuse (max {e.max_size_mb}MB)",
         )
 
-    with open(filepath, "wb") as f:
-        f.write(content)
-
     return {
         "id": photo_id,
         "url": f"/api/v1/documents/temp-photo/{photo_id}",
@@ -354,18 +483,14 @@ async def upload_temp_photo(
 @router.get("/temp-photo/{photo_id}")
 async def get_temp_photo(
     photo_id: str,
+    request: Request,
     _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
 ):
     """Serve a temporary photo by ID."""
-    if not os.path.exists(TEMP_PHOTOS_DIR):
+    filepath = temp_photos.resolve(photo_id)
+    if filepath is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo non trouvee")
-
-    # Find file matching the ID (any extension)
-    for filename in os.listdir(TEMP_PHOTOS_DIR):
-        if filename.startswith(photo_id):
-            return FileResponse(os.path.join(TEMP_PHOTOS_DIR, filename))
-
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Photo non trouvee")
+    return file_response(request, filepath, etag=blob_store.digest(filepath))
 
 
 @router.delete("/temp-photo/{photo_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -374,13 +499,7 @@ async def delete_temp_photo(
     _current_user: Annotated[dict, Depends(require_permission("documents.manage"))],
 ):
     """Delete a temporary photo."""
-    if not os.path.exists(TEMP_PHOTOS_DIR):
-        return
-
-    for filename in os.listdir(TEMP_PHOTOS_DIR):
-        if filename.startswith(photo_id):
-            os.remove(os.path.join(TEMP_PHOTOS_DIR, filename))
-            return
+    await temp_photos.discard(photo_id)
 
 
 # --- Patient document uploads (photos/scans of old passage sheets) ---
@@ -408,33 +527,29 @@ async def upload_patient_document(
             detail="Type de fichier non autorise. Types acceptes: JPEG, PNG, WebP, HEIC, PDF",
         )
 
-    content = await file.read()
-    if len(content) > settings.max_photo_size_mb * 1024 * 1024:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Fichier trop volumineux (max {settings.max_photo_size_mb}MB)",
-        )
-
-    # Store file on disk
-    patient_dir = os.path.join(PATIENT_DOCS_DIR, patient_id)
-    os.makedirs(patient_dir, exist_ok=True)
-
+    # Store file on disk, once per distinct content
     doc_id = str(uuid4())
     ext = os.path.splitext(file.filename or "file")[1] or ".bin"
     stored_filename = f"{doc_id}{ext}"
-    filepath = os.path.join(patient_dir, stored_filename)
 
-    with open(filepath, "wb") as f:
-        f.write(content)
+    try:
+        stored = await blob_store.put(file, ext, max_size_mb=settings.max_photo_size_mb)
+        blob_store.hold(db, stored)
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
 
     # Save metadata to DB
     doc = PatientDocumentModel(
         id=doc_id,
         patient_id=patient_id,
         filename=file.filename or stored_filename,
-        filepath=filepath,
+        filepath=stored.path,
+        content_hash=stored.sha256,
         content_type=content_type,
-        size_bytes=len(content),
+        size_bytes=stored.size,
         description=description,
     )
     db.add(doc)
@@ -458,24 +573,10 @@ async def list_patient_documents(
     db: DbSession,
 ):
     """List all uploaded documents for a patient."""
-    result = await db.execute(
-        select(PatientDocumentModel)
-        .where(PatientDocumentModel.patient_id == patient_id)
-        .order_by(PatientDocumentModel.created_at.desc())
-    )
-    docs = result.scalars().all()
+    docs = await PatientDocumentRepository(db).find_by_patient(patient_id)
     return {
         "documents": [
-            {
-                "id": d.id,
-                "filename": d.filename,
-                "content_type": d.content_type,
-                "size_bytes": d.size_bytes,
-                "description": d.description,
-                "url": f"/api/v1/documents/uploads/{d.id}/file",
-                "created_at": d.created_at.isoformat(),
-            }
-            for d in docs
+            PatientDocumentResponse.from_entity(d).model_dump(mode="json") for d in docs
         ],
         "total": len(docs),
     }
@@ -484,6 +585,7 @@ async def list_patient_documents(
 @router.get("/uploads/{doc_id}/file")
 async def serve_patient_document(
     doc_id: str,
+    request: Request,
     _current_user: Annotated[dict, Depends(require_permission("documents.view"))],
     db: DbSession,
 ):
@@ -498,8 +600,11 @@ async def serve_patient_document(
     if not os.path.exists(doc.filepath):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fichier non trouve")
 
-    return FileResponse(
+    # Documents are never modified, so their URL always names the same content
+    return file_response(
+        request,
         doc.filepath,
+        etag=doc.content_hash,
         media_type=doc.content_type,
         filename=doc.filename,
     )
@@ -519,9 +624,8 @@ async def delete_patient_document(
     if not doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document non trouve")
 
-    # Remove file from disk
-    if os.path.exists(doc.filepath):
-        os.remove(doc.filepath)
-
     await db.delete(doc)
     await db.commit()
+
+    # Remove the file from disk unless another photo or document shares it
+    await blob_store.release(doc.filepath, BlobReferenceRepository(db).count)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends
 
 from src.api.v1.dependencies import (
     CurrentUser,
+    conditional_get,
     get_pack_service,
     get_subscription_service,
     require_permission,
@@ -46,6 +47,7 @@ def _pack_response(p: Pack) -> PackResponse:
 @router.get("", response_model=PackListResponse)
 async def list_packs(
     current_user: Annotated[dict, Depends(require_permission("sessions.view"))],
+    _etag: Annotated[str, Depends(conditional_get("packs"))],
     pack_service: Annotated[PackService, Depends(get_pack_service)],
     include_inactive: bool = False,
 ):
@@ -10,9 +10,18 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 
-from src.api.v1.dependencies import CurrentUser, get_db, get_paiement_service, require_permission
+from src.api.v1.dependencies import (
+    CurrentUser,
+    conditional_get,
+    get_db,
+    get_paiement_service,
+    get_payment_method_repository,
+    require_permission,
+)
 from src.application.services.paiement_service import PaiementService
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.database.models import PaymentMethodModel
+from src.infrastructure.database.repositories import PaymentMethodRepository
 from src.schemas.paiement import (
     PaiementCreate,
     PaiementListResponse,
@@ -156,13 +165,11 @@ async def get_revenue_stats(
 @router.get("/methods", response_model=list[PaymentMethodResponse])
 async def list_payment_methods(
     current_user: Annotated[dict, Depends(require_permission("payments.view"))],
-    session=Depends(get_db),
+    _etag: Annotated[str, Depends(conditional_get("payment_methods"))],
+    method_repo: Annotated[PaymentMethodRepository, Depends(get_payment_method_repository)],
 ):
     """List all payment methods (active only by default)."""
-    result = await session.execute(
-        select(PaymentMethodModel).order_by(PaymentMethodModel.ordre, PaymentMethodModel.nom)
-    )
-    methods = result.scalars().all()
+    methods = (await reference_catalog.payment_methods(method_repo)).values()
     return [
         PaymentMethodResponse(
             id=m.id, nom=m.nom, is_active=m.is_active, ordre=m.ordre,
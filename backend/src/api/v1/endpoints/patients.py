@@ -9,11 +9,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from src.api.v1.dependencies import (
+    get_patient_overview_service,
     get_patient_service,
     get_patient_zone_service,
+    permitted_sections,
     require_permission,
 )
 from src.application.services import PatientService, PatientZoneService
+from src.application.services.patient_overview_service import PatientOverviewService
 from src.domain.entities.patient import Patient
 from src.domain.exceptions import (
     DuplicateCardCodeError,
@@ -21,14 +24,22 @@ from src.domain.exceptions import (
     PatientNotFoundError,
     ZoneNotFoundError,
 )
+from src.schemas.alert import PatientAlertsResponse
 from src.schemas.base import MessageResponse
+from src.schemas.pack import PatientSubscriptionResponse
+from src.schemas.paiement import PaiementResponse
 from src.schemas.patient import (
     PatientCreate,
     PatientDetailResponse,
+    PatientDocumentResponse,
     PatientListResponse,
+    PatientOverviewResponse,
     PatientResponse,
     PatientUpdate,
 )
+from src.schemas.pre_consultation import PreConsultationResponse
+from src.schemas.schedule import AbsenceRecordResponse
+from src.schemas.session import SessionResponse
 from src.schemas.zone import (
     PatientZoneCreate,
     PatientZoneListResponse,
@@ -38,6 +49,18 @@ from src.schemas.zone import (
 
 router = APIRouter(prefix="/patients", tags=["Patients"])
 
+# Sections of the patient overview and the permission each one requires
+OVERVIEW_PERMISSIONS = {
+    "zones": "patients.view",
+    "sessions": "sessions.view",
+    "pre_consultation": "pre_consultations.view",
+    "alerts": "patients.view",
+    "subscriptions": "patients.view",
+    "payments": "payments.view",
+    "absences": "schedule.view",
+    "documents": "documents.view",
+}
+
 
 def _patient_response(p: "Patient") -> PatientResponse:
     """Build PatientResponse from Patient entity."""
@@ -210,6 +233,58 @@ async def get_patient(
         )
 
 
+@router.get("/{patient_id}/overview", response_model=PatientOverviewResponse)
+async def get_patient_overview(
+    patient_id: str,
+    current_user: Annotated[dict, Depends(require_permission("patients.view"))],
+    patient_service: Annotated[PatientService, Depends(get_patient_service)],
+    overview_service: Annotated[PatientOverviewService, Depends(get_patient_overview_service)],
+    fields: str | None = Query(
+        None, description="Sections à inclure, séparées par des virgules (toutes par défaut)"
+    ),
+):
+    """Get the patient detail screen (zones, sessions, alerts, payments...) in one call.
+
+    Without ``fields``, every section the user is allowed to see is returned.
+    """
+    sections = permitted_sections(
+        fields, OVERVIEW_PERMISSIONS, current_user, implicit=("patient",)
+    )
+
+    try:
+        patient = await patient_service.get_patient(patient_id)
+    except PatientNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+    data = await overview_service.get_overview(patient_id, sections)
+    response = PatientOverviewResponse(patient=_patient_response(patient))
+    if "zones" in data:
+        response.zones = [PatientZoneResponse.from_entity(z) for z in data["zones"]]
+    if "sessions" in data:
+        sessions, response.sessions_total = data["sessions"]
+        response.sessions = [SessionResponse.from_entity(s) for s in sessions]
+    if data.get("pre_consultation"):
+        response.pre_consultation = PreConsultationResponse.model_validate(
+            data["pre_consultation"]
+        )
+    if "alerts" in data:
+        response.alerts = PatientAlertsResponse.from_alerts(patient_id, data["alerts"])
+    if "subscriptions" in data:
+        response.subscriptions = [
+            PatientSubscriptionResponse.model_validate(sub) for sub in data["subscriptions"]
+        ]
+    if "payments" in data:
+        response.payments = [PaiementResponse.model_validate(p) for p in data["payments"]]
+    if "absences" in data:
+        response.absences = [AbsenceRecordResponse.model_validate(a) for a in data["absences"]]
+    if "documents" in data:
+        response.documents = [PatientDocumentResponse.from_entity(d) for d in data["documents"]]
+    return response
+
+
 @router.put("/{patient_id}", response_model=PatientResponse)
 async def update_patient(
     patient_id: str,
@@ -16,6 +16,7 @@ from src.api.v1.dependencies import (
 )
 from src.application.services.pre_consultation_service import PreConsultationService
 from src.application.services.question_service import QuestionnaireService
+from src.core.responses import PydanticResponse
 from src.domain.exceptions import NotFoundError, ValidationError
 from src.schemas.base import MessageResponse
 from src.schemas.pre_consultation import (
@@ -55,7 +56,7 @@ async def list_pre_consultations(
         search=search,
     )
 
-    return PreConsultationPaginatedResponse(
+    return PydanticResponse(PreConsultationPaginatedResponse(
         items=[
             PreConsultationListResponse(
                 id=pc.id,
@@ -80,7 +81,7 @@ async def list_pre_consultations(
         page=page,
         page_size=size,
         total_pages=math.ceil(total / size) if total > 0 else 0,
-    )
+    ))
 
 
 @router.get("/export")
@@ -2,15 +2,23 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
-from src.api.v1.dependencies import CurrentUser, get_promotion_service, require_permission
+from src.api.v1.dependencies import (
+    CurrentUser,
+    conditional_get,
+    get_promotion_service,
+    require_permission,
+)
 from src.application.services.promotion_service import PromotionService
+from src.domain.exceptions import ZoneNotFoundError
 from src.schemas.promotion import (
     PromotionCreate,
     PromotionListResponse,
     PromotionResponse,
     PromotionUpdate,
+    QuoteRequest,
+    QuoteResponse,
     ZonePriceResponse,
 )
 
@@ -36,6 +44,7 @@ def _to_response(p) -> PromotionResponse:
 @router.get("", response_model=PromotionListResponse)
 async def list_promotions(
     current_user: Annotated[dict, Depends(require_permission("sessions.view"))],
+    _etag: Annotated[str, Depends(conditional_get("promotions", daily=True))],
     promotion_service: Annotated[PromotionService, Depends(get_promotion_service)],
     include_inactive: bool = False,
 ):
@@ -46,6 +55,7 @@ async def list_promotions(
 @router.get("/active", response_model=PromotionListResponse)
 async def list_active_promotions(
     current_user: Annotated[dict, Depends(require_permission("sessions.view"))],
+    _etag: Annotated[str, Depends(conditional_get("promotions", daily=True))],
     promotion_service: Annotated[PromotionService, Depends(get_promotion_service)],
 ):
     promos = await promotion_service.get_active_promotions()
@@ -100,3 +110,16 @@ async def get_zone_price(
     promotion_service: Annotated[PromotionService, Depends(get_promotion_service)],
 ):
     return await promotion_service.get_zone_price(zone_id, original_price)
+
+
+@router.post("/quote", response_model=QuoteResponse)
+async def quote(
+    data: QuoteRequest,
+    current_user: Annotated[dict, Depends(require_permission("sessions.view"))],
+    promotion_service: Annotated[PromotionService, Depends(get_promotion_service)],
+):
+    """Price a cart of zones with promotions applied, plus the packs covering it."""
+    try:
+        return await promotion_service.quote(data.zone_ids, data.prices)
+    except ZoneNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
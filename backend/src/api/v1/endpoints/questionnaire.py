@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from src.api.v1.dependencies import get_question_service, require_permission
+from src.api.v1.dependencies import conditional_get, get_question_service, require_permission
 from src.application.services import QuestionService
 from src.domain.exceptions import QuestionNotFoundError
 from src.schemas.base import MessageResponse
@@ -22,6 +22,7 @@ router = APIRouter(prefix="/questionnaire", tags=["Questionnaire"])
 @router.get("/questions", response_model=QuestionListResponse)
 async def list_questions(
     _: Annotated[dict, Depends(require_permission("patients.questionnaire.view"))],
+    _etag: Annotated[str, Depends(conditional_get("questions"))],
     question_service: Annotated[QuestionService, Depends(get_question_service)],
     include_inactive: bool = Query(False, description="Inclure les questions inactives"),
 ):
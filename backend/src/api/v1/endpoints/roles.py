@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from src.api.v1.dependencies import get_role_service, require_permission
+from src.api.v1.dependencies import conditional_get, get_role_service, require_permission
 from src.application.services import RoleService
 from src.domain.entities.role import Permission
 from src.domain.exceptions import RoleInUseError, RoleNotFoundError, SystemRoleError
@@ -24,6 +24,7 @@ router = APIRouter(prefix="/roles", tags=["Rôles"])
 @router.get("", response_model=RoleListResponse)
 async def list_roles(
     _: Annotated[dict, Depends(require_permission("roles.view"))],
+    _etag: Annotated[str, Depends(conditional_get("roles"))],
     role_service: Annotated[RoleService, Depends(get_role_service)],
 ):
     """List all roles."""
@@ -9,11 +9,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from fastapi.responses import StreamingResponse
-from sse_starlette.sse import EventSourceResponse
 
 from src.api.v1.dependencies import CurrentUser, get_schedule_service, require_permission
 from src.application.services.schedule_service import ScheduleService
+from src.core.responses import PydanticResponse
 from src.domain.exceptions import NotFoundError
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.events import event_bus
 from src.schemas.schedule import (
     AbsenceListResponse,
@@ -34,54 +35,6 @@ from src.schemas.schedule import (
 router = APIRouter(prefix="/schedule", tags=["schedule"])
 
 
-def _schedule_response(e, zone_warnings: list[str] | None = None) -> ScheduleEntryResponse:
-    return ScheduleEntryResponse(
-        id=e.id,
-        date=e.date,
-        patient_nom=e.patient_nom,
-        patient_prenom=e.patient_prenom,
-        patient_id=e.patient_id,
-        patient_telephone=e.patient_telephone,
-        doctor_name=e.doctor_name,
-        doctor_id=e.doctor_id,
-        specialite=e.specialite,
-        duration_type=e.duration_type,
-        start_time=e.start_time,
-        end_time=e.end_time,
-        notes=e.notes,
-        zone_ids=e.zone_ids or [],
-        status=e.status,
-        created_at=e.created_at,
-        zone_warnings=zone_warnings or [],
-    )
-
-
-def _queue_response(
-    e,
-    zone_names: list[str] | None = None,
-    patient_code_carte: str | None = None,
-    patient_telephone: str | None = None,
-) -> QueueEntryResponse:
-    return QueueEntryResponse(
-        id=e.id,
-        schedule_id=e.schedule_id,
-        patient_id=e.patient_id,
-        patient_name=e.patient_name,
-        doctor_id=e.doctor_id,
-        doctor_name=e.doctor_name,
-        box_id=e.box_id,
-        box_nom=e.box_nom,
-        checked_in_at=e.checked_in_at,
-        position=e.position,
-        status=e.status,
-        called_at=e.called_at,
-        completed_at=e.completed_at,
-        zone_names=zone_names or [],
-        patient_code_carte=patient_code_carte,
-        patient_telephone=patient_telephone,
-    )
-
-
 @router.post("/upload", response_model=ScheduleUploadResponse)
 async def upload_schedule(
     current_user: Annotated[dict, Depends(require_permission("schedule.manage"))],
@@ -110,12 +63,16 @@ async def upload_schedule(
         )
     entries = result["entries"]
     phone_conflicts = result.get("phone_conflicts", [])
-    target_date = entries[0].date if entries else None
     patients_created = result.get("patients_created", 0)
+    updated = result.get("entries_updated", 0)
+    deleted = result.get("entries_deleted", 0)
     return ScheduleUploadResponse(
-        message=f"{len(entries)} entrées créées",
+        message=f"{len(entries)} entrées créées, {updated} mises à jour, {deleted} supprimées",
         entries_created=len(entries),
-        date=target_date,
+        entries_updated=updated,
+        entries_deleted=deleted,
+        entries_preserved=result.get("entries_preserved", 0),
+        date=result.get("date"),
         phone_matched=result.get("phone_matched", 0),
         phone_conflicts=[PhoneConflict(**c) for c in phone_conflicts],
         skipped_rows=result.get("skipped_rows", 0),
@@ -134,11 +91,11 @@ async def get_today_schedule(
     if current_user.get("role") == "Praticien":
         doctor_id = current_user["id"]
         entries = [e for e in entries if e.doctor_id == doctor_id]
-    return ScheduleListResponse(
-        entries=[_schedule_response(e) for e in entries],
+    return PydanticResponse(ScheduleListResponse(
+        entries=[ScheduleEntryResponse.from_entity(e) for e in entries],
         date=date.today(),
         total=len(entries),
-    )
+    ))
 
 
 # Queue routes MUST be before /{target_date} to avoid path conflict
@@ -154,15 +111,7 @@ async def get_queue(
     entries = await schedule_service.get_queue(doctor_id)
     enriched = await schedule_service.enrich_queue_entries(entries)
     return QueueListResponse(
-        entries=[
-            _queue_response(
-                item["entry"],
-                zone_names=item.get("zone_names"),
-                patient_code_carte=item.get("patient_code_carte"),
-                patient_telephone=item.get("patient_telephone"),
-            )
-            for item in enriched
-        ],
+        entries=[QueueEntryResponse.from_enriched(item) for item in enriched],
         total=len(entries),
     )
 
@@ -173,7 +122,7 @@ async def get_display_queue(
 ):
     """Public display queue (no auth required)."""
     entries = await schedule_service.get_display_queue()
-    return QueueDisplayResponse(entries=[_queue_response(e) for e in entries])
+    return QueueDisplayResponse(entries=[QueueEntryResponse.from_entity(e) for e in entries])
 
 
 @router.put("/queue/{entry_id}/call", response_model=QueueEntryResponse, tags=["queue"])
@@ -183,7 +132,7 @@ async def call_patient(
     schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
 ):
     entry = await schedule_service.call_patient(entry_id, caller_user_id=current_user.get("id"))
-    return _queue_response(entry)
+    return QueueEntryResponse.from_entity(entry)
 
 
 @router.put("/queue/{entry_id}/complete", response_model=QueueEntryResponse, tags=["queue"])
@@ -193,7 +142,7 @@ async def complete_patient(
     schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
 ):
     entry = await schedule_service.complete_patient(entry_id)
-    return _queue_response(entry)
+    return QueueEntryResponse.from_entity(entry)
 
 
 @router.put("/queue/{entry_id}/no-show", response_model=QueueEntryResponse, tags=["queue"])
@@ -203,7 +152,7 @@ async def mark_no_show(
     schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
 ):
     entry = await schedule_service.mark_no_show(entry_id)
-    return _queue_response(entry)
+    return QueueEntryResponse.from_entity(entry)
 
 
 @router.put("/queue/{entry_id}/left", response_model=QueueEntryResponse, tags=["queue"])
@@ -213,7 +162,7 @@ async def mark_left(
     schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
 ):
     entry = await schedule_service.mark_left(entry_id)
-    return _queue_response(entry)
+    return QueueEntryResponse.from_entity(entry)
 
 
 @router.get("/queue/events", tags=["queue"])
@@ -221,6 +170,9 @@ async def queue_events(
     doctor_id: str | None = Query(None, min_length=36, max_length=36),
 ):
     """SSE endpoint for real-time queue notifications."""
+    # Imported here: sse_starlette is only needed once a screen subscribes
+    from sse_starlette.sse import EventSourceResponse
+
     channel = f"queue:{doctor_id}" if doctor_id else "queue:all"
     queue = event_bus.subscribe(channel)
 
@@ -265,7 +217,7 @@ async def create_manual_entry(
         notes=request.notes,
     )
     zone_warnings = getattr(entry, "_zone_warnings", [])
-    return _schedule_response(entry, zone_warnings=zone_warnings)
+    return ScheduleEntryResponse.from_entity(entry, zone_warnings=zone_warnings)
 
 
 @router.put("/queue/{entry_id}/reassign", response_model=QueueEntryResponse, tags=["queue"])
@@ -278,7 +230,7 @@ async def reassign_patient(
     """Reassign a waiting queue patient to a different doctor."""
     try:
         entry = await schedule_service.reassign_patient(entry_id, doctor_id)
-        return _queue_response(entry)
+        return QueueEntryResponse.from_entity(entry)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -322,11 +274,7 @@ async def export_schedule_csv(
     # Resolve zone IDs to names
     zone_name_cache: dict[str, str] = {}
     if schedule_service.zone_def_repo:
-        for e in entries:
-            for zid in (e.zone_ids or []):
-                if zid not in zone_name_cache:
-                    zone = await schedule_service.zone_def_repo.find_by_id(zid)
-                    zone_name_cache[zid] = zone.nom if zone else zid
+        zone_name_cache = await reference_catalog.zone_names(schedule_service.zone_def_repo)
 
     output = io.StringIO()
     writer = csv.writer(output, delimiter=";")
@@ -394,7 +342,7 @@ async def update_schedule_entry(
             end_time=data.end_time,
             notes=data.notes,
         )
-        return _schedule_response(entry)
+        return ScheduleEntryResponse.from_entity(entry)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -427,7 +375,7 @@ async def mark_schedule_no_show(
     """Mark a schedule entry as no-show directly (without check-in)."""
     try:
         entry = await schedule_service.mark_schedule_no_show(entry_id)
-        return _schedule_response(entry)
+        return ScheduleEntryResponse.from_entity(entry)
     except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -443,11 +391,11 @@ async def get_schedule(
     schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
 ):
     entries = await schedule_service.get_schedule(target_date)
-    return ScheduleListResponse(
-        entries=[_schedule_response(e) for e in entries],
+    return PydanticResponse(ScheduleListResponse(
+        entries=[ScheduleEntryResponse.from_entity(e) for e in entries],
         date=target_date,
         total=len(entries),
-    )
+    ))
 
 
 @router.post("/{entry_id}/check-in", response_model=QueueEntryResponse | CheckInConflictResponse)
@@ -460,7 +408,7 @@ async def check_in_patient(
     # If conflict detected, return conflict response
     if isinstance(result, dict) and result.get("conflict"):
         return CheckInConflictResponse(**result)
-    return _queue_response(result)
+    return QueueEntryResponse.from_entity(result)
 
 
 @router.post("/resolve-conflict", response_model=QueueEntryResponse)
@@ -475,4 +423,4 @@ async def resolve_check_in_conflict(
         patient_id=request.patient_id,
         telephone=request.telephone,
     )
-    return _queue_response(entry)
+    return QueueEntryResponse.from_entity(entry)
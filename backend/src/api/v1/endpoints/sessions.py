@@ -8,23 +8,39 @@ import os
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from src.api.v1.dependencies import (
     CurrentUser,
+    DbSession,
+    conditional_get,
     get_patient_service,
     get_session_service,
     require_permission,
 )
 from src.application.services import PatientService, SessionService
 from src.core.config import get_settings
+from src.core.responses import PydanticResponse, file_response
 from src.domain.exceptions import (
+    FileTooLargeError,
     PatientNotFoundError,
     SessionNotFoundError,
     UserNotFoundError,
     ZoneNotFoundError,
 )
+from src.infrastructure.storage import blob_store, temp_photos
+from src.infrastructure.storage.images import PHOTO_VARIANTS, image_processor
 from src.schemas.session import (
     LaserTypeResponse,
     SessionDetailResponse,
@@ -52,40 +68,13 @@ async def list_patient_sessions(
             page=page,
             size=size,
         )
-        return SessionListResponse(
-            sessions=[
-                SessionResponse(
-                    id=s.id,
-                    patient_id=s.patient_id,
-                    patient_zone_id=s.patient_zone_id,
-                    zone_nom=s.zone_nom,
-                    praticien_id=s.praticien_id,
-                    praticien_nom=s.praticien_nom,
-                    patient_nom=s.patient_nom,
-                    patient_prenom=s.patient_prenom,
-                    date_seance=s.date_seance,
-                    type_laser=s.type_laser,
-                    parametres=s.parametres,
-                    notes=s.notes,
-                    duree_minutes=s.duree_minutes,
-                    photos=[
-                        SessionPhotoResponse(
-                            id=p.id,
-                            filename=p.filename,
-                            url=session_service.get_photo_url(p),
-                            created_at=p.created_at,
-                        )
-                        for p in s.photos
-                    ],
-                    created_at=s.created_at,
-                )
-                for s in sessions
-            ],
+        return PydanticResponse(SessionListResponse(
+            sessions=[SessionResponse.from_entity(s) for s in sessions],
             total=total,
             page=page,
             size=size,
             pages=math.ceil(total / size) if total > 0 else 0,
-        )
+        ))
     except PatientNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,6 +92,7 @@ async def create_session(
     current_user: CurrentUser,
     _: Annotated[dict, Depends(require_permission("sessions.create"))],
     session_service: Annotated[SessionService, Depends(get_session_service)],
+    db: DbSession,
     patient_zone_id: str = Form(...),
     type_laser: str = Form(...),
     parametres: str = Form("{}"),  # JSON string
@@ -135,22 +125,18 @@ async def create_session(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Format JSON invalide pour les IDs de photos",
                 )
-            temp_dir = os.path.join(settings.photos_path, "temp-photos")
             for temp_id in temp_ids:
-                if os.path.exists(temp_dir):
-                    for fname in os.listdir(temp_dir):
-                        if fname.startswith(temp_id):
-                            fpath = os.path.join(temp_dir, fname)
-                            with open(fpath, "rb") as f:
-                                photo_files.append((fname, f.read()))
-                            os.remove(fpath)  # Clean up temp file
-                            break
-
-        # Handle direct photo uploads (legacy)
+                # Attach the stored blob itself: no copy is made. The temp
+                # photo is only removed once the new session is committed.
+                stored = await temp_photos.claim(db, temp_id)
+                if stored is not None:
+                    ext = os.path.splitext(stored.path)[1]
+                    photo_files.append((f"{temp_id}{ext}", stored))
+
+        # Handle direct photo uploads (legacy), streamed to disk by the service
         for photo in photos:
             if photo.filename:
-                content = await photo.read()
-                photo_files.append((photo.filename, content))
+                photo_files.append((photo.filename, photo))
 
         session = await session_service.create_session(
             patient_id=patient_id,
@@ -164,31 +150,7 @@ async def create_session(
             photo_files=photo_files if photo_files else None,
         )
 
-        return SessionResponse(
-            id=session.id,
-            patient_id=session.patient_id,
-            patient_zone_id=session.patient_zone_id,
-            zone_nom=session.zone_nom,
-            praticien_id=session.praticien_id,
-            praticien_nom=session.praticien_nom,
-            patient_nom=session.patient_nom,
-            patient_prenom=session.patient_prenom,
-            date_seance=session.date_seance,
-            type_laser=session.type_laser,
-            parametres=session.parametres,
-            notes=session.notes,
-            duree_minutes=session.duree_minutes,
-            photos=[
-                SessionPhotoResponse(
-                    id=p.id,
-                    filename=p.filename,
-                    url=session_service.get_photo_url(p),
-                    created_at=p.created_at,
-                )
-                for p in session.photos
-            ],
-            created_at=session.created_at,
-        )
+        return SessionResponse.from_entity(session)
     except PatientNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -204,6 +166,11 @@ async def create_session(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Photo trop volumineuse (max {e.max_size_mb}MB)",
+        )
     except json.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -262,38 +229,13 @@ async def list_sessions(
         size=size,
         praticien_id=praticien_id,
     )
-    return SessionListResponse(
-        sessions=[
-            SessionResponse(
-                id=s.id,
-                patient_id=s.patient_id,
-                patient_zone_id=s.patient_zone_id,
-                zone_nom=s.zone_nom,
-                praticien_id=s.praticien_id,
-                praticien_nom=s.praticien_nom,
-                date_seance=s.date_seance,
-                type_laser=s.type_laser,
-                parametres=s.parametres,
-                notes=s.notes,
-                duree_minutes=s.duree_minutes,
-                photos=[
-                    SessionPhotoResponse(
-                        id=p.id,
-                        filename=p.filename,
-                        url=session_service.get_photo_url(p),
-                        created_at=p.created_at,
-                    )
-                    for p in s.photos
-                ],
-                created_at=s.created_at,
-            )
-            for s in sessions
-        ],
+    return PydanticResponse(SessionListResponse(
+        sessions=[SessionResponse.from_entity(s) for s in sessions],
         total=total,
         page=page,
         size=size,
         pages=math.ceil(total / size) if total > 0 else 0,
-    )
+    ))
 
 
 @router.get("/sessions/last-params")
@@ -316,6 +258,7 @@ async def get_last_session_params(
 @router.get("/sessions/laser-types", response_model=LaserTypeResponse)
 async def get_laser_types(
     _: Annotated[dict, Depends(require_permission("sessions.view"))],
+    _etag: Annotated[str, Depends(conditional_get())],
     session_service: Annotated[SessionService, Depends(get_session_service)],
 ):
     """Get available laser types."""
@@ -335,28 +278,8 @@ async def get_session(
         session = await session_service.get_session(session_id)
         patient = await patient_service.get_patient(session.patient_id)
 
-        return SessionDetailResponse(
-            id=session.id,
-            patient_id=session.patient_id,
-            patient_zone_id=session.patient_zone_id,
-            zone_nom=session.zone_nom,
-            praticien_id=session.praticien_id,
-            praticien_nom=session.praticien_nom,
-            date_seance=session.date_seance,
-            type_laser=session.type_laser,
-            parametres=session.parametres,
-            notes=session.notes,
-            duree_minutes=session.duree_minutes,
-            photos=[
-                SessionPhotoResponse(
-                    id=p.id,
-                    filename=p.filename,
-                    url=session_service.get_photo_url(p),
-                    created_at=p.created_at,
-                )
-                for p in session.photos
-            ],
-            created_at=session.created_at,
+        return SessionDetailResponse.from_entity(
+            session,
             patient_nom=patient.nom,
             patient_prenom=patient.prenom,
             patient_code_carte=patient.code_carte,
@@ -383,31 +306,7 @@ async def update_session_notes(
     """Update notes on an existing session."""
     try:
         session = await session_service.update_session_notes(session_id, notes)
-        return SessionResponse(
-            id=session.id,
-            patient_id=session.patient_id,
-            patient_zone_id=session.patient_zone_id,
-            zone_nom=session.zone_nom,
-            praticien_id=session.praticien_id,
-            praticien_nom=session.praticien_nom,
-            patient_nom=session.patient_nom,
-            patient_prenom=session.patient_prenom,
-            date_seance=session.date_seance,
-            type_laser=session.type_laser,
-            parametres=session.parametres,
-            notes=session.notes,
-            duree_minutes=session.duree_minutes,
-            photos=[
-                SessionPhotoResponse(
-                    id=p.id,
-                    filename=p.filename,
-                    url=session_service.get_photo_url(p),
-                    created_at=p.created_at,
-                )
-                for p in session.photos
-            ],
-            created_at=session.created_at,
-        )
+        return SessionResponse.from_entity(session)
     except SessionNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -429,36 +328,50 @@ async def add_session_photo(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Fichier photo requis",
             )
-        content = await photo.read()
         session_photo = await session_service.add_photo_to_session(
             session_id=session_id,
             filename=photo.filename,
-            file_data=content,
-        )
-        return SessionPhotoResponse(
-            id=session_photo.id,
-            filename=session_photo.filename,
-            url=session_service.get_photo_url(session_photo),
-            created_at=session_photo.created_at,
+            file_data=photo,
         )
+        return SessionPhotoResponse.from_entity(session_photo)
     except SessionNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except FileTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Photo trop volumineuse (max {e.max_size_mb}MB)",
+        )
 
 
 @router.get("/photos/{session_id}/{filename}")
 async def get_photo(
     session_id: str,
     filename: str,
+    request: Request,
     _: Annotated[dict, Depends(require_permission("sessions.view"))],
+    session_service: Annotated[SessionService, Depends(get_session_service)],
+    size: str | None = Query(None, description="Variante redimensionnée: thumb ou medium"),
 ):
-    """Serve a session photo."""
-    filepath = os.path.join(settings.photos_path, session_id, filename)
-    if not os.path.exists(filepath):
+    """Serve a session photo, or one of its resized variants."""
+    filepath = await session_service.get_photo_path(session_id, filename)
+    if filepath is None or not os.path.exists(filepath):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Photo non trouvée",
         )
-    return FileResponse(filepath)
+    # Photo URLs name the content hash, so the response is cacheable forever
+    etag = blob_store.digest(filepath)
+    if size is not None:
+        if size not in PHOTO_VARIANTS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Taille de photo invalide",
+            )
+        # Falls back to the original when it cannot be decoded (e.g. HEIC)
+        variant = await image_processor.ensure_variant(filepath, size)
+        if variant is not None:
+            return file_response(request, variant, etag=f"{etag}-{size}" if etag else None)
+    return file_response(request, filepath, etag=etag)
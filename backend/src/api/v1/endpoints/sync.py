@@ -0,0 +1,73 @@
+"""Delta sync endpoints."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.v1.dependencies import (
+    CurrentUser,
+    get_schedule_service,
+    get_sync_service,
+    permitted_sections,
+)
+from src.application.services.schedule_service import ScheduleService
+from src.application.services.sync_service import SyncService
+from src.domain.exceptions import SyncCursorExpiredError
+from src.schemas.paiement import PaiementResponse
+from src.schemas.patient import PatientResponse
+from src.schemas.schedule import QueueEntryResponse, ScheduleEntryResponse
+from src.schemas.session import SessionResponse
+from src.schemas.sync import SyncResponse
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+# Synced entities and the permission each one requires
+SYNC_PERMISSIONS = {
+    "patient": "patients.view",
+    "schedule": "schedule.view",
+    "queue": "queue.view",
+    "session": "sessions.view",
+    "payment": "payments.view",
+}
+
+
+@router.get("", response_model=SyncResponse)
+async def get_changes(
+    current_user: CurrentUser,
+    sync_service: Annotated[SyncService, Depends(get_sync_service)],
+    schedule_service: Annotated[ScheduleService, Depends(get_schedule_service)],
+    since: int | None = Query(
+        None, ge=0, description="Curseur de la dernière synchronisation (absent : curseur actuel)"
+    ),
+    entities: str | None = Query(
+        None, description="Entités à inclure, séparées par des virgules (toutes par défaut)"
+    ),
+):
+    """Get the patients, schedule, queue, sessions and payments changed since a cursor.
+
+    Without ``since``, only the current cursor is returned: take it before
+    loading the full lists, then poll with it. A 410 means the cursor is too
+    old (or unknown) and the lists must be reloaded in full.
+    """
+    names = permitted_sections(entities, SYNC_PERMISSIONS, current_user, label="Entités")
+
+    try:
+        result = await sync_service.get_changes(since, names)
+    except SyncCursorExpiredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=str(e),
+        )
+
+    changed = result["changed"]
+    queue = await schedule_service.enrich_queue_entries(changed.get("queue", []))
+    return SyncResponse(
+        cursor=result["cursor"],
+        has_more=result["has_more"],
+        patients=[PatientResponse.model_validate(p) for p in changed.get("patient", [])],
+        schedule=[ScheduleEntryResponse.from_entity(e) for e in changed.get("schedule", [])],
+        queue=[QueueEntryResponse.from_enriched(item) for item in queue],
+        sessions=[SessionResponse.from_entity(s) for s in changed.get("session", [])],
+        payments=[PaiementResponse.model_validate(p) for p in changed.get("payment", [])],
+        deleted=result["deleted"],
+    )
@@ -4,7 +4,11 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from src.api.v1.dependencies import get_zone_definition_service, require_permission
+from src.api.v1.dependencies import (
+    conditional_get,
+    get_zone_definition_service,
+    require_permission,
+)
 from src.application.services import ZoneDefinitionService
 from src.domain.exceptions import DuplicateZoneError, ZoneNotFoundError
 from src.schemas.base import MessageResponse
@@ -21,6 +25,7 @@ router = APIRouter(prefix="/zones", tags=["Zones"])
 @router.get("", response_model=ZoneDefinitionListResponse)
 async def list_zones(
     _: Annotated[dict, Depends(require_permission("zones.view"))],
+    _etag: Annotated[str, Depends(conditional_get("zone_definitions"))],
     zone_service: Annotated[ZoneDefinitionService, Depends(get_zone_definition_service)],
     include_inactive: bool = Query(False, description="Inclure les zones inactives"),
 ):
@@ -1,7 +1,5 @@
 """API v1 router."""
 
-from fastapi import APIRouter
-
 from src.api.v1.endpoints import (
     alerts,
     auth,
@@ -17,26 +15,32 @@ from src.api.v1.endpoints import (
     roles,
     schedule,
     sessions,
+    sync,
     users,
     zones,
 )
 
-router = APIRouter(prefix="/api/v1")
+API_PREFIX = "/api/v1"
 
-# Include all endpoint routers
-router.include_router(auth.router)
-router.include_router(users.router)
-router.include_router(roles.router)
-router.include_router(patients.router)
-router.include_router(zones.router)
-router.include_router(questionnaire.router)
-router.include_router(sessions.router)
-router.include_router(dashboard.router)
-router.include_router(pre_consultations.router)
-router.include_router(alerts.router)
-router.include_router(packs.router)
-router.include_router(paiements.router)
-router.include_router(promotions.router)
-router.include_router(schedule.router)
-router.include_router(boxes.router)
-router.include_router(documents.router)
+# Endpoint routers, included by the app under API_PREFIX. They are not
+# grouped under an intermediate APIRouter: each include_router call rebuilds
+# every route it copies, which adds up at startup.
+routers = [
+    auth.router,
+    users.router,
+    roles.router,
+    patients.router,
+    zones.router,
+    questionnaire.router,
+    sessions.router,
+    dashboard.router,
+    pre_consultations.router,
+    alerts.router,
+    packs.router,
+    paiements.router,
+    promotions.router,
+    schedule.router,
+    boxes.router,
+    documents.router,
+    sync.router,
+]
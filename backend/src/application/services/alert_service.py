@@ -1,9 +1,12 @@
 """Alert service for computing patient alerts."""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
-from src.domain.entities.alert import Alert
+from src.domain.entities.alert import Alert, AlertSummary
+from src.domain.entities.pre_consultation import PreConsultation
+from src.domain.entities.side_effect import SideEffect
 from src.infrastructure.database.repositories import (
+    PatientAlertStateRepository,
     PreConsultationRepository,
     SessionRepository,
 )
@@ -17,24 +20,94 @@ SESSION_SPACING_TOO_CLOSE_DAYS = 14  # Warn if < 14 days since last session on s
 
 
 class AlertService:
-    """Service for computing patient alerts."""
+    """Service for computing patient alerts.
+
+    Instances are created per request; computed alerts are memoized for the
+    lifetime of the instance.
+    """
 
     def __init__(
         self,
         pre_consultation_repo: PreConsultationRepository,
         session_repo: SessionRepository,
         side_effect_repo: SideEffectRepository,
+        alert_state_repo: PatientAlertStateRepository | None = None,
     ):
         self.pre_consultation_repo = pre_consultation_repo
         self.session_repo = session_repo
         self.side_effect_repo = side_effect_repo
+        self.alert_state_repo = alert_state_repo
+        self._alerts: dict[str, list[Alert]] = {}
+        self._summaries: dict[str, AlertSummary] = {}
 
     async def get_patient_alerts(self, patient_id: str) -> list[Alert]:
         """Get all alerts for a patient."""
+        if patient_id not in self._alerts:
+            pre_consultation = await self.pre_consultation_repo.find_by_patient_id(patient_id)
+            zones_last_session = await self._get_last_session_per_zone(patient_id)
+            side_effects = await self.side_effect_repo.find_by_patient(patient_id)
+            self._alerts[patient_id] = self._build_alerts(
+                pre_consultation, zones_last_session, side_effects
+            )
+        return self._alerts[patient_id]
+
+    async def get_alert_summary(self, patient_id: str) -> AlertSummary:
+        """Get alert counts, from the precomputed state when still valid."""
+        if patient_id in self._summaries:
+            return self._summaries[patient_id]
+
+        if self.alert_state_repo is None:
+            summary = AlertSummary.from_alerts(
+                patient_id, await self.get_patient_alerts(patient_id)
+            )
+        else:
+            today = datetime.now(UTC).date()
+            summary, version = await self.alert_state_repo.find_current(patient_id, today)
+            if summary is None:
+                summary = AlertSummary.from_alerts(
+                    patient_id, await self.get_patient_alerts(patient_id)
+                )
+                if version is not None:
+                    # Skipped by the repository if a source changed meanwhile
+                    await self.alert_state_repo.save(summary, today, version)
+        self._summaries[patient_id] = summary
+        return summary
+
+    async def get_alerts_for_patients(self, patient_ids: list[str]) -> dict[str, list[Alert]]:
+        """Get alerts for many patients with a constant number of queries."""
+        patient_ids = list(dict.fromkeys(patient_ids))
+        missing = [p for p in patient_ids if p not in self._alerts]
+        if missing:
+            self._alerts.update(await self._compute_alerts_for_patients(missing))
+        return {patient_id: self._alerts[patient_id] for patient_id in patient_ids}
+
+    async def _compute_alerts_for_patients(
+        self, patient_ids: list[str]
+    ) -> dict[str, list[Alert]]:
+        pre_consultations = await self.pre_consultation_repo.find_latest_by_patient_ids(
+            patient_ids
+        )
+        last_sessions = await self.session_repo.find_last_dates_per_zone(patient_ids)
+        side_effects = await self.side_effect_repo.find_by_patients(patient_ids)
+        return {
+            patient_id: self._build_alerts(
+                pre_consultations.get(patient_id),
+                last_sessions.get(patient_id, {}),
+                side_effects.get(patient_id, []),
+            )
+            for patient_id in patient_ids
+        }
+
+    def _build_alerts(
+        self,
+        pre_consultation: PreConsultation | None,
+        zones_last_session: dict[str, tuple[datetime, str]],
+        side_effects: list[SideEffect],
+    ) -> list[Alert]:
+        """Compute alerts from a patient's loaded data."""
         alerts = []
 
         # 1. Check for validated pre-consultation
-        pre_consultation = await self.pre_consultation_repo.find_by_patient_id(patient_id)
         if not pre_consultation:
             alerts.append(
                 Alert(
@@ -109,12 +182,11 @@ class AlertService:
                     )
 
         # 3. Session spacing alerts (per zone)
-        zones_last_session = await self._get_last_session_per_zone(patient_id)
+        # Counted in calendar days, so alerts only change at midnight (UTC)
+        # and the stored summary of the day stays consistent with them
+        today = datetime.now(UTC).date()
         for zone_id, (last_session_date, zone_nom) in zones_last_session.items():
-            # Ensure both datetimes are naive for comparison
-            now_naive = datetime.now(timezone.utc).replace(tzinfo=None)
-            session_date = last_session_date.replace(tzinfo=None) if last_session_date.tzinfo else last_session_date
-            days_since = (now_naive - session_date).days
+            days_since = (today - last_session_date.date()).days
             if days_since > SESSION_SPACING_WARNING_DAYS:
                 alerts.append(
                     Alert(
@@ -147,7 +219,6 @@ class AlertService:
                 )
 
         # 4. Previous side effects alerts
-        side_effects = await self.side_effect_repo.find_by_patient(patient_id)
         zones_with_effects = set()
         for effect in side_effects:
             if effect.zone_id and effect.zone_id not in zones_with_effects:
@@ -180,36 +251,21 @@ class AlertService:
 
     async def _get_last_session_per_zone(self, patient_id: str) -> dict[str, tuple[datetime, str]]:
         """Get last session date per zone for a patient."""
-        sessions = await self.session_repo.find_by_patient_with_zones(patient_id)
-
-        zones_last_session = {}
-        for session in sessions:
-            zone_key = session.patient_zone_id
-            if zone_key:
-                if (
-                    zone_key not in zones_last_session
-                    or session.date_seance > zones_last_session[zone_key][0]
-                ):
-                    zones_last_session[zone_key] = (
-                        session.date_seance,
-                        session.zone_nom or "Zone inconnue",
-                    )
-
-        return zones_last_session
+        rows = await self.session_repo.find_last_session_per_zone(patient_id)
+        return {
+            patient_zone_id: (last_date, zone_nom)
+            for patient_zone_id, zone_nom, last_date in rows
+        }
 
     async def has_alerts(self, patient_id: str) -> bool:
         """Check if patient has any alerts."""
-        alerts = await self.get_patient_alerts(patient_id)
-        return len(alerts) > 0
+        return (await self.get_alert_summary(patient_id)).has_alerts
 
     async def has_errors(self, patient_id: str) -> bool:
         """Check if patient has any error-level alerts."""
-        alerts = await self.get_patient_alerts(patient_id)
-        return any(a.is_error for a in alerts)
+        return (await self.get_alert_summary(patient_id)).has_errors
 
     async def count_alerts(self, patient_id: str) -> tuple[int, int]:
         """Count alerts by severity (errors, warnings)."""
-        alerts = await self.get_patient_alerts(patient_id)
-        errors = sum(1 for a in alerts if a.is_error)
-        warnings = sum(1 for a in alerts if a.is_warning)
-        return errors, warnings
+        summary = await self.get_alert_summary(patient_id)
+        return summary.error_count, summary.warning_count
@@ -4,6 +4,7 @@ from src.domain.exceptions import (
     AuthenticationError,
     InvalidCredentialsError,
 )
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.database.repositories import RoleRepository, UserRepository
 from src.infrastructure.security.jwt import create_access_token
 from src.infrastructure.security.password import hash_password, verify_password
@@ -69,8 +70,9 @@ class AuthService:
         if not user.is_active:
             raise AuthenticationError("Compte désactivé")
 
-        role = await self.role_repository.find_by_id(user.role_id)
-        permissions = role.permissions if role else []
+        roles = await reference_catalog.roles(self.role_repository)
+        role = roles.get(user.role_id)
+        permissions = list(role.permissions) if role else []
 
         return {
             "id": user.id,
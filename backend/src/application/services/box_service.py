@@ -2,6 +2,7 @@
 
 from src.domain.entities.box import Box
 from src.domain.exceptions import BusinessRuleError, DuplicateError, NotFoundError
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.database.repositories.box_repository import (
     BoxAssignmentRepository,
     BoxRepository,
@@ -70,10 +71,8 @@ class BoxService:
 
     async def get_all_boxes(self) -> list[dict]:
         """Return all boxes with current occupant info."""
-        boxes = await self.box_repo.find_all(include_inactive=True)
-        assignments = await self.assignment_repo.get_all_assignments()
-
-        assignment_map = {a.box_id: a for a in assignments}
+        boxes = (await reference_catalog.boxes(self.box_repo)).values()
+        assignment_map = await reference_catalog.box_assignments(self.assignment_repo)
 
         result = []
         for box in boxes:
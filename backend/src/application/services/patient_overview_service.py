@@ -0,0 +1,105 @@
+"""Patient overview service: every section of the patient screen at once."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.services.alert_service import AlertService
+from src.application.services.schedule_service import ScheduleService
+from src.infrastructure.database.repositories import (
+    PaiementRepository,
+    PatientAlertStateRepository,
+    PatientDocumentRepository,
+    PatientRepository,
+    PatientSubscriptionRepository,
+    PatientZoneRepository,
+    PreConsultationRepository,
+    ScheduleRepository,
+    SessionRepository,
+    SideEffectRepository,
+    UserRepository,
+    WaitingQueueRepository,
+)
+
+
+class PatientOverviewService:
+    """Loads the sections of a patient's detail screen concurrently.
+
+    Each section reads through its own database session, so sections run in
+    parallel on separate connections; ``concurrency`` bounds how many
+    connections one overview holds at a time. The patient itself is expected
+    to have been checked by the caller, so sections skip that lookup.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int,
+        sessions_limit: int = 20,
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.sessions_limit = sessions_limit
+        # Section name -> loader reading it through the given session
+        self._loaders: dict[str, Callable[[AsyncSession, str], Awaitable[Any]]] = {
+            "zones": self._zones,
+            "sessions": self._sessions,
+            "pre_consultation": self._pre_consultation,
+            "alerts": self._alerts,
+            "subscriptions": self._subscriptions,
+            "payments": self._payments,
+            "absences": self._absences,
+            "documents": self._documents,
+        }
+
+    async def get_overview(self, patient_id: str, sections: Iterable[str]) -> dict[str, Any]:
+        """Load the requested sections, keyed by section name."""
+        names = list(dict.fromkeys(sections))
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def load(name: str) -> Any:
+            async with slots, self.session_factory() as session:
+                return await self._loaders[name](session, patient_id)
+
+        results = await asyncio.gather(*(load(name) for name in names))
+        return dict(zip(names, results, strict=True))
+
+    async def _zones(self, session: AsyncSession, patient_id: str):
+        return await PatientZoneRepository(session).find_by_patient(patient_id)
+
+    async def _sessions(self, session: AsyncSession, patient_id: str):
+        return await SessionRepository(session).find_by_patient(
+            patient_id, 1, self.sessions_limit
+        )
+
+    async def _pre_consultation(self, session: AsyncSession, patient_id: str):
+        return await PreConsultationRepository(session).find_by_patient_id(patient_id)
+
+    async def _alerts(self, session: AsyncSession, patient_id: str):
+        alert_service = AlertService(
+            PreConsultationRepository(session),
+            SessionRepository(session),
+            SideEffectRepository(session),
+            PatientAlertStateRepository(session),
+        )
+        return await alert_service.get_patient_alerts(patient_id)
+
+    async def _subscriptions(self, session: AsyncSession, patient_id: str):
+        return await PatientSubscriptionRepository(session).find_by_patient(patient_id)
+
+    async def _payments(self, session: AsyncSession, patient_id: str):
+        return await PaiementRepository(session).find_by_patient(patient_id)
+
+    async def _absences(self, session: AsyncSession, patient_id: str):
+        schedule_service = ScheduleService(
+            ScheduleRepository(session),
+            WaitingQueueRepository(session),
+            PatientRepository(session),
+            UserRepository(session),
+        )
+        return await schedule_service.get_absences(patient_id)
+
+    async def _documents(self, session: AsyncSession, patient_id: str):
+        return await PatientDocumentRepository(session).find_by_patient(patient_id)
@@ -0,0 +1,296 @@
+"""Layout of clinic PDF documents with reportlab (used in worker processes)."""
+
+import io
+from datetime import date
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import cm, mm
+from reportlab.platypus import (
+    PageBreak,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from src.application.services.pdf_service import DEFAULT_TEMPLATES
+
+
+class PDFService:
+    """Service for generating clinic PDF documents."""
+
+    def __init__(self) -> None:
+        self._styles = getSampleStyleSheet()
+        self._setup_custom_styles()
+
+    def _setup_custom_styles(self) -> None:
+        """Register reusable custom paragraph styles."""
+        self._styles.add(
+            ParagraphStyle(
+                "ClinicTitle",
+                parent=self._styles["Title"],
+                fontSize=22,
+                spaceAfter=6 * mm,
+                textColor=colors.HexColor("#2c3e50"),
+            )
+        )
+        self._styles.add(
+            ParagraphStyle(
+                "DocSubtitle",
+                parent=self._styles["Heading2"],
+                fontSize=14,
+                spaceAfter=4 * mm,
+                textColor=colors.HexColor("#34495e"),
+            )
+        )
+        self._styles.add(
+            ParagraphStyle(
+                "BodyFR",
+                parent=self._styles["BodyText"],
+                fontSize=11,
+                leading=16,
+                spaceAfter=3 * mm,
+            )
+        )
+        self._styles.add(
+            ParagraphStyle(
+                "SectionHeading",
+                parent=self._styles["Heading3"],
+                fontSize=12,
+                spaceBefore=6 * mm,
+                spaceAfter=3 * mm,
+                textColor=colors.HexColor("#2c3e50"),
+            )
+        )
+        self._styles.add(
+            ParagraphStyle(
+                "SmallItalic",
+                parent=self._styles["BodyText"],
+                fontSize=9,
+                leading=12,
+                textColor=colors.grey,
+                fontName="Helvetica-Oblique",
+            )
+        )
+
+    def _build_header(self, elements: list, title: str) -> None:
+        """Add standard Optiskin header with document title."""
+        elements.append(Paragraph("Optiskin", self._styles["ClinicTitle"]))
+        elements.append(
+            Paragraph(
+                "Centre d'epilation laser",
+                self._styles["SmallItalic"],
+            )
+        )
+        elements.append(Spacer(1, 4 * mm))
+        elements.append(Paragraph(title, self._styles["DocSubtitle"]))
+        elements.append(Spacer(1, 2 * mm))
+
+    def _build_patient_info_table(self, patient_data: dict) -> Table:
+        """Build a formatted patient info table."""
+        nom = patient_data.get("nom", "")
+        prenom = patient_data.get("prenom", "")
+        code_carte = patient_data.get("code_carte", "")
+        today = date.today().strftime("%d/%m/%Y")
+
+        data = [
+            ["Nom :", nom, "Date :", today],
+            ["Prenom :", prenom, "Code carte :", code_carte],
+        ]
+
+        table = Table(data, colWidths=[3 * cm, 5.5 * cm, 3 * cm, 5.5 * cm])
+        table.setStyle(
+            TableStyle(
+                [
+                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
+                    ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 10),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+                    ("TOPPADDING", (0, 0), (-1, -1), 6),
+                    ("LINEBELOW", (0, -1), (-1, -1), 0.5, colors.grey),
+                ]
+            )
+        )
+        return table
+
+    def _build_signature_block(self, elements: list) -> None:
+        """Add a signature block to the document."""
+        elements.append(Spacer(1, 15 * mm))
+
+        sig_data = [
+            ["Signature du patient :", "", "Signature du praticien :"],
+            ["", "", ""],
+            ["", "", ""],
+            [
+                "____________________________",
+                "",
+                "____________________________",
+            ],
+        ]
+        sig_table = Table(sig_data, colWidths=[6 * cm, 5 * cm, 6 * cm])
+        sig_table.setStyle(
+            TableStyle(
+                [
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 10),
+                    ("TOPPADDING", (0, 0), (-1, -1), 4),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ]
+            )
+        )
+        elements.append(sig_table)
+
+    def _render_pdf(self, elements: list) -> bytes:
+        """Render elements into a PDF byte stream."""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            topMargin=2 * cm,
+            bottomMargin=2 * cm,
+            leftMargin=2 * cm,
+            rightMargin=2 * cm,
+        )
+        doc.build(elements)
+        buffer.seek(0)
+        return buffer.getvalue()
+
+    # ------------------------------------------------------------------
+    # Generic template-based generator
+    # ------------------------------------------------------------------
+
+    def generate_from_template(
+        self,
+        document_type: str,
+        patient_data: dict,
+        template_content: dict | None = None,
+    ) -> bytes:
+        """Generate a PDF from template content.
+
+        Args:
+            document_type: One of 'consent', 'rules', 'precautions'.
+            patient_data: Dict with nom, prenom, code_carte.
+            template_content: Custom template from DB, or None for defaults.
+
+        Returns:
+            PDF bytes.
+        """
+        return self._render_pdf(
+            self._build_document(document_type, patient_data, template_content)
+        )
+
+    def generate_batch(self, documents: list[tuple[str, dict, dict | None]]) -> bytes:
+        """Generate one PDF holding several documents, each starting on a new page.
+
+        Args:
+            documents: (document_type, patient_data, template_content) tuples.
+
+        Returns:
+            PDF bytes.
+        """
+        elements: list = []
+        for document_type, patient_data, template_content in documents:
+            if elements:
+                elements.append(PageBreak())
+            elements.extend(self._build_document(document_type, patient_data, template_content))
+        return self._render_pdf(elements)
+
+    def _build_document(
+        self,
+        document_type: str,
+        patient_data: dict,
+        template_content: dict | None,
+    ) -> list:
+        """Build the flowables of one document."""
+        tpl = template_content or DEFAULT_TEMPLATES.get(document_type, {})
+
+        elements: list = []
+
+        title = tpl.get("title", "Document")
+        self._build_header(elements, title)
+        elements.append(self._build_patient_info_table(patient_data))
+        elements.append(Spacer(1, 8 * mm))
+
+        # Intro
+        intro = tpl.get("intro", "")
+        if intro:
+            formatted_intro = intro.format(
+                nom=patient_data.get("nom", ""),
+                prenom=patient_data.get("prenom", ""),
+                code_carte=patient_data.get("code_carte", ""),
+            )
+            elements.append(Paragraph(formatted_intro, self._styles["BodyFR"]))
+
+        # Sections
+        for section in tpl.get("sections", []):
+            heading = section.get("heading", "")
+            if heading:
+                elements.append(Paragraph(heading, self._styles["SectionHeading"]))
+
+            # Text content (single paragraph)
+            content = section.get("content")
+            if content:
+                elements.append(Paragraph(content, self._styles["BodyFR"]))
+
+            # Bullet items
+            items = section.get("items")
+            if items:
+                for item in items:
+                    elements.append(Paragraph(f"&bull; {item}", self._styles["BodyFR"]))
+
+        # Warning box (precautions only)
+        warning = tpl.get("warning")
+        if warning:
+            elements.append(Spacer(1, 6 * mm))
+            warning_data = [
+                [Paragraph(f"<b>{warning}</b>", self._styles["BodyFR"])]
+            ]
+            warning_table = Table(warning_data, colWidths=[15 * cm])
+            warning_table.setStyle(
+                TableStyle(
+                    [
+                        ("BOX", (0, 0), (-1, -1), 1, colors.HexColor("#e74c3c")),
+                        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#fdf2f2")),
+                        ("TOPPADDING", (0, 0), (-1, -1), 8),
+                        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+                        ("LEFTPADDING", (0, 0), (-1, -1), 10),
+                        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+                    ]
+                )
+            )
+            elements.append(warning_table)
+
+        # Closing
+        closing = tpl.get("closing")
+        if closing:
+            elements.append(Spacer(1, 6 * mm))
+            elements.append(Paragraph(closing, self._styles["BodyFR"]))
+
+        # Date line for consent
+        if document_type == "consent":
+            today = date.today().strftime("%d/%m/%Y")
+            elements.append(Spacer(1, 4 * mm))
+            elements.append(
+                Paragraph(f"Fait a ________________, le {today}", self._styles["BodyFR"])
+            )
+
+        self._build_signature_block(elements)
+
+        return elements
+
+    # ------------------------------------------------------------------
+    # Legacy public methods (delegate to generate_from_template)
+    # ------------------------------------------------------------------
+
+    def generate_consent_form(self, patient_data: dict, template_content: dict | None = None) -> bytes:
+        return self.generate_from_template("consent", patient_data, template_content)
+
+    def generate_clinic_rules(self, patient_data: dict, template_content: dict | None = None) -> bytes:
+        return self.generate_from_template("rules", patient_data, template_content)
+
+    def generate_precautions(self, patient_data: dict, template_content: dict | None = None) -> bytes:
+        return self.generate_from_template("precautions", patient_data, template_content)
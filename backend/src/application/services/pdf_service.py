@@ -1,13 +1,30 @@
-"""PDF document generation service for clinic documents."""
-
-import io
+"""PDF document generation service for clinic documents.
+
+Layout lives in ``pdf_layout`` and runs in worker processes, so the API
+process never imports reportlab.
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
 from datetime import date
+from typing import TYPE_CHECKING
+
+from src.application.services.qr_service import render_card_sheet
+from src.core.config import get_settings
+from src.infrastructure.storage import file_storage
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import cm, mm
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+if TYPE_CHECKING:
+    from src.application.services.pdf_layout import PDFService
+
+settings = get_settings()
 
 
 # Default template content for each document type (used when no DB template exists)
@@ -175,251 +192,173 @@ DEFAULT_TEMPLATES: dict[str, dict] = {
 }
 
 
-class PDFService:
-    """Service for generating clinic PDF documents."""
+# ----------------------------------------------------------------------
+# Off-loop rendering with caching
+# ----------------------------------------------------------------------
 
-    def __init__(self) -> None:
-        self._styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+_worker_service: "PDFService | None" = None
 
-    def _setup_custom_styles(self) -> None:
-        """Register reusable custom paragraph styles."""
-        self._styles.add(
-            ParagraphStyle(
-                "ClinicTitle",
-                parent=self._styles["Title"],
-                fontSize=22,
-                spaceAfter=6 * mm,
-                textColor=colors.HexColor("#2c3e50"),
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                "DocSubtitle",
-                parent=self._styles["Heading2"],
-                fontSize=14,
-                spaceAfter=4 * mm,
-                textColor=colors.HexColor("#34495e"),
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                "BodyFR",
-                parent=self._styles["BodyText"],
-                fontSize=11,
-                leading=16,
-                spaceAfter=3 * mm,
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                "SectionHeading",
-                parent=self._styles["Heading3"],
-                fontSize=12,
-                spaceBefore=6 * mm,
-                spaceAfter=3 * mm,
-                textColor=colors.HexColor("#2c3e50"),
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                "SmallItalic",
-                parent=self._styles["BodyText"],
-                fontSize=9,
-                leading=12,
-                textColor=colors.grey,
-                fontName="Helvetica-Oblique",
-            )
-        )
-
-    def _build_header(self, elements: list, title: str) -> None:
-        """Add standard Optiskin header with document title."""
-        elements.append(Paragraph("Optiskin", self._styles["ClinicTitle"]))
-        elements.append(
-            Paragraph(
-                "Centre d'epilation laser",
-                self._styles["SmallItalic"],
-            )
-        )
-        elements.append(Spacer(1, 4 * mm))
-        elements.append(Paragraph(title, self._styles["DocSubtitle"]))
-        elements.append(Spacer(1, 2 * mm))
-
-    def _build_patient_info_table(self, patient_data: dict) -> Table:
-        """Build a formatted patient info table."""
-        nom = patient_data.get("nom", "")
-        prenom = patient_data.get("prenom", "")
-        code_carte = patient_data.get("code_carte", "")
-        today = date.today().strftime("%d/%m/%Y")
-
-        data = [
-            ["Nom :", nom, "Date :", today],
-            ["Prenom :", prenom, "Code carte :", code_carte],
-        ]
-
-        table = Table(data, colWidths=[3 * cm, 5.5 * cm, 3 * cm, 5.5 * cm])
-        table.setStyle(
-            TableStyle(
-                [
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ("TOPPADDING", (0, 0), (-1, -1), 6),
-                    ("LINEBELOW", (0, -1), (-1, -1), 0.5, colors.grey),
-                ]
-            )
-        )
-        return table
-
-    def _build_signature_block(self, elements: list) -> None:
-        """Add a signature block to the document."""
-        elements.append(Spacer(1, 15 * mm))
-
-        sig_data = [
-            ["Signature du patient :", "", "Signature du praticien :"],
-            ["", "", ""],
-            ["", "", ""],
-            [
-                "____________________________",
-                "",
-                "____________________________",
-            ],
-        ]
-        sig_table = Table(sig_data, colWidths=[6 * cm, 5 * cm, 6 * cm])
-        sig_table.setStyle(
-            TableStyle(
-                [
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("TOPPADDING", (0, 0), (-1, -1), 4),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ]
+
+def _service() -> "PDFService":
+    """The PDFService of the current worker process (styles are built once)."""
+    global _worker_service
+    if _worker_service is None:
+        # Imported here so only worker processes load reportlab
+        from src.application.services.pdf_layout import PDFService
+
+        _worker_service = PDFService()
+    return _worker_service
+
+
+def render_document(
+    document_type: str,
+    patient_data: dict,
+    template_content: dict | None,
+) -> bytes:
+    """Render a document (runs in a worker process)."""
+    return _service().generate_from_template(document_type, patient_data, template_content)
+
+
+def render_batch(documents: list[tuple[str, dict, dict | None]]) -> bytes:
+    """Render several documents into one PDF (runs in a worker process)."""
+    return _service().generate_batch(documents)
+
+
+class PDFRenderer:
+    """Renders documents in a process pool behind a memory and disk cache.
+
+    Documents are keyed by type, template version (a hash of its content),
+    patient fields and the current date, which is printed on every document.
+    A reprint is therefore served from the in-memory LRU or, after a
+    restart, from disk. Only today's disk entries are kept.
+    """
+
+    def __init__(self, cache_path: str, max_workers: int, max_entries: int):
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
             )
-        )
-        elements.append(sig_table)
-
-    def _render_pdf(self, elements: list) -> bytes:
-        """Render elements into a PDF byte stream."""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            topMargin=2 * cm,
-            bottomMargin=2 * cm,
-            leftMargin=2 * cm,
-            rightMargin=2 * cm,
-        )
-        doc.build(elements)
-        buffer.seek(0)
-        return buffer.getvalue()
-
-    # ------------------------------------------------------------------
-    # Generic template-based generator
-    # ------------------------------------------------------------------
-
-    def generate_from_template(
+        return self._executor
+
+    @staticmethod
+    def cache_key(
+        document_type: str,
+        patient_data: dict,
+        template_content: dict | None,
+        day: date,
+    ) -> str:
+        """Cache file name of a rendered document."""
+        template = json.dumps(template_content, sort_keys=True) if template_content else ""
+        template_version = hashlib.sha256(template.encode()).hexdigest()[:16]
+        fields = json.dumps(patient_data, sort_keys=True, default=str)
+        patient_hash = hashlib.sha256(fields.encode()).hexdigest()[:32]
+        return f"{document_type}-{template_version}-{patient_hash}-{day.isoformat()}"
+
+    async def render(
         self,
         document_type: str,
         patient_data: dict,
         template_content: dict | None = None,
     ) -> bytes:
-        """Generate a PDF from template content.
-
-        Args:
-            document_type: One of 'consent', 'rules', 'precautions'.
-            patient_data: Dict with nom, prenom, code_carte.
-            template_content: Custom template from DB, or None for defaults.
-
-        Returns:
-            PDF bytes.
-        """
-        tpl = template_content or DEFAULT_TEMPLATES.get(document_type, {})
-
-        elements: list = []
-
-        title = tpl.get("title", "Document")
-        self._build_header(elements, title)
-        elements.append(self._build_patient_info_table(patient_data))
-        elements.append(Spacer(1, 8 * mm))
-
-        # Intro
-        intro = tpl.get("intro", "")
-        if intro:
-            formatted_intro = intro.format(
-                nom=patient_data.get("nom", ""),
-                prenom=patient_data.get("prenom", ""),
-                code_carte=patient_data.get("code_carte", ""),
+        """PDF bytes of a document, rendered only on a cache miss."""
+        today = date.today()
+        key = self.cache_key(document_type, patient_data, template_content, today)
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._memory.move_to_end(key)
+            return cached
+
+        path = os.path.join(self.cache_path, today.isoformat(), f"{key}.pdf")
+        try:
+            pdf_bytes = await file_storage.read(path)
+        except FileNotFoundError:
+            loop = asyncio.get_running_loop()
+            pdf_bytes = await loop.run_in_executor(
+                self._pool(), render_document, document_type, patient_data, template_content
             )
-            elements.append(Paragraph(formatted_intro, self._styles["BodyFR"]))
-
-        # Sections
-        for section in tpl.get("sections", []):
-            heading = section.get("heading", "")
-            if heading:
-                elements.append(Paragraph(heading, self._styles["SectionHeading"]))
-
-            # Text content (single paragraph)
-            content = section.get("content")
-            if content:
-                elements.append(Paragraph(content, self._styles["BodyFR"]))
-
-            # Bullet items
-            items = section.get("items")
-            if items:
-                for item in items:
-                    elements.append(Paragraph(f"&bull; {item}", self._styles["BodyFR"]))
-
-        # Warning box (precautions only)
-        warning = tpl.get("warning")
-        if warning:
-            elements.append(Spacer(1, 6 * mm))
-            warning_data = [
-                [Paragraph(f"<b>{warning}</b>", self._styles["BodyFR"])]
-            ]
-            warning_table = Table(warning_data, colWidths=[15 * cm])
-            warning_table.setStyle(
-                TableStyle(
-                    [
-                        ("BOX", (0, 0), (-1, -1), 1, colors.HexColor("#e74c3c")),
-                        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#fdf2f2")),
-                        ("TOPPADDING", (0, 0), (-1, -1), 8),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                    ]
-                )
-            )
-            elements.append(warning_table)
-
-        # Closing
-        closing = tpl.get("closing")
-        if closing:
-            elements.append(Spacer(1, 6 * mm))
-            elements.append(Paragraph(closing, self._styles["BodyFR"]))
-
-        # Date line for consent
-        if document_type == "consent":
-            today = date.today().strftime("%d/%m/%Y")
-            elements.append(Spacer(1, 4 * mm))
-            elements.append(
-                Paragraph(f"Fait a ________________, le {today}", self._styles["BodyFR"])
-            )
-
-        self._build_signature_block(elements)
-
-        return self._render_pdf(elements)
+            await asyncio.to_thread(_drop_other_days, self.cache_path, today.isoformat())
+            await file_storage.save(pdf_bytes, path)
 
-    # ------------------------------------------------------------------
-    # Legacy public methods (delegate to generate_from_template)
-    # ------------------------------------------------------------------
+        self._memory[key] = pdf_bytes
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+        return pdf_bytes
 
-    def generate_consent_form(self, patient_data: dict, template_content: dict | None = None) -> bytes:
-        return self.generate_from_template("consent", patient_data, template_content)
-
-    def generate_clinic_rules(self, patient_data: dict, template_content: dict | None = None) -> bytes:
-        return self.generate_from_template("rules", patient_data, template_content)
-
-    def generate_precautions(self, patient_data: dict, template_content: dict | None = None) -> bytes:
-        return self.generate_from_template("precautions", patient_data, template_content)
+    async def render_as_completed(
+        self,
+        documents: list[tuple[str, dict, dict | None]],
+    ) -> AsyncIterator[tuple[int, bytes]]:
+        """Render documents in parallel, yielding (index, PDF bytes) as each is ready."""
+
+        async def render(index: int, document: tuple[str, dict, dict | None]):
+            return index, await self.render(*document)
+
+        tasks = [asyncio.create_task(render(i, d)) for i, d in enumerate(documents)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def render_combined(self, documents: list[tuple[str, dict, dict | None]]) -> bytes:
+        """Render documents into a single PDF in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), render_batch, documents)
+
+    async def render_card_sheet(self, cards: list[tuple[str, str]]) -> bytes:
+        """Render a sheet of patient QR cards in a worker process."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), render_card_sheet, cards)
+
+    async def invalidate(self, document_type: str) -> None:
+        """Forget cached renders of a document type after its template changed."""
+        for key in [k for k in self._memory if k.startswith(f"{document_type}-")]:
+            del self._memory[key]
+        await asyncio.to_thread(_drop_renders, self.cache_path, f"{document_type}-")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _drop_other_days(cache_path: str, day: str) -> None:
+    """Remove cache directories of previous days (their date is outdated)."""
+    try:
+        entries = list(os.scandir(cache_path))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name != day and entry.is_dir():
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _drop_renders(cache_path: str, prefix: str) -> None:
+    try:
+        days = list(os.scandir(cache_path))
+    except FileNotFoundError:
+        return
+    for day in days:
+        if not day.is_dir():
+            continue
+        for entry in os.scandir(day.path):
+            if entry.name.startswith(prefix):
+                with suppress(FileNotFoundError):
+                    os.remove(entry.path)
+
+
+# Singleton instance
+pdf_renderer = PDFRenderer(
+    cache_path=settings.pdf_cache_path,
+    max_workers=settings.pdf_workers,
+    max_entries=settings.pdf_cache_entries,
+)
@@ -2,16 +2,26 @@
 
 from datetime import date
 
-from src.domain.entities.promotion import Promotion
-from src.domain.exceptions import NotFoundError
+from src.domain.entities.promotion import PricingIndex, Promotion
+from src.domain.exceptions import NotFoundError, ZoneNotFoundError
+from src.infrastructure.cache import reference_catalog
+from src.infrastructure.database.repositories.pack_repository import PackRepository
 from src.infrastructure.database.repositories.promotion_repository import PromotionRepository
+from src.infrastructure.database.repositories.zone_repository import ZoneDefinitionRepository
 
 
 class PromotionService:
     """Service for promotion operations."""
 
-    def __init__(self, promotion_repo: PromotionRepository):
+    def __init__(
+        self,
+        promotion_repo: PromotionRepository,
+        zone_repo: ZoneDefinitionRepository,
+        pack_repo: PackRepository,
+    ):
         self.promotion_repo = promotion_repo
+        self.zone_repo = zone_repo
+        self.pack_repo = pack_repo
 
     async def create_promotion(
         self,
@@ -46,31 +56,61 @@ class PromotionService:
 
     async def get_zone_price(self, zone_id: str, original_price: int) -> dict:
         """Get zone price with active promotions applied."""
-        active = await self.promotion_repo.find_active()
-        applicable = [p for p in active if p.applies_to_zone(zone_id)]
-
-        if not applicable:
-            return {
-                "original_price": original_price,
-                "final_price": original_price,
-                "discount": 0,
-                "promotions": [],
-            }
-
-        # Apply best promotion (highest discount)
-        best_price = original_price
-        for promo in applicable:
-            discounted = promo.calculate_discount(original_price)
-            if discounted < best_price:
-                best_price = discounted
+        index = await reference_catalog.pricing_index(self.promotion_repo, self.zone_repo)
+        return _price_line(index, zone_id, original_price)
+
+    async def quote(self, zone_ids: list[str], prices: dict[str, int] | None = None) -> dict:
+        """Price a cart of zones and list the packs covering part of it.
+
+        Zones are priced at their catalog price unless ``prices`` overrides
+        it, with the best promotion of each zone applied.
+        """
+        prices = prices or {}
+        zones = await reference_catalog.zones(self.zone_repo)
+        index = await reference_catalog.pricing_index(self.promotion_repo, self.zone_repo)
+
+        lines = []
+        for zone_id in dict.fromkeys(zone_ids):
+            zone = zones.get(zone_id)
+            if zone is None:
+                raise ZoneNotFoundError(zone_id)
+            original_price = prices.get(zone_id, zone.prix or 0)
+            lines.append({
+                "zone_id": zone_id,
+                "zone_nom": zone.nom,
+                **_price_line(index, zone_id, original_price),
+            })
 
+        final_by_zone = {line["zone_id"]: line["final_price"] for line in lines}
+        packs = []
+        for pack in (await reference_catalog.packs(self.pack_repo)).values():
+            if not pack.is_active:
+                continue
+            covered = [
+                z for z in final_by_zone if pack.zones_illimitees or z in pack.zone_ids
+            ]
+            if not covered:
+                continue
+            uncovered = [z for z in final_by_zone if z not in covered]
+            packs.append({
+                "pack_id": pack.id,
+                "nom": pack.nom,
+                "prix": pack.prix,
+                "seances_per_zone": pack.seances_per_zone,
+                "covered_zone_ids": covered,
+                "uncovered_zone_ids": uncovered,
+                "total_price": pack.prix + sum(final_by_zone[z] for z in uncovered),
+            })
+        packs.sort(key=lambda p: (-len(p["covered_zone_ids"]), p["total_price"]))
+
+        total_original = sum(line["original_price"] for line in lines)
+        total_final = sum(line["final_price"] for line in lines)
         return {
-            "original_price": original_price,
-            "final_price": best_price,
-            "discount": original_price - best_price,
-            "promotions": [
-                {"id": p.id, "nom": p.nom, "type": p.type, "valeur": p.valeur} for p in applicable
-            ],
+            "lines": lines,
+            "total_original": total_original,
+            "total_final": total_final,
+            "total_discount": total_original - total_final,
+            "packs": packs,
         }
 
     async def update_promotion(self, promotion_id: str, **kwargs) -> Promotion:
@@ -83,3 +123,15 @@ class PromotionService:
     async def delete_promotion(self, promotion_id: str) -> bool:
         await self.get_promotion(promotion_id)
         return await self.promotion_repo.delete(promotion_id)
+
+
+def _price_line(index: PricingIndex, zone_id: str, original_price: int) -> dict:
+    final_price, applicable = index.price(zone_id, original_price)
+    return {
+        "original_price": original_price,
+        "final_price": final_price,
+        "discount": original_price - final_price,
+        "promotions": [
+            {"id": p.id, "nom": p.nom, "type": p.type, "valeur": p.valeur} for p in applicable
+        ],
+    }
@@ -1,35 +1,170 @@
-"""QR code generation service."""
+"""QR code generation service.
 
+qrcode and reportlab are imported on first use: most processes never draw
+a QR code, and importing them slows down startup.
+"""
+
+import asyncio
 import io
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal
+
+from src.core.config import get_settings
+
+if TYPE_CHECKING:
+    import qrcode
+    from reportlab.pdfgen import canvas
+
+settings = get_settings()
+
+QRFormat = Literal["png", "svg"]
 
-import qrcode
-from qrcode.image.pil import PilImage
+QR_MEDIA_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+# Points per millimetre (reportlab.lib.units.mm)
+MM = 72 / 25.4
+
+# Card sheet layout: 3 x 6 cards on an A4 page
+SHEET_COLUMNS = 3
+SHEET_ROWS = 6
+SHEET_MARGIN = 10 * MM
+SHEET_QR_SIZE = 30 * MM
 
 
 class QRService:
     """Service for generating QR codes."""
 
-    def generate_qr_code(self, data: str) -> bytes:
-        """Generate a QR code PNG image from the given data.
+    def generate_qr_code(self, data: str, box_size: int = 10, fmt: QRFormat = "png") -> bytes:
+        """Generate a QR code image from the given data.
 
         Args:
             data: The string content to encode in the QR code (e.g. patient code_carte).
+            box_size: Size of one QR module in pixels (PNG) or tenths of a mm (SVG).
+            fmt: "png" or "svg".
 
         Returns:
-            PNG image bytes of the generated QR code.
+            Image bytes of the generated QR code.
         """
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
+        from qrcode.image.svg import SvgPathImage
+
+        qr = _build(data, box_size)
+        if fmt == "svg":
+            img = qr.make_image(image_factory=SvgPathImage)
+        else:
+            img = qr.make_image(fill_color="black", back_color="white")
+
+        buffer = io.BytesIO()
+        img.save(buffer)
+        return buffer.getvalue()
 
-        img: PilImage = qr.make_image(fill_color="black", back_color="white")
+    def generate_card_sheet(self, cards: list[tuple[str, str]]) -> bytes:
+        """Lay out patient QR cards on printable A4 pages.
+
+        Args:
+            cards: (code_carte, patient name) of each card, in print order.
+
+        Returns:
+            PDF bytes of the card sheet.
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
 
         buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
+        pdf = canvas.Canvas(buffer, pagesize=A4)
+        pdf.setTitle("Cartes patients")
+        page_width, page_height = A4
+        cell_width = (page_width - 2 * SHEET_MARGIN) / SHEET_COLUMNS
+        cell_height = (page_height - 2 * SHEET_MARGIN) / SHEET_ROWS
+        per_page = SHEET_COLUMNS * SHEET_ROWS
+
+        for index, (code, name) in enumerate(cards):
+            if index and index % per_page == 0:
+                pdf.showPage()
+            row, column = divmod(index % per_page, SHEET_COLUMNS)
+            x = SHEET_MARGIN + column * cell_width
+            y = page_height - SHEET_MARGIN - (row + 1) * cell_height
+
+            pdf.setStrokeColorRGB(0.8, 0.8, 0.8)
+            pdf.setDash(2, 2)
+            pdf.rect(x, y, cell_width, cell_height)
+            pdf.setDash()
+
+            qr_x = x + (cell_width - SHEET_QR_SIZE) / 2
+            qr_y = y + cell_height - SHEET_QR_SIZE - 4 * MM
+            _draw_qr(pdf, code, qr_x, qr_y, SHEET_QR_SIZE)
+
+            pdf.setFont("Helvetica-Bold", 10)
+            pdf.drawCentredString(x + cell_width / 2, qr_y - 5 * MM, code)
+            pdf.setFont("Helvetica", 8)
+            pdf.drawCentredString(x + cell_width / 2, qr_y - 9 * MM, name[:40])
+
+        pdf.save()
         return buffer.getvalue()
+
+
+def _build(data: str, box_size: int) -> "qrcode.QRCode":
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=box_size,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+def _draw_qr(pdf: "canvas.Canvas", data: str, x: float, y: float, size: float) -> None:
+    """Draw a QR code as vector squares, so it stays sharp when printed."""
+    matrix = _build(data, box_size=1).get_matrix()
+    module = size / len(matrix)
+    pdf.setFillColorRGB(0, 0, 0)
+    for row_index, row in enumerate(matrix):
+        for column_index, dark in enumerate(row):
+            if dark:
+                pdf.rect(
+                    x + column_index * module,
+                    y + size - (row_index + 1) * module,
+                    module,
+                    module,
+                    stroke=0,
+                    fill=1,
+                )
+
+
+def render_card_sheet(cards: list[tuple[str, str]]) -> bytes:
+    """Render a card sheet (runs in a worker process)."""
+    return QRService().generate_card_sheet(cards)
+
+
+class QRCodeCache:
+    """Rendered QR images kept in memory, keyed by data, size and format.
+
+    A patient's ``code_carte`` never changes, so an image never goes stale;
+    the LRU bound only limits memory. Encoding runs in a worker thread.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._service = QRService()
+        self._images: OrderedDict[tuple[str, int, str], bytes] = OrderedDict()
+
+    async def get(self, data: str, box_size: int = 10, fmt: QRFormat = "png") -> bytes:
+        """Image bytes of a QR code, encoded only on a cache miss."""
+        key = (data, box_size, fmt)
+        cached = self._images.get(key)
+        if cached is not None:
+            self._images.move_to_end(key)
+            return cached
+
+        image = await asyncio.to_thread(self._service.generate_qr_code, data, box_size, fmt)
+        self._images[key] = image
+        if len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+        return image
+
+
+# Singleton instance
+qr_codes = QRCodeCache(max_entries=settings.qr_cache_entries)
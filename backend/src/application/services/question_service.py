@@ -1,8 +1,9 @@
 """Question service."""
 
-from src.domain.entities.question import Question, QuestionResponse
+from src.domain.entities.question import Question
 from src.domain.exceptions import NotFoundError as PreConsultationNotFoundError
 from src.domain.exceptions import QuestionNotFoundError
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.database.repositories import (
     PreConsultationRepository,
     QuestionRepository,
@@ -46,7 +47,8 @@ class QuestionService:
 
     async def get_all_questions(self, include_inactive: bool = False) -> list[Question]:
         """Get all questions."""
-        return await self.question_repository.find_all(include_inactive)
+        questions = await reference_catalog.questions(self.question_repository)
+        return [q for q in questions.values() if include_inactive or q.is_active]
 
     async def update_question(
         self,
@@ -102,11 +104,45 @@ class QuestionnaireService:
 
     async def get_pre_consultation_questionnaire(self, pre_consultation_id: str) -> dict:
         """Get pre-consultation questionnaire with responses."""
-        pre_consultation = await self.pre_consultation_repository.find_by_id(pre_consultation_id)
-        if not pre_consultation:
+        if not await self.pre_consultation_repository.exists(pre_consultation_id):
             raise PreConsultationNotFoundError(f"Pre-consultation {pre_consultation_id} not found")
+        return await self._questionnaire(pre_consultation_id)
 
-        questions = await self.question_repository.find_all(include_inactive=False)
+    async def update_pre_consultation_questionnaire(
+        self,
+        pre_consultation_id: str,
+        responses: list[dict],
+    ) -> dict:
+        """Update pre-consultation questionnaire responses.
+
+        Answers to unknown questions are ignored; the others, including
+        answers to deactivated questions, are written with a single upsert,
+        and the refreshed questionnaire is read back in the same transaction.
+        Questions the catalog does not know are checked with one query.
+        """
+        if not await self.pre_consultation_repository.exists(pre_consultation_id):
+            raise PreConsultationNotFoundError(f"Pre-consultation {pre_consultation_id} not found")
+
+        catalog = await reference_catalog.questions(self.question_repository)
+        submitted = {r["question_id"] for r in responses}
+        known = (submitted & catalog.keys()) | await self.question_repository.existing_ids(
+            submitted - catalog.keys()
+        )
+        # Last answer wins when a question is submitted twice
+        answers = {r["question_id"]: r["reponse"] for r in responses if r["question_id"] in known}
+        await self.response_repository.upsert_many(pre_consultation_id, answers)
+
+        return await self._questionnaire(
+            pre_consultation_id, [q for q in catalog.values() if q.is_active]
+        )
+
+    async def _questionnaire(
+        self,
+        pre_consultation_id: str,
+        questions: list[Question] | None = None,
+    ) -> dict:
+        if questions is None:
+            questions = await reference_catalog.active_questions(self.question_repository)
         responses = await self.response_repository.find_by_pre_consultation(pre_consultation_id)
 
         # Map responses by question ID
@@ -138,38 +174,9 @@ class QuestionnaireService:
             "is_complete": answered_required >= required_count,
         }
 
-    async def update_pre_consultation_questionnaire(
-        self,
-        pre_consultation_id: str,
-        responses: list[dict],
-    ) -> dict:
-        """Update pre-consultation questionnaire responses."""
-        pre_consultation = await self.pre_consultation_repository.find_by_id(pre_consultation_id)
-        if not pre_consultation:
-            raise PreConsultationNotFoundError(f"Pre-consultation {pre_consultation_id} not found")
-
-        # Process each response
-        for response_data in responses:
-            question_id = response_data["question_id"]
-            reponse = response_data["reponse"]
-
-            # Verify question exists
-            question = await self.question_repository.find_by_id(question_id)
-            if not question:
-                continue
-
-            response = QuestionResponse(
-                pre_consultation_id=pre_consultation_id,
-                question_id=question_id,
-                reponse=reponse,
-            )
-            await self.response_repository.upsert(response)
-
-        return await self.get_pre_consultation_questionnaire(pre_consultation_id)
-
     async def is_questionnaire_complete(self, pre_consultation_id: str) -> bool:
         """Check if pre-consultation questionnaire is complete."""
-        questions = await self.question_repository.find_all(include_inactive=False)
+        questions = await reference_catalog.active_questions(self.question_repository)
         responses = await self.response_repository.find_by_pre_consultation(pre_consultation_id)
 
         response_ids = {r.question_id for r in responses}
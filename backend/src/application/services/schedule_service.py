@@ -10,6 +10,7 @@ from src.domain.entities.patient import Patient
 from src.domain.entities.schedule import DailyScheduleEntry, WaitingQueueEntry
 from src.domain.entities.zone import PatientZone
 from src.domain.exceptions import NotFoundError, ValidationError
+from src.infrastructure.cache import reference_catalog
 from src.infrastructure.events import event_bus
 from src.infrastructure.database.repositories import (
     PatientRepository,
@@ -37,6 +38,70 @@ def _normalize_phone(phone: str) -> str:
     return re.sub(r"\D", "", phone.strip())
 
 
+# Imported fields refreshed on an entry that is already on the agenda
+SCHEDULE_IMPORT_FIELDS = (
+    "patient_nom",
+    "patient_prenom",
+    "patient_id",
+    "patient_telephone",
+    "doctor_name",
+    "doctor_id",
+    "specialite",
+    "duration_type",
+    "end_time",
+    "notes",
+)
+
+
+def _schedule_key(entry: DailyScheduleEntry) -> tuple[date, time, str]:
+    """Key matching an uploaded row to an entry already imported."""
+    name = _normalize_name(f"{entry.patient_prenom} {entry.patient_nom}")
+    return entry.date, entry.start_time, " ".join(name.split())
+
+
+def _diff_schedule(
+    existing: list[DailyScheduleEntry],
+    uploaded: list[DailyScheduleEntry],
+    uploaded_by: str | None,
+) -> tuple[list[DailyScheduleEntry], list[dict], list[str]]:
+    """Compare an upload with the entries already imported for its dates.
+
+    Returns the entries to insert, the field changes of matched entries
+    (dicts holding ``id``) and the IDs of entries no longer in the file.
+    Entries past ``expected`` (checked in, in the queue, done) are never
+    changed or deleted; an uploaded row matching one is dropped.
+    """
+    by_key: dict[tuple, list[DailyScheduleEntry]] = {}
+    for entry in existing:
+        by_key.setdefault(_schedule_key(entry), []).append(entry)
+
+    new_entries: list[DailyScheduleEntry] = []
+    changes: list[dict] = []
+    for entry in uploaded:
+        matches = by_key.get(_schedule_key(entry))
+        if not matches:
+            new_entries.append(entry)
+            continue
+        current = matches.pop(0)
+        if current.status != "expected":
+            continue
+        change = {
+            field: getattr(entry, field)
+            for field in SCHEDULE_IMPORT_FIELDS
+            if getattr(entry, field) != getattr(current, field)
+        }
+        if change:
+            changes.append({"id": current.id, **change, "uploaded_by": uploaded_by})
+
+    stale_ids = [
+        entry.id
+        for matches in by_key.values()
+        for entry in matches
+        if entry.status == "expected"
+    ]
+    return new_entries, changes, stale_ids
+
+
 class ScheduleService:
     """Service for schedule and waiting queue operations."""
 
@@ -63,9 +128,15 @@ class ScheduleService:
     async def upload_schedule(
         self, file_data: bytes, uploaded_by: str | None = None
     ) -> dict:
-        """Parse Excel file and create schedule entries.
+        """Parse Excel file and reconcile it with the imported schedule.
+
+        Re-uploading a day only touches what changed in the file: new rows
+        are inserted, matched entries updated and missing ones deleted, while
+        entries already checked in are kept as they are.
 
-        Returns dict with 'entries', 'phone_matched', 'phone_conflicts'.
+        Returns dict with 'entries' (created), 'entries_updated',
+        'entries_deleted', 'entries_preserved', 'phone_matched',
+        'phone_conflicts'.
         """
         import openpyxl
 
@@ -221,14 +292,19 @@ class ScheduleService:
         if not entries:
             raise ValidationError("Aucune entrée valide trouvée dans le fichier")
 
-        # Delete existing entries for the dates being uploaded
-        dates = set(e.date for e in entries)
-        for d in dates:
-            await self.schedule_repo.delete_by_date(d)
-
-        created = await self.schedule_repo.create_batch(entries)
+        # Reconcile with the entries already imported for these dates
+        dates = sorted({e.date for e in entries})
+        existing = await self.schedule_repo.find_by_dates(dates)
+        new_entries, changes, stale_ids = _diff_schedule(existing, entries, uploaded_by)
+        updated = await self.schedule_repo.update_batch(changes)
+        deleted = await self.schedule_repo.delete_expected(stale_ids)
+        created = await self.schedule_repo.create_batch(new_entries)
         return {
             "entries": created,
+            "date": dates[0],
+            "entries_updated": updated,
+            "entries_deleted": deleted,
+            "entries_preserved": sum(1 for e in existing if e.status != "expected"),
             "phone_matched": phone_matched,
             "phone_conflicts": phone_conflicts,
             "skipped_rows": skipped_rows,
@@ -678,6 +754,9 @@ class ScheduleService:
         self, entries: list[WaitingQueueEntry]
     ) -> list[dict]:
         """Enrich queue entries with zone names, patient code_carte, telephone."""
+        zone_names = (
+            await reference_catalog.zone_names(self.zone_def_repo) if self.zone_def_repo else {}
+        )
         enriched = []
         for entry in entries:
             extra: dict = {
@@ -696,10 +775,11 @@ class ScheduleService:
             if entry.schedule_id and self.zone_def_repo:
                 schedule_entry = await self.schedule_repo.find_by_id(entry.schedule_id)
                 if schedule_entry and schedule_entry.zone_ids:
-                    for zone_id in schedule_entry.zone_ids:
-                        zone = await self.zone_def_repo.find_by_id(zone_id)
-                        if zone:
-                            extra["zone_names"].append(zone.nom)
+                    extra["zone_names"] = [
+                        zone_names[zone_id]
+                        for zone_id in schedule_entry.zone_ids
+                        if zone_id in zone_names
+                    ]
 
             enriched.append({"entry": entry, **extra})
         return enriched
@@ -3,7 +3,6 @@
 import os
 from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
 
 from src.core.config import get_settings
 from src.domain.entities.session import LASER_TYPES, Session, SessionPhoto
@@ -19,6 +18,9 @@ from src.infrastructure.database.repositories import (
     SessionRepository,
     UserRepository,
 )
+from src.infrastructure.storage import StoredFile, blob_store
+from src.infrastructure.storage.files import AsyncReadable
+from src.infrastructure.storage.images import PHOTO_VARIANTS, image_processor
 
 
 class SessionService:
@@ -51,7 +53,7 @@ class SessionService:
         notes: str | None = None,
         duree_minutes: int | None = None,
         date_seance: datetime | None = None,
-        photo_files: list[tuple[str, bytes]] | None = None,
+        photo_files: list[tuple[str, bytes | AsyncReadable | StoredFile]] | None = None,
     ) -> Session:
         """Create a new session."""
         # Verify patient exists
@@ -92,7 +94,7 @@ class SessionService:
         # Handle photo uploads
         if photo_files:
             for filename, file_data in photo_files:
-                photo = await self._save_photo(session.id, filename, file_data)
+                photo = await self._store_photo(session.id, filename, file_data)
                 session.photos.append(photo)
 
         # Save session
@@ -157,7 +159,7 @@ class SessionService:
         self,
         session_id: str,
         filename: str,
-        file_data: bytes,
+        file_data: bytes | AsyncReadable,
     ) -> SessionPhoto:
         """Add a photo to an existing session."""
         session = await self.session_repository.find_by_id(session_id)
@@ -190,36 +192,62 @@ class SessionService:
         """Get available laser types."""
         return LASER_TYPES
 
-    async def _save_photo(
+    async def get_photo_path(self, session_id: str, filename: str) -> str | None:
+        """Get the file of a session photo from the name used in its URL."""
+        for photo in await self.session_repository.find_photos(session_id):
+            if os.path.basename(photo.filepath) == filename:
+                return photo.filepath
+        return None
+
+    async def _store_photo(
         self,
         session_id: str,
         filename: str,
-        file_data: bytes,
+        file_data: bytes | AsyncReadable | StoredFile,
     ) -> SessionPhoto:
-        """Save a photo file and create record."""
-        # Create directory structure
-        photo_dir = os.path.join(self.settings.photos_path, session_id)
-        os.makedirs(photo_dir, exist_ok=True)
-
-        # Generate unique filename
-        ext = os.path.splitext(filename)[1] or ".jpg"
-        unique_filename = f"{uuid4().hex}{ext}"
-        filepath = os.path.join(photo_dir, unique_filename)
-
-        # Save file
-        with open(filepath, "wb") as f:
-            f.write(file_data)
-
-        # Create photo record
-        photo = await self.session_repository.add_photo(
+        """Store a photo in the blob store (unless already stored) with its variants."""
+        if isinstance(file_data, StoredFile):
+            stored = file_data
+        else:
+            ext = os.path.splitext(filename)[1] or ".jpg"
+            stored = await blob_store.put(
+                file_data, ext, max_size_mb=self.settings.max_photo_size_mb
+            )
+            blob_store.hold(self.session_repository.session, stored)
+        # Duplicates share the variants rendered for the first upload
+        if not os.path.exists(image_processor.variant_path(stored.path, "thumb")):
+            await image_processor.generate_variants(stored.path)
+
+        return SessionPhoto(
             session_id=session_id,
             filename=filename,
-            filepath=filepath,
+            filepath=stored.path,
+            content_hash=stored.sha256,
         )
 
-        return photo
+    async def _save_photo(
+        self,
+        session_id: str,
+        filename: str,
+        file_data: bytes | AsyncReadable,
+    ) -> SessionPhoto:
+        """Save a photo file and create record."""
+        photo = await self._store_photo(session_id, filename, file_data)
+        return await self.session_repository.add_photo(
+            session_id=session_id,
+            filename=photo.filename,
+            filepath=photo.filepath,
+            content_hash=photo.content_hash,
+        )
 
-    def get_photo_url(self, photo: SessionPhoto) -> str:
+    @staticmethod
+    def get_photo_url(photo: SessionPhoto) -> str:
         """Get URL for a photo."""
         # Return relative path for API serving
         return f"/api/v1/photos/{photo.session_id}/{os.path.basename(photo.filepath)}"
+
+    @staticmethod
+    def get_photo_variant_urls(photo: SessionPhoto) -> dict[str, str]:
+        """Get URLs of the resized variants of a photo, by variant name."""
+        url = SessionService.get_photo_url(photo)
+        return {variant: f"{url}?size={variant}" for variant in PHOTO_VARIANTS}
@@ -0,0 +1,93 @@
+"""Delta sync service: what changed since a client's cursor."""
+
+from collections.abc import Collection
+
+from src.domain.entities.change import CHANGE_DELETE
+from src.domain.exceptions import SyncCursorExpiredError
+from src.infrastructure.database.repositories import (
+    ChangeLogRepository,
+    PaiementRepository,
+    PatientRepository,
+    ScheduleRepository,
+    SessionRepository,
+    WaitingQueueRepository,
+)
+
+
+class SyncService:
+    """Service reading the change log for clients keeping local caches current.
+
+    A cursor is the version of the last change a client has applied.
+    Versions follow commit order (see ``ChangeLogModel``), so a change never
+    becomes visible below a cursor already handed out.
+    """
+
+    def __init__(
+        self,
+        change_log_repo: ChangeLogRepository,
+        patient_repo: PatientRepository,
+        schedule_repo: ScheduleRepository,
+        queue_repo: WaitingQueueRepository,
+        session_repo: SessionRepository,
+        paiement_repo: PaiementRepository,
+        page_size: int = 500,
+    ):
+        self.change_log_repo = change_log_repo
+        self.page_size = page_size
+        self._finders = {
+            "patient": patient_repo.find_by_ids,
+            "schedule": schedule_repo.find_by_ids,
+            "queue": queue_repo.find_by_ids,
+            "session": session_repo.find_by_ids,
+            "payment": paiement_repo.find_by_ids,
+        }
+
+    async def get_changes(self, since: int | None, entities: Collection[str]) -> dict:
+        """Rows of ``entities`` written after cursor ``since``.
+
+        Without a cursor, only the current cursor is returned: clients take
+        it before loading their full lists. Returns dict with 'cursor',
+        'has_more', 'changed' (current rows by entity) and 'deleted' (IDs by
+        entity). A row changed several times is returned once.
+
+        Raises:
+            SyncCursorExpiredError: ``since`` is older than the kept change
+                log or newer than any change.
+        """
+        if since is None:
+            cursor = await self.change_log_repo.latest_version()
+            return {"cursor": cursor, "has_more": False, "changed": {}, "deleted": {}}
+
+        # Pruning keeps its horizon, so only cursors below it missed changes
+        oldest = await self.change_log_repo.oldest_version()
+        if since > 0 and (oldest is None or since < oldest):
+            raise SyncCursorExpiredError()
+        if since > await self.change_log_repo.latest_version():
+            raise SyncCursorExpiredError()
+
+        changes = await self.change_log_repo.find_since(since, self.page_size)
+
+        # Last operation of each row, for the entities the caller may see
+        latest: dict[str, dict[str, str]] = {}
+        for change in changes:
+            if change.entity in entities:
+                latest.setdefault(change.entity, {})[change.entity_id] = change.op
+
+        changed: dict[str, list] = {}
+        deleted: dict[str, list[str]] = {}
+        for entity, ops in latest.items():
+            upserted = [entity_id for entity_id, op in ops.items() if op != CHANGE_DELETE]
+            rows = await self._finders[entity](upserted)
+            found = {row.id for row in rows}
+            gone = [entity_id for entity_id, op in ops.items() if entity_id not in found]
+            if rows:
+                changed[entity] = rows
+            if gone:
+                deleted[entity] = gone
+
+        return {
+            "cursor": changes[-1].version if changes else since,
+            "has_more": len(changes) == self.page_size,
+            "changed": changed,
+            "deleted": deleted,
+        }
@@ -0,0 +1,235 @@
+"""Streaming-aware response compression middleware."""
+
+import zlib
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+DEFAULT_COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/csv",
+    "text/css",
+    "text/html",
+    "text/plain",
+    "text/xml",
+)
+
+# Never compressed: SSE must reach the client event by event.
+EXCLUDED_TYPES = ("text/event-stream",)
+
+
+def available_encodings() -> list[str]:
+    """Encodings supported in this process, in order of preference."""
+    encodings = []
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    encodings.append("gzip")
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported: list[str]) -> str | None:
+    """Pick the preferred supported encoding accepted by the client."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+
+    wildcard = accepted.get("*")
+    for encoding in supported:
+        quality = accepted.get(encoding, wildcard)
+        if quality is not None and quality > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Incremental compressor with a sync flush per chunk."""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._obj: Any = brotli.Compressor(quality=min(level, 11))
+        elif encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode it now."""
+        if self.encoding == "br":
+            return self._obj.process(data) + self._obj.flush()
+        if self.encoding == "zstd":
+            return self._obj.compress(data) + self._obj.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """Terminate the compressed stream."""
+        if self.encoding == "br":
+            return self._obj.finish()
+        if self.encoding == "zstd":
+            return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Compress allowlisted responses with br, zstd or gzip.
+
+    Single-body responses under ``minimum_size`` are sent as-is. Every
+    response of an allowlisted type carries ``Vary: Accept-Encoding``,
+    compressed or not, so a shared cache never serves one client's
+    encoding to another. Streaming
+    responses (CSV exports) are compressed chunk by chunk and flushed
+    immediately, so nothing is buffered. Server-sent events and responses
+    that already carry a Content-Encoding are passed through untouched.
+
+    Must be registered innermost (added first) so it sees the original
+    response body rather than the re-chunked output of BaseHTTPMiddleware.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        level: int = 6,
+        compressible_types: tuple[str, ...] = DEFAULT_COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.compressible_types = compressible_types
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        if scope["method"] != "HEAD":
+            encoding = negotiate_encoding(
+                Headers(scope=scope).get("accept-encoding", ""), self.encodings
+            )
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """Mark the ETag weak: the encoded bytes differ from the representation it names."""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressionResponder:
+    """Per-request state for CompressionMiddleware."""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str | None, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+
+    def _is_compressible(self, headers: Headers, status: int) -> bool:
+        if status < 200 or status in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if not content_type or content_type in EXCLUDED_TYPES:
+            return False
+        return content_type in self.middleware.compressible_types
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=message["headers"])
+            compressible = self._is_compressible(headers, message["status"])
+            if compressible:
+                # The body depends on Accept-Encoding even when sent as-is
+                headers.add_vary_header("Accept-Encoding")
+            elif message["status"] == 304 and self.encoding is not None:
+                # Same validator as the compressed 200 it revalidates
+                _weaken_etag(headers)
+            self.passthrough = not compressible or self.encoding is None
+            if self.passthrough:
+                await self.downstream(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+
+            if not more_body:
+                # Whole body known up front: honour the size threshold.
+                if len(body) < self.middleware.minimum_size:
+                    self.passthrough = True
+                    await self.downstream(start)
+                    await self.downstream(message)
+                    return
+                compressor = _Compressor(self.encoding, self.middleware.level)
+                body = compressor.compress(body) + compressor.finish()
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                _weaken_etag(headers)
+                await self.downstream(start)
+                await self.downstream({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming body: compress and flush chunk by chunk.
+            self.compressor = _Compressor(self.encoding, self.middleware.level)
+            headers["Content-Encoding"] = self.encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            _weaken_etag(headers)
+            await self.downstream(start)
+
+        if self.compressor is None:
+            await self.downstream(message)
+            return
+
+        data = self.compressor.compress(body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        await self.downstream(
+            {"type": "http.response.body", "body": data, "more_body": more_body}
+        )
@@ -37,7 +37,28 @@ class Settings(BaseSettings):
     # File Storage
     photos_path: str = "./data/photos"
     max_photo_size_mb: int = 10
-    photo_quality: int = 85
+    photo_quality: int = 85  # Quality of the resized photo variants
+    photo_variant_format: Literal["webp", "jpeg"] = "webp"
+    image_workers: int = 2  # Processes rendering photo variants
+    temp_photo_max_age_hours: float = 24.0
+    temp_photo_cleanup_interval_seconds: float = 900.0  # 0 disables the janitor
+    # nginx internal location mapped to photos_path (e.g. "/protected-files/");
+    # when set, files are sent with X-Accel-Redirect instead of by the worker
+    file_accel_redirect_prefix: str = ""
+
+    # Generated documents
+    pdf_cache_path: str = "./data/pdf-cache"
+    pdf_cache_entries: int = 128  # Rendered PDFs kept in memory
+    pdf_workers: int = 2  # Processes rendering PDF documents
+    qr_cache_entries: int = 512  # Rendered QR images kept in memory
+
+    # Patient overview
+    overview_concurrency: int = 4  # Sections loaded in parallel (one connection each)
+
+    # Delta sync
+    sync_page_size: int = 500  # Changes read per /sync call
+    change_log_retention_days: float = 7.0  # Older cursors must do a full refresh
+    change_log_cleanup_interval_seconds: float = 3600.0  # 0 disables the janitor
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3420"]
@@ -53,6 +74,13 @@ class Settings(BaseSettings):
     rate_limit_per_minute: int = 60
     rate_limit_login_per_minute: int = 5
 
+    # Performance
+    fast_json_responses: bool = False  # Render JSON with orjson when installed
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024  # Bytes; smaller bodies are sent as-is
+    compression_level: int = 6
+    reference_sync_interval_seconds: float = 5.0  # Cross-worker cache check; 0 disables
+
     @model_validator(mode="after")
     def validate_settings(self) -> "Settings":
         if self.environment == "production":
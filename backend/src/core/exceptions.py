@@ -2,7 +2,7 @@
 
 import structlog
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 
 logger = structlog.get_logger()
@@ -59,6 +59,17 @@ class BadRequestError(AppHTTPException):
         super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
 
 
+class NotModifiedError(AppHTTPException):
+    """Conditional GET matched the current ETag (304)."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            detail="Non modifié",
+            headers=headers,
+        )
+
+
 async def validation_exception_handler(request: Request, exc: ValidationError) -> JSONResponse:
     """Handle Pydantic validation errors."""
     errors = []
@@ -81,8 +92,10 @@ async def validation_exception_handler(request: Request, exc: ValidationError) -
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handle HTTP exceptions."""
+    if exc.status_code == status.HTTP_304_NOT_MODIFIED:
+        return Response(status_code=exc.status_code, headers=exc.headers)
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail},
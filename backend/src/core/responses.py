@@ -0,0 +1,129 @@
+"""Fast JSON response classes and stored file responses."""
+
+import json
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from typing import Any
+from urllib.parse import quote
+
+from fastapi import Request
+from fastapi.responses import FileResponse, JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available.
+
+    Falls back to a compact stdlib ``json.dumps`` so the class can be used
+    unconditionally as ``default_response_class``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class PydanticResponse(Response):
+    """Response serialized directly by pydantic-core.
+
+    Returning this from an endpoint skips FastAPI's response_model
+    re-validation and ``jsonable_encoder`` pass, which dominate the cost of
+    large list payloads. Keep ``response_model`` on the route for OpenAPI.
+
+    Pass ``adapter`` for a typed container (``list[PatientResponse]``);
+    anything else is serialized by an adapter built for its runtime type.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        adapter: TypeAdapter | None = None,
+    ) -> None:
+        self._adapter = adapter
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        adapter = self._adapter or TypeAdapter(type(content))
+        return adapter.dump_json(content)
+
+
+# Stored files never change behind their URL (content-addressed or written
+# once), so browsers may keep them for a year without revalidating.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def file_response(
+    request: Request,
+    path: str,
+    etag: str | None = None,
+    media_type: str | None = None,
+    filename: str | None = None,
+) -> Response:
+    """Serve a stored file with validators, 304 and Range support.
+
+    ``etag`` should be the content hash when known; otherwise one is derived
+    from the file's mtime and size. Conditional requests are answered here
+    with 304. With ``file_accel_redirect_prefix`` set, the body is left to
+    nginx (which also handles Range); otherwise Starlette streams it.
+    """
+    stat_result = os.stat(path)
+    etag = f'"{etag or f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+    }
+    if _not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    prefix = get_settings().file_accel_redirect_prefix
+    if not prefix:
+        return FileResponse(
+            path,
+            media_type=media_type,
+            filename=filename,
+            headers=headers,
+            stat_result=stat_result,
+        )
+
+    photos_root = os.path.realpath(get_settings().photos_path)
+    relative = os.path.relpath(os.path.realpath(path), photos_root)
+    headers["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(relative)
+    if filename is not None:
+        headers["Content-Disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+    media_type = media_type or guess_type(filename or path)[0] or "application/octet-stream"
+    return Response(media_type=media_type, headers=headers)
+
+
+def _not_modified(request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+        return any(tag in (etag, "*") for tag in tags)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
@@ -24,3 +24,30 @@ class Alert:
     def is_warning(self) -> bool:
         """Check if alert is a warning."""
         return self.severity == "warning"
+
+
+@dataclass
+class AlertSummary:
+    """Alert counts for a patient."""
+
+    patient_id: str
+    alert_count: int = 0
+    error_count: int = 0
+    warning_count: int = 0
+
+    @property
+    def has_alerts(self) -> bool:
+        return self.alert_count > 0
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error_count > 0
+
+    @classmethod
+    def from_alerts(cls, patient_id: str, alerts: list[Alert]) -> "AlertSummary":
+        return cls(
+            patient_id=patient_id,
+            alert_count=len(alerts),
+            error_count=sum(1 for a in alerts if a.is_error),
+            warning_count=sum(1 for a in alerts if a.is_warning),
+        )
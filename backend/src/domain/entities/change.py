@@ -0,0 +1,19 @@
+"""Change log domain entity."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+# Change operations
+CHANGE_UPSERT = "upsert"
+CHANGE_DELETE = "delete"
+
+
+@dataclass
+class Change:
+    """A write to a synced entity; ``version`` orders changes and is the sync cursor."""
+
+    entity: str  # patient, schedule, queue, session, payment
+    entity_id: str
+    op: str  # upsert, delete
+    version: int = 0
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
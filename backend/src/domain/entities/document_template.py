@@ -0,0 +1,16 @@
+"""Document template domain entity."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import uuid4
+
+
+@dataclass
+class DocumentTemplate:
+    """Customized content of a generated PDF document."""
+
+    document_type: str  # 'consent', 'rules', 'precautions'
+    content: dict
+    updated_by: str | None = None
+    id: str = field(default_factory=lambda: str(uuid4()))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
@@ -26,3 +26,15 @@ class Paiement:
     date_paiement: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
     id: str = field(default_factory=lambda: str(uuid4()))
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
+
+
+@dataclass
+class PaymentMethod:
+    """Configurable payment method."""
+
+    nom: str
+    is_active: bool = True
+    ordre: int = 0
+    id: str = field(default_factory=lambda: str(uuid4()))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
@@ -50,3 +50,18 @@ class Patient:
     def full_name(self) -> str:
         """Return full name."""
         return f"{self.prenom} {self.nom}"
+
+
+@dataclass
+class PatientDocument:
+    """Document (photo, scan) uploaded to a patient profile."""
+
+    patient_id: str
+    filename: str
+    filepath: str
+    content_type: str
+    size_bytes: int
+    description: str | None = None
+    content_hash: str | None = None
+    id: str = field(default_factory=lambda: str(uuid4()))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
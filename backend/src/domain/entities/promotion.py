@@ -1,5 +1,6 @@
 """Promotion domain entity."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from uuid import uuid4
@@ -25,14 +26,15 @@ class Promotion:
     @property
     def is_currently_active(self) -> bool:
         """Check if promotion is currently active based on dates."""
+        return self.is_active_on(date.today())
+
+    def is_active_on(self, day: date) -> bool:
+        """Check if promotion is active on a given day."""
         if not self.is_active:
             return False
-        today = date.today()
-        if self.date_debut and today < self.date_debut:
-            return False
-        if self.date_fin and today > self.date_fin:
+        if self.date_debut and day < self.date_debut:
             return False
-        return True
+        return not (self.date_fin and day > self.date_fin)
 
     def applies_to_zone(self, zone_id: str) -> bool:
         """Check if promotion applies to a specific zone."""
@@ -47,3 +49,52 @@ class Promotion:
             return max(0, int(original_price - discount))
         else:  # montant
             return max(0, int(original_price - self.valeur))
+
+
+@dataclass(frozen=True)
+class PricingIndex:
+    """Promotions in effect on a day, compiled per zone.
+
+    Each zone maps to the promotions that apply to it, best discount first
+    at the zone's catalog price. Zones without a zone-specific promotion
+    share the all-zones list.
+    """
+
+    day: date
+    by_zone: dict[str, tuple[Promotion, ...]]
+    all_zones: tuple[Promotion, ...]
+
+    @classmethod
+    def build(
+        cls,
+        promotions: Iterable[Promotion],
+        zone_prices: dict[str, int | None],
+        day: date,
+    ) -> "PricingIndex":
+        active = [p for p in promotions if p.is_active_on(day)]
+        all_zones = tuple(p for p in active if not p.zone_ids)
+        by_zone: dict[str, tuple[Promotion, ...]] = {}
+        for zone_id in {z for p in active for z in p.zone_ids}:
+            price = zone_prices.get(zone_id) or 0
+            applicable = [p for p in active if p.applies_to_zone(zone_id)]
+            applicable.sort(key=lambda p: p.calculate_discount(price))
+            by_zone[zone_id] = tuple(applicable)
+        if all_zones:
+            for zone_id, price in zone_prices.items():
+                if zone_id not in by_zone:
+                    by_zone[zone_id] = tuple(
+                        sorted(all_zones, key=lambda p: p.calculate_discount(price or 0))
+                    )
+        return cls(day=day, by_zone=by_zone, all_zones=all_zones)
+
+    def promotions_for(self, zone_id: str) -> tuple[Promotion, ...]:
+        """Promotions applying to a zone, best first."""
+        return self.by_zone.get(zone_id, self.all_zones)
+
+    def price(self, zone_id: str, original_price: int) -> tuple[int, tuple[Promotion, ...]]:
+        """Best price of a zone and the promotions applying to it."""
+        applicable = self.promotions_for(zone_id)
+        final_price = min(
+            (p.calculate_discount(original_price) for p in applicable), default=original_price
+        )
+        return final_price, applicable
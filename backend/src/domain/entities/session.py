@@ -20,6 +20,7 @@ class SessionPhoto:
     session_id: str
     filename: str
     filepath: str
+    content_hash: str | None = None
     id: str = field(default_factory=lambda: str(uuid4()))
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
 
@@ -11,6 +11,7 @@ class SideEffectPhoto:
 
     filename: str
     filepath: str
+    content_hash: str | None = None
     id: str = field(default_factory=lambda: str(uuid4()))
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC).replace(tzinfo=None))
 
@@ -126,6 +126,14 @@ class ImmutableSessionError(BusinessRuleError):
         super().__init__("Les séances ne peuvent pas être modifiées après création")
 
 
+class FileTooLargeError(BusinessRuleError):
+    """Uploaded file exceeds the configured size limit."""
+
+    def __init__(self, max_size_mb: int) -> None:
+        self.max_size_mb = max_size_mb
+        super().__init__(f"Fichier trop volumineux (max {max_size_mb}MB)")
+
+
 class CannotDeleteSystemRoleError(BusinessRuleError):
     """Attempt to delete a system role."""
 
@@ -164,6 +172,15 @@ class SystemRoleError(BusinessRuleError):
         super().__init__(f"Le rôle système {role_name} ne peut pas être modifié ou supprimé")
 
 
+class SyncCursorExpiredError(BusinessRuleError):
+    """Sync cursor is older than the kept change log (or unknown)."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Curseur de synchronisation expiré, rechargez les données complètes"
+        )
+
+
 # Authentication Errors
 class AuthenticationError(DomainError):
     """Authentication related errors."""
@@ -0,0 +1,5 @@
+# Cache module
+from src.infrastructure.cache.catalog import ReferenceCatalog, reference_catalog
+from src.infrastructure.cache.versions import TableVersions, table_versions
+
+__all__ = ["ReferenceCatalog", "TableVersions", "reference_catalog", "table_versions"]
@@ -0,0 +1,209 @@
+"""Process-wide cache of small reference tables."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.box import Box, BoxAssignment
+from src.domain.entities.document_template import DocumentTemplate
+from src.domain.entities.pack import Pack
+from src.domain.entities.paiement import PaymentMethod
+from src.domain.entities.promotion import PricingIndex, Promotion
+from src.domain.entities.question import Question
+from src.domain.entities.role import Role
+from src.domain.entities.zone import ZoneDefinition
+from src.infrastructure.cache.versions import has_pending_writes, table_versions
+from src.infrastructure.database.connection import async_session_factory
+from src.infrastructure.database.models import ReferenceVersionModel
+from src.infrastructure.database.repositories import (
+    BoxAssignmentRepository,
+    BoxRepository,
+    DocumentTemplateRepository,
+    PackRepository,
+    PaymentMethodRepository,
+    PromotionRepository,
+    QuestionRepository,
+    RoleRepository,
+    ZoneDefinitionRepository,
+)
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    version: tuple[int, ...]
+    items: dict[str, Any]
+
+
+class ReferenceCatalog:
+    """Lazily loaded, id-keyed snapshots of reference tables.
+
+    A snapshot is valid while the versions of the tables it was loaded from
+    are current. Versions are bumped on commit in this process
+    (write-through) and, for writes made by other workers, by
+    ``sync_versions`` polling the trigger-maintained ``reference_versions``
+    table.
+
+    Cached entities are shared between requests and must not be mutated.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, _Snapshot] = {}
+        self._remote_versions: dict[str, int] | None = None
+        self._pricing: tuple[tuple, PricingIndex] | None = None
+
+    async def _get(
+        self,
+        table: str,
+        session: AsyncSession,
+        load: Callable[[], Awaitable[list[Any]]],
+        joins: tuple[str, ...] = (),
+    ) -> dict[str, Any]:
+        """Snapshot of ``table``, also reloaded when a table in ``joins`` changes."""
+        tables = (table, *joins)
+        # A session with uncommitted writes must see them, and they must not
+        # leak into the shared cache.
+        if any(has_pending_writes(session.sync_session, t) for t in tables):
+            return {item.id: item for item in await load()}
+
+        version = tuple(table_versions.get(t) for t in tables)
+        snapshot = self._snapshots.get(table)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot.items
+
+        items = {item.id: item for item in await load()}
+        self._snapshots[table] = _Snapshot(version=version, items=items)
+        return items
+
+    async def zones(self, repo: ZoneDefinitionRepository) -> dict[str, ZoneDefinition]:
+        """All zone definitions (active and inactive) by id, in display order."""
+        return await self._get(
+            "zone_definitions", repo.session, lambda: repo.find_all(include_inactive=True)
+        )
+
+    async def zone_names(self, repo: ZoneDefinitionRepository) -> dict[str, str]:
+        """Zone definition names by id."""
+        return {zone_id: zone.nom for zone_id, zone in (await self.zones(repo)).items()}
+
+    async def questions(self, repo: QuestionRepository) -> dict[str, Question]:
+        """All questions (active and inactive) by id, ordered by ``ordre``."""
+        return await self._get(
+            "questions", repo.session, lambda: repo.find_all(include_inactive=True)
+        )
+
+    async def active_questions(self, repo: QuestionRepository) -> list[Question]:
+        """Active questions ordered by ``ordre``."""
+        return [q for q in (await self.questions(repo)).values() if q.is_active]
+
+    async def boxes(self, repo: BoxRepository) -> dict[str, Box]:
+        """All boxes (active and inactive) by id."""
+        return await self._get(
+            "boxes", repo.session, lambda: repo.find_all(include_inactive=True)
+        )
+
+    async def box_assignments(self, repo: BoxAssignmentRepository) -> dict[str, BoxAssignment]:
+        """Current box assignments by box id, with box and user names."""
+        assignments = await self._get(
+            "box_assignments", repo.session, repo.get_all_assignments, joins=("boxes", "users")
+        )
+        return {a.box_id: a for a in assignments.values()}
+
+    async def payment_methods(self, repo: PaymentMethodRepository) -> dict[str, PaymentMethod]:
+        """All payment methods by id, ordered by ``ordre`` then name."""
+        return await self._get("payment_methods", repo.session, repo.find_all)
+
+    async def roles(self, repo: RoleRepository) -> dict[str, Role]:
+        """All roles by id."""
+        return await self._get("roles", repo.session, repo.find_all)
+
+    async def promotions(self, repo: PromotionRepository) -> dict[str, Promotion]:
+        """All promotions (active and inactive) by id, newest first."""
+        return await self._get(
+            "promotions", repo.session, lambda: repo.find_all(include_inactive=True)
+        )
+
+    async def packs(self, repo: PackRepository) -> dict[str, Pack]:
+        """All packs (active and inactive) by id, newest first."""
+        return await self._get("packs", repo.session, lambda: repo.find_all(include_inactive=True))
+
+    async def pricing_index(
+        self,
+        promotion_repo: PromotionRepository,
+        zone_repo: ZoneDefinitionRepository,
+    ) -> PricingIndex:
+        """Today's promotions compiled per zone.
+
+        Rebuilt when promotions or zone prices change, and when the day turns
+        (promotions start and end on dates).
+        """
+        # Taken before loading, so a concurrent write can only cause a rebuild
+        key = (
+            date.today(),
+            table_versions.get("promotions"),
+            table_versions.get("zone_definitions"),
+        )
+        session = promotion_repo.session.sync_session
+        shared = not any(
+            has_pending_writes(session, t) for t in ("promotions", "zone_definitions")
+        )
+        if shared and self._pricing is not None and self._pricing[0] == key:
+            return self._pricing[1]
+
+        promotions = await self.promotions(promotion_repo)
+        zones = await self.zones(zone_repo)
+        index = PricingIndex.build(
+            promotions.values(), {z.id: z.prix for z in zones.values()}, key[0]
+        )
+        if shared:
+            self._pricing = (key, index)
+        return index
+
+    async def document_templates(
+        self, repo: DocumentTemplateRepository
+    ) -> dict[str, DocumentTemplate]:
+        """Customized document templates by document type."""
+        templates = await self._get("document_templates", repo.session, repo.find_all)
+        return {t.document_type: t for t in templates.values()}
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._pricing = None
+
+    async def sync_versions(self, session: AsyncSession) -> list[str]:
+        """Pick up reference writes committed by other workers.
+
+        Returns the tables whose local version was bumped.
+        """
+        result = await session.execute(select(ReferenceVersionModel))
+        remote = {row.table_name: row.version for row in result.scalars()}
+        previous, self._remote_versions = self._remote_versions, remote
+        if previous is None:
+            return []
+
+        changed = [t for t, v in remote.items() if previous.get(t) != v]
+        if changed:
+            table_versions.bump(*changed)
+        return changed
+
+    async def watch(self, interval: float) -> None:
+        """Poll ``reference_versions`` forever (run as a background task)."""
+        while True:
+            try:
+                async with async_session_factory() as session:
+                    await self.sync_versions(session)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("reference_versions_sync_failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+
+# Singleton instance
+reference_catalog = ReferenceCatalog()
@@ -0,0 +1,84 @@
+"""Per-table version counters for reference data."""
+
+import hashlib
+from collections import defaultdict
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Session.info key holding tables written in the current transaction
+PENDING_TABLES_KEY = "touched_tables"
+
+
+class TableVersions:
+    """In-memory version counters, bumped after each commit touching a table.
+
+    Counters restart at zero with the process, so ETags embed a per-process
+    epoch to never match a tag issued before a restart.
+    """
+
+    def __init__(self):
+        self.epoch = uuid4().hex[:12]
+        self._versions: dict[str, int] = defaultdict(int)
+
+    def get(self, table: str) -> int:
+        return self._versions[table]
+
+    def bump(self, *tables: str) -> None:
+        for table in tables:
+            self._versions[table] += 1
+
+    def etag(self, tables: tuple[str, ...], variant: str = "") -> str:
+        """Strong ETag for the current versions of ``tables``."""
+        parts = [self.epoch] + [f"{t}:{self._versions[t]}" for t in tables]
+        if variant:
+            parts.append(variant)
+        digest = hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+        return f'"{digest}"'
+
+
+# Singleton instance
+table_versions = TableVersions()
+
+
+def has_pending_writes(session: Session, table_name: str) -> bool:
+    """Whether the session's open transaction has written (or will write) a table."""
+    if table_name in session.info.get(PENDING_TABLES_KEY, ()):
+        return True
+    return any(
+        getattr(getattr(obj, "__table__", None), "name", None) == table_name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+def _touch(session: Session, table_name: str) -> None:
+    session.info.setdefault(PENDING_TABLES_KEY, set()).add(table_name)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, _flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            _touch(session, table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(state: ORMExecuteState) -> None:
+    if state.is_update or state.is_delete or state.is_insert:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _touch(state.session, table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session: Session) -> None:
+    tables = session.info.pop(PENDING_TABLES_KEY, None)
+    if tables:
+        table_versions.bump(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session: Session) -> None:
+    session.info.pop(PENDING_TABLES_KEY, None)
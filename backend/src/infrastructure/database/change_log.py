@@ -0,0 +1,44 @@
+"""Pruning of the change log behind the delta sync API."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from src.infrastructure.database.connection import async_session_factory
+from src.infrastructure.database.repositories import ChangeLogRepository
+
+logger = structlog.get_logger()
+
+
+class ChangeLogJanitor:
+    """Deletes changes older than the retention window.
+
+    Clients whose cursor predates the kept log get a 410 from ``/sync`` and
+    reload their lists in full.
+    """
+
+    async def prune(self, retention_days: float) -> int:
+        """Delete changes older than ``retention_days``; returns how many."""
+        cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=retention_days)
+        async with async_session_factory() as session:
+            deleted = await ChangeLogRepository(session).delete_before(cutoff)
+            await session.commit()
+        return deleted
+
+    async def watch(self, interval: float, retention_days: float) -> None:
+        """Prune the change log forever (run as a background task)."""
+        while True:
+            try:
+                deleted = await self.prune(retention_days)
+                if deleted:
+                    logger.info("change_log_pruned", count=deleted)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("change_log_prune_failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+
+# Singleton instance
+change_log_janitor = ChangeLogJanitor()
@@ -1,8 +1,9 @@
 """Database connection and session management."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
+import structlog
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -13,6 +14,16 @@ from sqlalchemy.orm import DeclarativeBase
 
 from src.core.config import settings
 
+logger = structlog.get_logger()
+
+# Session.info key of the callbacks run once the request's transaction ends
+AFTER_TRANSACTION_KEY = "after_transaction"
+
+if settings.database_url.startswith("sqlite"):
+    from sqlalchemy.dialects.sqlite import insert as _dialect_insert
+else:
+    from sqlalchemy.dialects.postgresql import insert as _dialect_insert
+
 # Create async engine with appropriate settings for database type
 _engine_kwargs = {
     "echo": settings.debug,
@@ -48,15 +59,36 @@ class Base(DeclarativeBase):
     pass
 
 
+def upsert_insert(entity):
+    """INSERT supporting ``on_conflict_do_update`` for the configured database."""
+    return _dialect_insert(entity)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide database session with automatic commit/rollback."""
     async with async_session_factory() as session:
+        committed = False
         try:
             yield session
             await session.commit()
+            committed = True
         except Exception:
             await session.rollback()
             raise
+        finally:
+            for callback in session.info.pop(AFTER_TRANSACTION_KEY, ()):
+                try:
+                    await callback(committed)
+                except Exception:
+                    logger.warning("after_transaction_failed", exc_info=True)
+
+
+def after_transaction(
+    session: AsyncSession,
+    callback: Callable[[bool], Awaitable[None]],
+) -> None:
+    """Run ``callback(committed)`` once the request's transaction has ended."""
+    session.info.setdefault(AFTER_TRANSACTION_KEY, []).append(callback)
 
 
 # Type alias for dependency injection
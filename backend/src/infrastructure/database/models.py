@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     CheckConstraint,
     Date,
@@ -267,6 +268,7 @@ class SessionPhotoModel(Base):
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     filepath: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: _utcnow())
 
     # Relationships
@@ -434,12 +436,35 @@ class SideEffectPhotoModel(Base):
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     filepath: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: _utcnow())
 
     # Relationships
     side_effect: Mapped["SessionSideEffectModel"] = relationship(back_populates="photos")
 
 
+class PatientAlertStateModel(Base):
+    """Precomputed alert counts per patient.
+
+    Every patient has a row. ``version`` is bumped whenever a session, side
+    effect or pre-consultation of the patient changes; counts are valid
+    while ``computed_version`` matches it, and only on the day they were
+    computed (spacing alerts depend on the current date).
+    """
+
+    __tablename__ = "patient_alert_state"
+
+    patient_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True
+    )
+    alert_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    warning_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    computed_on: Mapped[date | None] = mapped_column(Date, nullable=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    computed_version: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
+
 class PackModel(Base):
     """Subscription packs (Gold, custom packs)."""
 
@@ -591,6 +616,15 @@ class BoxAssignmentModel(Base):
     assigned_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=lambda: _utcnow())
 
 
+class ReferenceVersionModel(Base):
+    """Write counters for reference tables, bumped by database triggers."""
+
+    __tablename__ = "reference_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
 class DailyScheduleModel(Base):
     """Daily schedule entries from Excel upload."""
 
@@ -656,6 +690,34 @@ class WaitingQueueModel(Base):
     )
 
 
+class QueueCounterModel(Base):
+    """Last waiting queue position handed out on each day."""
+
+    __tablename__ = "queue_counters"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    last_position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ChangeLogModel(Base):
+    """Writes to synced tables, replayed by clients catching up through /sync."""
+
+    __tablename__ = "change_log"
+
+    # Increasing sync cursor (SQLite only autoincrements INTEGER primary keys).
+    # On PostgreSQL a deferred trigger renumbers entries at commit, so versions
+    # follow commit order (migration 033); SQLite has a single writer.
+    version: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    op: Mapped[str] = mapped_column(String(10), nullable=False)  # upsert, delete
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=lambda: _utcnow(), index=True
+    )
+
+
 class PatientDocumentModel(Base):
     """Uploaded documents (photos/scans) attached to a patient profile."""
 
@@ -670,6 +732,7 @@ class PatientDocumentModel(Base):
     )
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     filepath: Mapped[str] = mapped_column(String(500), nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     content_type: Mapped[str] = mapped_column(String(100), nullable=False)
     size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -1,15 +1,31 @@
 """Database repositories."""
 
+from src.infrastructure.database.repositories.alert_state_repository import (
+    PatientAlertStateRepository,
+)
+from src.infrastructure.database.repositories.blob_repository import (
+    BlobReferenceRepository,
+)
 from src.infrastructure.database.repositories.box_repository import (
     BoxAssignmentRepository,
     BoxRepository,
 )
+from src.infrastructure.database.repositories.change_log_repository import (
+    ChangeLogRepository,
+)
+from src.infrastructure.database.repositories.document_template_repository import (
+    DocumentTemplateRepository,
+)
 from src.infrastructure.database.repositories.pack_repository import (
     PackRepository,
     PatientSubscriptionRepository,
 )
 from src.infrastructure.database.repositories.paiement_repository import (
     PaiementRepository,
+    PaymentMethodRepository,
+)
+from src.infrastructure.database.repositories.patient_document_repository import (
+    PatientDocumentRepository,
 )
 from src.infrastructure.database.repositories.patient_repository import (
     PatientRepository,
@@ -42,11 +58,14 @@ from src.infrastructure.database.repositories.zone_repository import (
 )
 
 __all__ = [
+    "BlobReferenceRepository",
     "BoxRepository",
     "BoxAssignmentRepository",
+    "ChangeLogRepository",
     "RoleRepository",
     "UserRepository",
     "PatientRepository",
+    "PatientDocumentRepository",
     "ZoneDefinitionRepository",
     "PatientZoneRepository",
     "QuestionRepository",
@@ -54,9 +73,12 @@ __all__ = [
     "SessionRepository",
     "PreConsultationRepository",
     "SideEffectRepository",
+    "DocumentTemplateRepository",
     "PackRepository",
     "PatientSubscriptionRepository",
     "PaiementRepository",
+    "PaymentMethodRepository",
+    "PatientAlertStateRepository",
     "PromotionRepository",
     "ScheduleRepository",
     "WaitingQueueRepository",
@@ -0,0 +1,137 @@
+"""Patient alert state repository implementation."""
+
+from datetime import date
+
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as OrmSession
+
+from src.domain.entities.alert import AlertSummary
+from src.infrastructure.database.connection import engine, upsert_insert
+from src.infrastructure.database.models import (
+    PatientAlertStateModel,
+    PatientModel,
+    PreConsultationModel,
+    PreConsultationZoneModel,
+    SessionModel,
+    SessionSideEffectModel,
+)
+
+
+class PatientAlertStateRepository:
+    """Repository for precomputed patient alert counts."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_current(
+        self, patient_id: str, today: date
+    ) -> tuple[AlertSummary | None, int | None]:
+        """Alert counts of a patient if still valid, and the current state version.
+
+        The version is None when the patient has no state row; counts are
+        then never saved.
+        """
+        result = await self.session.execute(
+            select(PatientAlertStateModel).where(
+                PatientAlertStateModel.patient_id == patient_id
+            )
+        )
+        db_state = result.scalar_one_or_none()
+        if db_state is None:
+            return None, None
+        valid = db_state.computed_on == today and db_state.computed_version == db_state.version
+        return (self._to_entity(db_state) if valid else None), db_state.version
+
+    async def save(self, summary: AlertSummary, today: date, version: int) -> bool:
+        """Store counts computed from state ``version``.
+
+        Nothing is written if an alert source changed since ``version`` was
+        read, so counts computed from outdated data are never kept. Returns
+        True if the counts were stored.
+        """
+        result = await self.session.execute(
+            update(PatientAlertStateModel)
+            .where(
+                PatientAlertStateModel.patient_id == summary.patient_id,
+                PatientAlertStateModel.version == version,
+            )
+            .values(
+                alert_count=summary.alert_count,
+                error_count=summary.error_count,
+                warning_count=summary.warning_count,
+                computed_on=today,
+                computed_version=version,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def _to_entity(self, model: PatientAlertStateModel) -> AlertSummary:
+        """Convert model to entity."""
+        return AlertSummary(
+            patient_id=model.patient_id,
+            alert_count=model.alert_count,
+            error_count=model.error_count,
+            warning_count=model.warning_count,
+        )
+
+
+def bump_alert_state_version(session: OrmSession, _flush_context) -> None:
+    """Create state rows and bump versions for flushed alert sources.
+
+    On PostgreSQL, triggers (migration 032) do this for every statement,
+    ORM or not; this listener covers other databases for ORM writes.
+    """
+    connection = session.connection()
+
+    new_patient_ids = [obj.id for obj in session.new if isinstance(obj, PatientModel)]
+    patient_ids: set[str] = set()
+    session_ids: set[str] = set()
+    pre_consultation_ids: set[str] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, SessionModel | PreConsultationModel):
+            if obj.patient_id:
+                patient_ids.add(obj.patient_id)
+        elif isinstance(obj, SessionSideEffectModel):
+            session_ids.add(obj.session_id)
+        elif isinstance(obj, PreConsultationZoneModel):
+            pre_consultation_ids.add(obj.pre_consultation_id)
+
+    state = PatientAlertStateModel.__table__
+    if new_patient_ids:
+        connection.execute(
+            upsert_insert(state).on_conflict_do_nothing(index_elements=["patient_id"]),
+            [
+                {"patient_id": patient_id, "alert_count": 0, "error_count": 0,
+                 "warning_count": 0, "version": 0}
+                for patient_id in new_patient_ids
+            ],
+        )
+
+    conditions = []
+    if patient_ids:
+        conditions.append(state.c.patient_id.in_(patient_ids))
+    if session_ids:
+        conditions.append(
+            state.c.patient_id.in_(
+                select(SessionModel.patient_id).where(SessionModel.id.in_(session_ids))
+            )
+        )
+    if pre_consultation_ids:
+        conditions.append(
+            state.c.patient_id.in_(
+                select(PreConsultationModel.patient_id).where(
+                    PreConsultationModel.id.in_(pre_consultation_ids)
+                )
+            )
+        )
+    for condition in conditions:
+        connection.execute(
+            update(state).where(condition).values(version=state.c.version + 1)
+        )
+
+
+# PostgreSQL bumps versions by trigger; only other databases need the listener
+if engine.dialect.name != "postgresql":
+    event.listen(OrmSession, "after_flush", bump_alert_state_version)
@@ -0,0 +1,31 @@
+"""Blob reference repository implementation."""
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    PatientDocumentModel,
+    SessionPhotoModel,
+    SideEffectPhotoModel,
+)
+
+# Models whose rows point at blobs through their content_hash
+BLOB_REFERENCES = (SessionPhotoModel, SideEffectPhotoModel, PatientDocumentModel)
+
+
+class BlobReferenceRepository:
+    """Counts the rows that reference a stored blob."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def count(self, content_hash: str) -> int:
+        """Count references to a blob across photos and patient documents."""
+        references = union_all(
+            *(
+                select(model.id).where(model.content_hash == content_hash)
+                for model in BLOB_REFERENCES
+            )
+        ).subquery()
+        result = await self.session.execute(select(func.count()).select_from(references))
+        return result.scalar() or 0
@@ -103,7 +103,7 @@ class BoxAssignmentRepository:
         db = BoxAssignmentModel(box_id=box_id, user_id=user_id)
         self.session.add(db)
         await self.session.flush()
-        return await self._to_entity(db)
+        return await self._find_one(BoxAssignmentModel.id == db.id)  # type: ignore
 
     async def unassign_user(self, user_id: str) -> bool:
         result = await self.session.execute(
@@ -117,29 +117,14 @@ class BoxAssignmentRepository:
         return True
 
     async def get_by_user(self, user_id: str) -> BoxAssignment | None:
-        result = await self.session.execute(
-            select(BoxAssignmentModel).where(BoxAssignmentModel.user_id == user_id)
-        )
-        db = result.scalar_one_or_none()
-        if not db:
-            return None
-        return await self._to_entity(db)
+        return await self._find_one(BoxAssignmentModel.user_id == user_id)
 
     async def get_by_box(self, box_id: str) -> BoxAssignment | None:
-        result = await self.session.execute(
-            select(BoxAssignmentModel).where(BoxAssignmentModel.box_id == box_id)
-        )
-        db = result.scalar_one_or_none()
-        if not db:
-            return None
-        return await self._to_entity(db)
+        return await self._find_one(BoxAssignmentModel.box_id == box_id)
 
     async def get_all_assignments(self) -> list[BoxAssignment]:
-        result = await self.session.execute(select(BoxAssignmentModel))
-        assignments = []
-        for db in result.scalars():
-            assignments.append(await self._to_entity(db))
-        return assignments
+        result = await self.session.execute(self._select())
+        return [self._to_entity(row) for row in result]
 
     async def is_box_available(self, box_id: str) -> bool:
         result = await self.session.execute(
@@ -147,27 +132,34 @@ class BoxAssignmentRepository:
         )
         return result.scalar_one_or_none() is None
 
-    async def _to_entity(self, model: BoxAssignmentModel) -> BoxAssignment:
-        # Fetch box name
-        box_result = await self.session.execute(
-            select(BoxModel.nom).where(BoxModel.id == model.box_id)
+    async def _find_one(self, condition) -> BoxAssignment | None:
+        result = await self.session.execute(self._select().where(condition))
+        row = result.one_or_none()
+        return self._to_entity(row) if row else None
+
+    def _select(self):
+        """Assignments with their box and user names, in one joined query."""
+        return (
+            select(
+                BoxAssignmentModel.id,
+                BoxAssignmentModel.box_id,
+                BoxAssignmentModel.user_id,
+                BoxAssignmentModel.assigned_at,
+                BoxModel.nom.label("box_nom"),
+                UserModel.nom.label("user_nom"),
+                UserModel.prenom.label("user_prenom"),
+            )
+            .outerjoin(BoxModel, BoxModel.id == BoxAssignmentModel.box_id)
+            .outerjoin(UserModel, UserModel.id == BoxAssignmentModel.user_id)
         )
-        box_nom = box_result.scalar_one_or_none() or ""
-
-        # Fetch user name
-        user_result = await self.session.execute(
-            select(UserModel.nom, UserModel.prenom).where(UserModel.id == model.user_id)
-        )
-        user_row = user_result.one_or_none()
-        user_nom = user_row[0] if user_row else ""
-        user_prenom = user_row[1] if user_row else ""
 
+    def _to_entity(self, row) -> BoxAssignment:
         return BoxAssignment(
-            id=model.id,
-            box_id=model.box_id,
-            user_id=model.user_id,
-            box_nom=box_nom,
-            user_nom=user_nom,
-            user_prenom=user_prenom,
-            assigned_at=model.assigned_at,
+            id=row.id,
+            box_id=row.box_id,
+            user_id=row.user_id,
+            box_nom=row.box_nom or "",
+            user_nom=row.user_nom or "",
+            user_prenom=row.user_prenom or "",
+            assigned_at=row.assigned_at,
         )
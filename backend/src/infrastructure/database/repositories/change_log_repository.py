@@ -0,0 +1,121 @@
+"""Change log repository implementation."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.entities.change import CHANGE_DELETE, CHANGE_UPSERT, Change
+from src.infrastructure.database.models import ChangeLogModel
+
+# Synced tables and the entity name their changes are logged under
+SYNCED_TABLES = {
+    "patients": "patient",
+    "daily_schedules": "schedule",
+    "waiting_queue": "queue",
+    "sessions": "session",
+    "paiements": "payment",
+}
+
+
+class ChangeLogRepository:
+    """Repository for the change log of synced entities.
+
+    Inserts, updates and deletes of mapped objects are logged automatically
+    when the session flushes. Repositories writing synced tables with bulk
+    statements, which bypass the unit of work, call ``record`` themselves.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def record(self, entity: str, entity_ids: list[str], op: str) -> None:
+        """Log a change of each entity in one statement."""
+        if entity_ids:
+            await self.session.execute(
+                insert(ChangeLogModel), _change_rows(entity, entity_ids, op)
+            )
+
+    async def find_since(self, version: int, limit: int) -> list[Change]:
+        """Changes after ``version`` in version order."""
+        result = await self.session.execute(
+            select(ChangeLogModel)
+            .where(ChangeLogModel.version > version)
+            .order_by(ChangeLogModel.version)
+            .limit(limit)
+        )
+        return [self._to_entity(c) for c in result.scalars()]
+
+    async def latest_version(self) -> int:
+        """Version of the last logged change (0 if none)."""
+        result = await self.session.execute(select(func.max(ChangeLogModel.version)))
+        return result.scalar() or 0
+
+    async def oldest_version(self) -> int | None:
+        """Version of the oldest change still kept, or None if the log is empty."""
+        result = await self.session.execute(select(func.min(ChangeLogModel.version)))
+        return result.scalar()
+
+    async def delete_before(self, created_at: datetime) -> int:
+        """Drop changes older than the last one logged before ``created_at``.
+
+        That last change is kept as the horizon: every deleted change has a
+        lower version, so a cursor at or above the oldest kept version missed
+        none of them. Versions have gaps, so the horizon cannot be inferred
+        from the kept versions alone. Returns how many changes were deleted.
+        """
+        horizon = (
+            select(func.max(ChangeLogModel.version))
+            .where(ChangeLogModel.created_at < created_at)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(ChangeLogModel).where(ChangeLogModel.version < horizon)
+        )
+        return result.rowcount
+
+    def _to_entity(self, model: ChangeLogModel) -> Change:
+        """Convert model to entity."""
+        return Change(
+            entity=model.entity,
+            entity_id=model.entity_id,
+            op=model.op,
+            version=model.version,
+            created_at=model.created_at,
+        )
+
+
+def _change_rows(entity: str, entity_ids: list[str], op: str) -> list[dict]:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    return [
+        {"entity": entity, "entity_id": entity_id, "op": op, "created_at": now}
+        for entity_id in dict.fromkeys(entity_ids)
+    ]
+
+
+@event.listens_for(Session, "after_flush")
+def _log_flushed_changes(session: Session, _flush_context) -> None:
+    changes: dict[tuple[str, str], str] = {}
+    for objects, op in (
+        (session.new, CHANGE_UPSERT),
+        (session.dirty, CHANGE_UPSERT),
+        (session.deleted, CHANGE_DELETE),
+    ):
+        for obj in objects:
+            table = getattr(obj, "__table__", None)
+            entity = SYNCED_TABLES.get(table.name) if table is not None else None
+            if entity is None:
+                continue
+            if op == CHANGE_UPSERT and obj in session.dirty and not session.is_modified(obj):
+                continue
+            changes[(entity, obj.id)] = op
+    if changes:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        session.connection().execute(
+            insert(ChangeLogModel.__table__),
+            [
+                {"entity": entity, "entity_id": entity_id, "op": op, "created_at": now}
+                for (entity, entity_id), op in changes.items()
+            ],
+        )
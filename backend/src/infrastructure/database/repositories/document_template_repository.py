@@ -0,0 +1,29 @@
+"""Document template repository implementation."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.document_template import DocumentTemplate
+from src.infrastructure.database.models import DocumentTemplateModel
+
+
+class DocumentTemplateRepository:
+    """Repository for customized document templates."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_all(self) -> list[DocumentTemplate]:
+        """Find all customized templates."""
+        result = await self.session.execute(select(DocumentTemplateModel))
+        return [self._to_entity(t) for t in result.scalars()]
+
+    def _to_entity(self, model: DocumentTemplateModel) -> DocumentTemplate:
+        """Convert model to entity."""
+        return DocumentTemplate(
+            id=model.id,
+            document_type=model.document_type,
+            content=model.content,
+            updated_by=model.updated_by,
+            updated_at=model.updated_at,
+        )
@@ -0,0 +1,29 @@
+"""Bulk reordering shared by repositories of ordered entities."""
+
+from sqlalchemy import case, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def reorder(
+    session: AsyncSession,
+    model: type,
+    ids: list[str],
+    column: str = "ordre",
+) -> int:
+    """Set ``column`` of each row to its position in ``ids``, in one UPDATE.
+
+    Rows not listed keep their position; unknown IDs are ignored. A repeated
+    ID takes its last position. Objects already loaded in the session are
+    not refreshed. Returns the number of rows updated.
+    """
+    positions = {row_id: index for index, row_id in enumerate(ids)}
+    if not positions:
+        return 0
+    stmt = (
+        update(model)
+        .where(model.id.in_(positions))
+        .values({column: case(positions, value=model.id)})
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return result.rowcount
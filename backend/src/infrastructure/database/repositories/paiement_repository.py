@@ -6,8 +6,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from src.domain.entities.paiement import Paiement
-from src.infrastructure.database.models import PaiementModel
+from src.domain.entities.paiement import Paiement, PaymentMethod
+from src.infrastructure.database.models import PaiementModel, PaymentMethodModel
 
 
 class PaiementRepository:
@@ -43,6 +43,17 @@ class PaiementRepository:
         db = result.unique().scalar_one_or_none()
         return self._to_entity(db) if db else None
 
+    async def find_by_ids(self, paiement_ids: list[str]) -> list[Paiement]:
+        """Find payments by ID (missing IDs are skipped)."""
+        if not paiement_ids:
+            return []
+        result = await self.session.execute(
+            select(PaiementModel)
+            .options(joinedload(PaiementModel.patient))
+            .where(PaiementModel.id.in_(paiement_ids))
+        )
+        return [self._to_entity(p) for p in result.unique().scalars()]
+
     async def find_by_patient(self, patient_id: str) -> list[Paiement]:
         result = await self.session.execute(
             select(PaiementModel)
@@ -136,3 +147,26 @@ class PaiementRepository:
             date_paiement=model.date_paiement,
             created_at=model.created_at,
         )
+
+
+class PaymentMethodRepository:
+    """Repository for payment method operations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_all(self) -> list[PaymentMethod]:
+        result = await self.session.execute(
+            select(PaymentMethodModel).order_by(PaymentMethodModel.ordre, PaymentMethodModel.nom)
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
+    def _to_entity(self, model: PaymentMethodModel) -> PaymentMethod:
+        return PaymentMethod(
+            id=model.id,
+            nom=model.nom,
+            is_active=model.is_active,
+            ordre=model.ordre,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
@@ -0,0 +1,37 @@
+"""Patient document repository implementation."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.patient import PatientDocument
+from src.infrastructure.database.models import PatientDocumentModel
+
+
+class PatientDocumentRepository:
+    """Repository for documents uploaded to patient profiles."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_by_patient(self, patient_id: str) -> list[PatientDocument]:
+        """Documents of a patient, newest first."""
+        result = await self.session.execute(
+            select(PatientDocumentModel)
+            .where(PatientDocumentModel.patient_id == patient_id)
+            .order_by(PatientDocumentModel.created_at.desc())
+        )
+        return [self._to_entity(d) for d in result.scalars()]
+
+    def _to_entity(self, model: PatientDocumentModel) -> PatientDocument:
+        """Convert model to entity."""
+        return PatientDocument(
+            id=model.id,
+            patient_id=model.patient_id,
+            filename=model.filename,
+            filepath=model.filepath,
+            content_type=model.content_type,
+            size_bytes=model.size_bytes,
+            description=model.description,
+            content_hash=model.content_hash,
+            created_at=model.created_at,
+        )
@@ -46,6 +46,16 @@ class PatientRepository(PatientRepositoryInterface):
         db_patient = result.scalar_one_or_none()
         return self._to_entity(db_patient) if db_patient else None
 
+    async def find_by_ids(self, patient_ids: list[str]) -> list[Patient]:
+        """Find patients by ID, in the order of ``patient_ids`` (missing IDs are skipped)."""
+        if not patient_ids:
+            return []
+        result = await self.session.execute(
+            select(PatientModel).where(PatientModel.id.in_(patient_ids))
+        )
+        by_id = {p.id: p for p in result.scalars()}
+        return [self._to_entity(by_id[pid]) for pid in patient_ids if pid in by_id]
+
     async def find_by_phone(self, phone: str) -> list[Patient]:
         """Find patients by phone number (normalized digit comparison)."""
         digits = re.sub(r"\D", "", phone)
@@ -75,6 +85,16 @@ class PatientRepository(PatientRepositoryInterface):
         db_patient = result.scalar_one_or_none()
         return self._to_entity(db_patient) if db_patient else None
 
+    async def find_by_card_prefix(self, prefix: str, limit: int) -> list[Patient]:
+        """Find patients whose card code starts with ``prefix``, by card code."""
+        result = await self.session.execute(
+            select(PatientModel)
+            .where(PatientModel.code_carte.startswith(prefix, autoescape=True))
+            .order_by(PatientModel.code_carte)
+            .limit(limit)
+        )
+        return [self._to_entity(p) for p in result.scalars()]
+
     async def search(
         self,
         query: str,
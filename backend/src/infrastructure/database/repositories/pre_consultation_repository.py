@@ -92,6 +92,13 @@ class PreConsultationRepository:
         db_pre_consultation = result.scalar_one_or_none()
         return self._to_entity(db_pre_consultation) if db_pre_consultation else None
 
+    async def exists(self, pre_consultation_id: str) -> bool:
+        """Check whether a pre-consultation exists, without loading it."""
+        result = await self.session.execute(
+            select(PreConsultationModel.id).where(PreConsultationModel.id == pre_consultation_id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def find_by_patient_id(self, patient_id: str) -> PreConsultation | None:
         """Find pre-consultation by patient ID."""
         result = await self.session.execute(
@@ -110,6 +117,44 @@ class PreConsultationRepository:
         db_pre_consultation = result.scalars().first()
         return self._to_entity(db_pre_consultation) if db_pre_consultation else None
 
+    async def find_latest_by_patient_ids(
+        self, patient_ids: list[str]
+    ) -> dict[str, PreConsultation]:
+        """Find the latest pre-consultation of each patient.
+
+        Ranks pre-consultations per patient with a window function, so only
+        the latest row of each patient (and its zones) is loaded.
+        """
+        if not patient_ids:
+            return {}
+        ranked = (
+            select(
+                PreConsultationModel.id,
+                func.row_number()
+                .over(
+                    partition_by=PreConsultationModel.patient_id,
+                    order_by=PreConsultationModel.created_at.desc(),
+                )
+                .label("rank"),
+            )
+            .where(PreConsultationModel.patient_id.in_(patient_ids))
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(PreConsultationModel)
+            .options(
+                selectinload(PreConsultationModel.zones).selectinload(
+                    PreConsultationZoneModel.zone
+                ),
+                selectinload(PreConsultationModel.patient),
+                selectinload(PreConsultationModel.creator),
+                selectinload(PreConsultationModel.validator),
+            )
+            .join(ranked, PreConsultationModel.id == ranked.c.id)
+            .where(ranked.c.rank == 1)
+        )
+        return {model.patient_id: self._to_entity(model) for model in result.scalars()}
+
     async def find_all(
         self,
         page: int,
@@ -1,11 +1,16 @@
 """Question repository implementation."""
 
+from datetime import UTC, datetime
+from uuid import uuid4
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.domain.entities.question import Question, QuestionResponse
+from src.infrastructure.database.connection import upsert_insert
 from src.infrastructure.database.models import QuestionModel, QuestionResponseModel
+from src.infrastructure.database.repositories.ordering import reorder
 
 
 class QuestionRepository:
@@ -37,6 +42,15 @@ class QuestionRepository:
         db_question = result.scalar_one_or_none()
         return self._to_entity(db_question) if db_question else None
 
+    async def existing_ids(self, question_ids: set[str]) -> set[str]:
+        """IDs among ``question_ids`` that exist, active or not, in one query."""
+        if not question_ids:
+            return set()
+        result = await self.session.execute(
+            select(QuestionModel.id).where(QuestionModel.id.in_(question_ids))
+        )
+        return set(result.scalars())
+
     async def find_all(self, include_inactive: bool = False) -> list[Question]:
         """Get all questions."""
         query = select(QuestionModel).order_by(QuestionModel.ordre)
@@ -76,14 +90,7 @@ class QuestionRepository:
 
     async def update_order(self, question_ids: list[str]) -> list[Question]:
         """Update question order."""
-        for i, question_id in enumerate(question_ids):
-            result = await self.session.execute(
-                select(QuestionModel).where(QuestionModel.id == question_id)
-            )
-            db_question = result.scalar_one_or_none()
-            if db_question:
-                db_question.ordre = i
-        await self.session.flush()
+        await reorder(self.session, QuestionModel, question_ids)
         return await self.find_all(include_inactive=True)
 
     async def get_max_ordre(self) -> int:
@@ -112,29 +119,33 @@ class QuestionResponseRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def upsert(self, response: QuestionResponse) -> QuestionResponse:
-        """Create or update a question response."""
-        result = await self.session.execute(
-            select(QuestionResponseModel).where(
-                QuestionResponseModel.pre_consultation_id == response.pre_consultation_id,
-                QuestionResponseModel.question_id == response.question_id,
-            )
+    async def upsert_many(self, pre_consultation_id: str, answers: dict[str, dict]) -> None:
+        """Create or update the responses of a pre-consultation in one statement.
+
+        ``answers`` maps question IDs to responses. Existing rows are matched
+        on ``uq_preconsult_question``.
+        """
+        if not answers:
+            return
+        now = datetime.now(UTC).replace(tzinfo=None)
+        stmt = upsert_insert(QuestionResponseModel).values(
+            [
+                {
+                    "id": str(uuid4()),
+                    "pre_consultation_id": pre_consultation_id,
+                    "question_id": question_id,
+                    "reponse": reponse,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for question_id, reponse in answers.items()
+            ]
         )
-        db_response = result.scalar_one_or_none()
-
-        if db_response:
-            db_response.reponse = response.reponse
-        else:
-            db_response = QuestionResponseModel(
-                id=response.id,
-                pre_consultation_id=response.pre_consultation_id,
-                question_id=response.question_id,
-                reponse=response.reponse,
-            )
-            self.session.add(db_response)
-
-        await self.session.flush()
-        return await self.find_by_id(db_response.id)  # type: ignore
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["pre_consultation_id", "question_id"],
+            set_={"reponse": stmt.excluded.reponse, "updated_at": stmt.excluded.updated_at},
+        )
+        await self.session.execute(stmt)
 
     async def find_by_id(self, response_id: str) -> QuestionResponse | None:
         """Find response by ID."""
@@ -152,6 +163,7 @@ class QuestionResponseRepository:
             select(QuestionResponseModel)
             .options(joinedload(QuestionResponseModel.question))
             .where(QuestionResponseModel.pre_consultation_id == pre_consultation_id)
+            .execution_options(populate_existing=True)
         )
         return [self._to_entity(r) for r in result.unique().scalars()]
 
@@ -3,11 +3,18 @@
 import json
 from datetime import UTC, date, datetime
 
-from sqlalchemy import delete as sa_delete, func, or_, select
+from sqlalchemy import delete as sa_delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.entities.change import CHANGE_DELETE, CHANGE_UPSERT
 from src.domain.entities.schedule import DailyScheduleEntry, WaitingQueueEntry
-from src.infrastructure.database.models import DailyScheduleModel, WaitingQueueModel
+from src.infrastructure.database.connection import upsert_insert
+from src.infrastructure.database.models import (
+    DailyScheduleModel,
+    QueueCounterModel,
+    WaitingQueueModel,
+)
+from src.infrastructure.database.repositories.change_log_repository import ChangeLogRepository
 
 
 class ScheduleRepository:
@@ -57,6 +64,15 @@ class ScheduleRepository:
         db = result.scalar_one_or_none()
         return self._to_entity(db) if db else None
 
+    async def find_by_ids(self, entry_ids: list[str]) -> list[DailyScheduleEntry]:
+        """Entries with these IDs (missing IDs are skipped)."""
+        if not entry_ids:
+            return []
+        result = await self.session.execute(
+            select(DailyScheduleModel).where(DailyScheduleModel.id.in_(entry_ids))
+        )
+        return [self._to_entity(s) for s in result.scalars()]
+
     async def update_status(self, entry_id: str, status: str) -> DailyScheduleEntry | None:
         result = await self.session.execute(
             select(DailyScheduleModel).where(DailyScheduleModel.id == entry_id)
@@ -86,17 +102,67 @@ class ScheduleRepository:
         await self.session.flush()
         return self._to_entity(db)
 
-    async def delete_by_date(self, target_date: date) -> int:
-        """Delete all entries for a date (before re-upload)."""
+    async def find_by_dates(self, dates: list[date]) -> list[DailyScheduleEntry]:
+        """Entries of several dates, in one query."""
         result = await self.session.execute(
-            select(DailyScheduleModel).where(DailyScheduleModel.date == target_date)
+            select(DailyScheduleModel)
+            .where(DailyScheduleModel.date.in_(dates))
+            .order_by(DailyScheduleModel.date, DailyScheduleModel.start_time)
         )
-        entries = result.scalars().all()
-        count = len(entries)
-        for entry in entries:
-            await self.session.delete(entry)
-        await self.session.flush()
-        return count
+        return [self._to_entity(s) for s in result.scalars()]
+
+    async def update_batch(self, changes: list[dict]) -> int:
+        """Apply field changes (dicts holding ``id``) to still-expected entries.
+
+        Entries checked in since they were read are left alone: the
+        still-expected ones are locked first, then updated in one executemany
+        UPDATE (which cannot use RETURNING). Returns the number of entries changed.
+        """
+        if not changes:
+            return 0
+        result = await self.session.execute(
+            select(DailyScheduleModel.id)
+            .where(
+                DailyScheduleModel.id.in_([change["id"] for change in changes]),
+                DailyScheduleModel.status == "expected",
+            )
+            .with_for_update()
+        )
+        expected = set(result.scalars())
+        changes = [change for change in changes if change["id"] in expected]
+        if not changes:
+            return 0
+        now = datetime.now(UTC).replace(tzinfo=None)
+        await self.session.execute(
+            update(DailyScheduleModel)
+            .where(DailyScheduleModel.status == "expected")
+            .execution_options(synchronize_session=False),
+            [{**change, "updated_at": now} for change in changes],
+        )
+        await ChangeLogRepository(self.session).record(
+            "schedule", [change["id"] for change in changes], CHANGE_UPSERT
+        )
+        return len(changes)
+
+    async def delete_expected(self, entry_ids: list[str]) -> int:
+        """Delete still-expected entries in one statement.
+
+        Entries past ``expected`` may have waiting queue rows and are kept.
+        """
+        if not entry_ids:
+            return 0
+        result = await self.session.execute(
+            sa_delete(DailyScheduleModel)
+            .where(
+                DailyScheduleModel.id.in_(entry_ids),
+                DailyScheduleModel.status == "expected",
+            )
+            .returning(DailyScheduleModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = list(result.scalars())
+        await ChangeLogRepository(self.session).record("schedule", deleted, CHANGE_DELETE)
+        return len(deleted)
 
     async def delete_entry(self, entry_id: str) -> bool:
         """Delete a single schedule entry by ID, including linked queue entries."""
@@ -107,12 +173,17 @@ class ScheduleRepository:
         if not db:
             return False
         # Delete linked waiting queue entries first (FK constraint) using bulk DELETE
-        await self.session.execute(
-            sa_delete(WaitingQueueModel).where(WaitingQueueModel.schedule_id == entry_id)
+        queue_ids = await self.session.execute(
+            sa_delete(WaitingQueueModel)
+            .where(WaitingQueueModel.schedule_id == entry_id)
+            .returning(WaitingQueueModel.id)
         )
         await self.session.execute(
             sa_delete(DailyScheduleModel).where(DailyScheduleModel.id == entry_id)
         )
+        change_log = ChangeLogRepository(self.session)
+        await change_log.record("queue", list(queue_ids.scalars()), CHANGE_DELETE)
+        await change_log.record("schedule", [entry_id], CHANGE_DELETE)
         await self.session.flush()
         return True
 
@@ -161,14 +232,7 @@ class WaitingQueueRepository:
         self.session = session
 
     async def create(self, entry: WaitingQueueEntry) -> WaitingQueueEntry:
-        # Get next position
-        result = await self.session.execute(
-            select(func.max(WaitingQueueModel.position)).where(
-                WaitingQueueModel.status == "waiting"
-            )
-        )
-        max_pos = result.scalar() or 0
-        entry.position = max_pos + 1
+        entry.position = await self.next_position(date.today())
 
         db = WaitingQueueModel(
             id=entry.id,
@@ -187,6 +251,22 @@ class WaitingQueueRepository:
         await self.session.flush()
         return self._to_entity(db)
 
+    async def next_position(self, day: date) -> int:
+        """Hand out the next queue position of a day, atomically.
+
+        A single upsert increments the day's counter row and returns it, so
+        concurrent check-ins never share a position. The row stays locked
+        until the transaction ends; positions of rolled back check-ins are
+        skipped, which leaves gaps but keeps the order.
+        """
+        stmt = upsert_insert(QueueCounterModel).values(day=day, last_position=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day"],
+            set_={"last_position": QueueCounterModel.last_position + 1},
+        ).returning(QueueCounterModel.last_position)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     async def find_by_id(self, entry_id: str) -> WaitingQueueEntry | None:
         result = await self.session.execute(
             select(WaitingQueueModel).where(WaitingQueueModel.id == entry_id)
@@ -194,6 +274,15 @@ class WaitingQueueRepository:
         db = result.scalar_one_or_none()
         return self._to_entity(db) if db else None
 
+    async def find_by_ids(self, entry_ids: list[str]) -> list[WaitingQueueEntry]:
+        """Queue entries with these IDs (missing IDs are skipped)."""
+        if not entry_ids:
+            return []
+        result = await self.session.execute(
+            select(WaitingQueueModel).where(WaitingQueueModel.id.in_(entry_ids))
+        )
+        return [self._to_entity(q) for q in result.scalars()]
+
     async def find_active(self, doctor_id: str | None = None) -> list[WaitingQueueEntry]:
         today_start = datetime.combine(date.today(), datetime.min.time())
         query = select(WaitingQueueModel).where(
@@ -49,6 +49,7 @@ class SessionRepository(SessionRepositoryInterface):
                 session_id=session_entity.id,
                 filename=photo.filename,
                 filepath=photo.filepath,
+                content_hash=photo.content_hash,
             )
             self.session.add(db_photo)
 
@@ -70,6 +71,22 @@ class SessionRepository(SessionRepositoryInterface):
         db_session = result.unique().scalar_one_or_none()
         return self._to_entity(db_session) if db_session else None
 
+    async def find_by_ids(self, session_ids: list[str]) -> list[Session]:
+        """Find sessions by ID (missing IDs are skipped)."""
+        if not session_ids:
+            return []
+        result = await self.session.execute(
+            select(SessionModel)
+            .options(
+                joinedload(SessionModel.patient_zone).joinedload(PatientZoneModel.zone),
+                joinedload(SessionModel.praticien),
+                joinedload(SessionModel.patient),
+                joinedload(SessionModel.photos),
+            )
+            .where(SessionModel.id.in_(session_ids))
+        )
+        return [self._to_entity(s) for s in result.unique().scalars()]
+
     async def find_by_patient(
         self,
         patient_id: str,
@@ -101,20 +118,74 @@ class SessionRepository(SessionRepositoryInterface):
 
         return sessions, total
 
-    async def find_by_patient_with_zones(self, patient_id: str) -> list[Session]:
-        """Find all sessions for a patient (no pagination, for alert checks)."""
-        result = await self.session.execute(
-            select(SessionModel)
-            .where(SessionModel.patient_id == patient_id)
-            .options(
-                joinedload(SessionModel.patient_zone).joinedload(PatientZoneModel.zone),
-                joinedload(SessionModel.praticien),
-                joinedload(SessionModel.patient),
-                joinedload(SessionModel.photos),
+    def _last_session_per_zone_query(self, *conditions):
+        """Latest session per (patient, patient zone) with its zone name.
+
+        Ranks sessions with a window function (served by the
+        ``(patient_id, patient_zone_id, date_seance DESC)`` index) so only one
+        row per zone is joined to the zone tables.
+        """
+        ranked = (
+            select(
+                SessionModel.patient_id,
+                SessionModel.patient_zone_id,
+                SessionModel.date_seance,
+                func.row_number()
+                .over(
+                    partition_by=(SessionModel.patient_id, SessionModel.patient_zone_id),
+                    order_by=SessionModel.date_seance.desc(),
+                )
+                .label("rank"),
             )
-            .order_by(SessionModel.date_seance.desc())
+            .where(*conditions)
+            .subquery()
         )
-        return [self._to_entity(s) for s in result.unique().scalars()]
+        return (
+            select(
+                ranked.c.patient_id,
+                ranked.c.patient_zone_id,
+                ZoneDefinitionModel.nom,
+                ranked.c.date_seance,
+            )
+            .join(PatientZoneModel, ranked.c.patient_zone_id == PatientZoneModel.id)
+            .outerjoin(ZoneDefinitionModel, PatientZoneModel.zone_id == ZoneDefinitionModel.id)
+            .where(ranked.c.rank == 1)
+        )
+
+    async def find_last_session_per_zone(
+        self, patient_id: str
+    ) -> list[tuple[str, str, datetime]]:
+        """Last session date per zone of a patient.
+
+        Returns (patient_zone_id, zone_nom, last date_seance) tuples.
+        """
+        result = await self.session.execute(
+            self._last_session_per_zone_query(SessionModel.patient_id == patient_id)
+        )
+        return [
+            (patient_zone_id, zone_nom or "Zone inconnue", last_date)
+            for _, patient_zone_id, zone_nom, last_date in result.all()
+        ]
+
+    async def find_last_dates_per_zone(
+        self, patient_ids: list[str]
+    ) -> dict[str, dict[str, tuple[datetime, str]]]:
+        """Last session date per patient zone for many patients, in one query.
+
+        Returns {patient_id: {patient_zone_id: (last date_seance, zone_nom)}}.
+        """
+        if not patient_ids:
+            return {}
+        result = await self.session.execute(
+            self._last_session_per_zone_query(SessionModel.patient_id.in_(patient_ids))
+        )
+        last_dates: dict[str, dict[str, tuple[datetime, str]]] = {}
+        for patient_id, patient_zone_id, zone_nom, last_date in result.all():
+            last_dates.setdefault(patient_id, {})[patient_zone_id] = (
+                last_date,
+                zone_nom or "Zone inconnue",
+            )
+        return last_dates
 
     async def find_all(
         self,
@@ -296,7 +367,13 @@ class SessionRepository(SessionRepositoryInterface):
             db_session.notes = notes
             await self.session.flush()
 
-    async def add_photo(self, session_id: str, filename: str, filepath: str) -> SessionPhoto:
+    async def add_photo(
+        self,
+        session_id: str,
+        filename: str,
+        filepath: str,
+        content_hash: str | None = None,
+    ) -> SessionPhoto:
         """Add a photo to a session."""
         from uuid import uuid4
 
@@ -305,6 +382,7 @@ class SessionRepository(SessionRepositoryInterface):
             session_id=session_id,
             filename=filename,
             filepath=filepath,
+            content_hash=content_hash,
         )
         self.session.add(photo)
         await self.session.flush()
@@ -313,9 +391,27 @@ class SessionRepository(SessionRepositoryInterface):
             session_id=photo.session_id,
             filename=photo.filename,
             filepath=photo.filepath,
+            content_hash=photo.content_hash,
             created_at=photo.created_at,
         )
 
+    async def find_photos(self, session_id: str) -> list[SessionPhoto]:
+        """Find the photos of a session."""
+        result = await self.session.execute(
+            select(SessionPhotoModel).where(SessionPhotoModel.session_id == session_id)
+        )
+        return [
+            SessionPhoto(
+                id=p.id,
+                session_id=p.session_id,
+                filename=p.filename,
+                filepath=p.filepath,
+                content_hash=p.content_hash,
+                created_at=p.created_at,
+            )
+            for p in result.scalars()
+        ]
+
     def _to_entity(self, model: SessionModel) -> Session:
         """Convert model to entity."""
         photos = [
@@ -324,6 +420,7 @@ class SessionRepository(SessionRepositoryInterface):
                 session_id=p.session_id,
                 filename=p.filename,
                 filepath=p.filepath,
+                content_hash=p.content_hash,
                 created_at=p.created_at,
             )
             for p in model.photos
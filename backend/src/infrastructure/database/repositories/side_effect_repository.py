@@ -6,6 +6,7 @@ from sqlalchemy.orm import selectinload
 
 from src.domain.entities.side_effect import SideEffect, SideEffectPhoto
 from src.infrastructure.database.models import (
+    PatientZoneModel,
     SessionModel,
     SessionSideEffectModel,
     SideEffectPhotoModel,
@@ -36,6 +37,7 @@ class SideEffectRepository:
                 side_effect_id=side_effect.id,
                 filename=photo.filename,
                 filepath=photo.filepath,
+                content_hash=photo.content_hash,
             )
             self.session.add(db_photo)
 
@@ -79,19 +81,38 @@ class SideEffectRepository:
             .join(SessionModel)
             .options(
                 selectinload(SessionSideEffectModel.photos),
-                selectinload(SessionSideEffectModel.session).selectinload(
-                    SessionModel.patient_zone
-                ),
+                selectinload(SessionSideEffectModel.session)
+                .selectinload(SessionModel.patient_zone)
+                .selectinload(PatientZoneModel.zone),
             )
             .where(SessionModel.patient_id == patient_id)
             .order_by(SessionSideEffectModel.created_at.desc())
         )
         return [self._to_entity(se) for se in result.scalars()]
 
+    async def find_by_patients(self, patient_ids: list[str]) -> dict[str, list[SideEffect]]:
+        """Find side effects for many patients, grouped by patient (newest first)."""
+        if not patient_ids:
+            return {}
+        result = await self.session.execute(
+            select(SessionSideEffectModel)
+            .join(SessionModel)
+            .options(
+                selectinload(SessionSideEffectModel.photos),
+                selectinload(SessionSideEffectModel.session)
+                .selectinload(SessionModel.patient_zone)
+                .selectinload(PatientZoneModel.zone),
+            )
+            .where(SessionModel.patient_id.in_(patient_ids))
+            .order_by(SessionSideEffectModel.created_at.desc())
+        )
+        effects: dict[str, list[SideEffect]] = {}
+        for model in result.scalars():
+            effects.setdefault(model.session.patient_id, []).append(self._to_entity(model))
+        return effects
+
     async def find_by_zone(self, patient_id: str, zone_id: str) -> list[SideEffect]:
         """Find all side effects for a specific zone of a patient."""
-        from src.infrastructure.database.models import PatientZoneModel
-
         result = await self.session.execute(
             select(SessionSideEffectModel)
             .join(SessionModel)
@@ -117,6 +138,7 @@ class SideEffectRepository:
             side_effect_id=side_effect_id,
             filename=photo.filename,
             filepath=photo.filepath,
+            content_hash=photo.content_hash,
         )
         self.session.add(db_photo)
         await self.session.flush()
@@ -142,6 +164,7 @@ class SideEffectRepository:
                     id=p.id,
                     filename=p.filename,
                     filepath=p.filepath,
+                    content_hash=p.content_hash,
                     created_at=p.created_at,
                 )
                 for p in model.photos
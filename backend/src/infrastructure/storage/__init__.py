@@ -0,0 +1,15 @@
+# Storage module
+from src.infrastructure.storage.blobs import BlobStore, PinnedBlob, blob_store
+from src.infrastructure.storage.files import FileStorage, StoredFile, file_storage
+from src.infrastructure.storage.temp_photos import TempPhotoStore, temp_photos
+
+__all__ = [
+    "BlobStore",
+    "FileStorage",
+    "PinnedBlob",
+    "StoredFile",
+    "TempPhotoStore",
+    "blob_store",
+    "file_storage",
+    "temp_photos",
+]
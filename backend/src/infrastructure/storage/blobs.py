@@ -0,0 +1,277 @@
+"""Content-addressed blob store for photos and uploaded documents."""
+
+import asyncio
+import fcntl
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.infrastructure.database.connection import after_transaction
+from src.infrastructure.database.repositories import BlobReferenceRepository
+from src.infrastructure.storage.files import (
+    AsyncReadable,
+    FileStorage,
+    StoredFile,
+    file_storage,
+)
+
+settings = get_settings()
+
+# Seconds between attempts to take a digest lock held by another request
+LOCK_POLL_SECONDS = 0.01
+
+
+@dataclass(frozen=True)
+class PinnedBlob(StoredFile):
+    """A blob kept alive by a pin until the row referencing it is committed."""
+
+    pin: str = ""
+
+
+class BlobStore:
+    """Stores files once, under the SHA-256 of their content.
+
+    Blobs live in sharded directories (``ab/cd/abcd….jpg``) so no directory
+    grows unbounded. Blobs are keyed on the digest alone: the extension of
+    the first upload is kept in the name for serving, and storing the same
+    bytes again, whatever their extension, reuses that blob.
+
+    Rows of ``session_photos``, ``side_effect_photos`` and
+    ``patient_documents`` reference blobs by ``content_hash``. Everything
+    else holds a blob through a pin, a hard link in ``pins/``: a fresh blob
+    is pinned until the row referencing it is committed (see ``hold``), and
+    a temp photo, a symlink to its blob, pins it until it is attached or
+    discarded. A blob is removed once neither kind of reference is left.
+    Pinning, unpinning and removal take a per-digest file lock, shared by
+    every worker process, so a blob is never removed while being reused.
+    """
+
+    def __init__(self, root: str, storage: FileStorage):
+        self.root = root
+        self.storage = storage
+        self.pins_dir = os.path.join(root, "pins")
+        self.locks_dir = os.path.join(root, "locks")
+
+    def path_for(self, sha256: str, ext: str) -> str:
+        """Path of a new blob holding content with this digest."""
+        return os.path.join(self._shard(sha256), f"{sha256}{ext.lower()}")
+
+    def owns(self, path: str) -> bool:
+        """Whether a path is a blob (files stored before the blob store are not)."""
+        return os.path.commonpath([self.root, os.path.abspath(path)]) == self.root
+
+    def digest(self, path: str) -> str | None:
+        """SHA-256 of a blob, read from its name; None for files outside the store."""
+        return _digest(path) if self.owns(path) else None
+
+    async def put(
+        self,
+        source: bytes | AsyncReadable,
+        ext: str,
+        max_size_mb: int | None = None,
+    ) -> PinnedBlob:
+        """Store content, reusing the existing blob if it is already stored.
+
+        The blob comes back pinned: pass it to ``hold`` (or ``link``) so the
+        pin is dropped once something else references it.
+        """
+        incoming = os.path.join(self.root, "incoming", f"{uuid4().hex}{ext.lower()}")
+        stored = await self.storage.save(source, incoming, max_size_mb=max_size_mb)
+        pin = self._lease_path()
+        async with self._locked(stored.sha256):
+            path = await asyncio.to_thread(
+                _adopt, incoming, self._shard(stored.sha256), self.path_for(stored.sha256, ext)
+            )
+            await asyncio.to_thread(_pin, path, pin)
+        return PinnedBlob(path=path, size=stored.size, sha256=stored.sha256, pin=pin)
+
+    def hold(self, session: AsyncSession, blob: PinnedBlob) -> None:
+        """Keep a blob pinned until the session's transaction has ended.
+
+        If the row referencing it was rolled back, the blob is removed
+        unless something else uses it.
+        """
+
+        async def unpin(_committed: bool) -> None:
+            await self.unpin(blob, BlobReferenceRepository(session).count)
+
+        after_transaction(session, unpin)
+
+    async def unpin(
+        self,
+        blob: PinnedBlob,
+        count_references: Callable[[str], Awaitable[int]],
+    ) -> bool:
+        """Drop a blob's pin, removing it if nothing else references it."""
+        async with self._locked(blob.sha256):
+            await self.storage.remove(blob.pin)
+            return await self._release(blob.path, count_references)
+
+    async def link(self, blob: PinnedBlob, link_path: str) -> None:
+        """Point ``link_path`` at a blob, which the link's pin keeps alive.
+
+        The blob's pin becomes the link's, so no further ``unpin`` is needed.
+        """
+        async with self._locked(blob.sha256):
+            await asyncio.to_thread(
+                _link, blob.path, link_path, blob.pin, self._pin_path(link_path)
+            )
+
+    def resolve(self, link_path: str) -> str | None:
+        """Blob behind a link, or None if the link or its blob is gone."""
+        try:
+            target = os.readlink(link_path)
+        except OSError:
+            return None
+        path = os.path.normpath(os.path.join(os.path.dirname(link_path), target))
+        return path if os.path.exists(path) else None
+
+    async def pin_link(self, link_path: str) -> PinnedBlob | None:
+        """Pin the blob behind a link for a new reference; the link is kept."""
+        path = self.resolve(link_path)
+        if path is None:
+            return None
+        sha256 = _digest(path)
+        pin = self._lease_path()
+        async with self._locked(sha256):
+            try:
+                await asyncio.to_thread(_pin, path, pin)
+            except FileNotFoundError:
+                return None
+        size = await asyncio.to_thread(os.path.getsize, path)
+        return PinnedBlob(path=path, size=size, sha256=sha256, pin=pin)
+
+    async def unlink(
+        self,
+        link_path: str,
+        count_references: Callable[[str], Awaitable[int]],
+    ) -> bool:
+        """Remove a link and its pin, then the blob if nothing else references it."""
+        path = self.resolve(link_path)
+        if path is None:
+            await self.storage.remove(link_path)
+            await self.storage.remove(self._pin_path(link_path))
+            return False
+        async with self._locked(_digest(path)):
+            await self.storage.remove(link_path)
+            await self.storage.remove(self._pin_path(link_path))
+            return await self._release(path, count_references)
+
+    async def release(
+        self,
+        path: str,
+        count_references: Callable[[str], Awaitable[int]],
+    ) -> bool:
+        """Delete a blob and its photo variants once nothing references it.
+
+        ``count_references`` counts the committed rows still pointing at a
+        digest. Files stored before the blob store belong to a single row
+        and are deleted directly. Returns True if the file was removed.
+        """
+        if not self.owns(path):
+            return await self.storage.remove(path)
+        async with self._locked(_digest(path)):
+            return await self._release(path, count_references)
+
+    async def _release(
+        self,
+        path: str,
+        count_references: Callable[[str], Awaitable[int]],
+    ) -> bool:
+        """``release`` for a blob whose lock is held."""
+        try:
+            if os.stat(path).st_nlink > 1:  # pinned
+                return False
+        except FileNotFoundError:
+            return False
+        if await count_references(_digest(path)):
+            return False
+        # Imported here so the storage package does not pull in Pillow
+        from src.infrastructure.storage.images import PHOTO_VARIANTS, variant_path
+
+        for variant in PHOTO_VARIANTS:
+            await self.storage.remove(variant_path(path, variant, settings.photo_variant_format))
+        return await self.storage.remove(path)
+
+    @asynccontextmanager
+    async def _locked(self, sha256: str) -> AsyncIterator[None]:
+        """Hold the lock of a digest, shared by every worker process.
+
+        Digests share 256 lock files. The lock is polled rather than waited
+        for in a thread, so a cancelled request never leaves it held.
+        """
+        os.makedirs(self.locks_dir, exist_ok=True)
+        fd = os.open(os.path.join(self.locks_dir, sha256[:2]), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_SECONDS)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def _shard(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256[2:4])
+
+    def _lease_path(self) -> str:
+        return os.path.join(self.pins_dir, f"lease-{uuid4().hex}")
+
+    def _pin_path(self, link_path: str) -> str:
+        return os.path.join(self.pins_dir, os.path.basename(link_path))
+
+
+def _digest(path: str) -> str:
+    return os.path.basename(path).split(".", 1)[0]
+
+
+def _find(shard: str, sha256: str) -> str | None:
+    """The blob stored under a digest, whatever its extension."""
+    try:
+        names = os.listdir(shard)
+    except FileNotFoundError:
+        return None
+    for name in names:
+        if name.split(".", 1)[0] == sha256:
+            return os.path.join(shard, name)
+    return None
+
+
+def _adopt(incoming: str, shard: str, path: str) -> str:
+    """Move a freshly written file into place, or drop it if already stored."""
+    existing = _find(shard, _digest(path))
+    if existing is not None:
+        os.remove(incoming)
+        return existing
+    os.makedirs(shard, exist_ok=True)
+    os.replace(incoming, path)
+    return path
+
+
+def _pin(blob_path: str, pin_path: str) -> None:
+    os.makedirs(os.path.dirname(pin_path), exist_ok=True)
+    os.link(blob_path, pin_path)
+
+
+def _link(blob_path: str, link_path: str, lease_path: str, pin_path: str) -> None:
+    # The lease becomes the link's pin: the blob is never left unpinned
+    os.replace(lease_path, pin_path)
+    directory = os.path.dirname(link_path)
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{link_path}.{uuid4().hex}.part"
+    os.symlink(os.path.relpath(blob_path, directory), temp_path)
+    os.replace(temp_path, link_path)
+
+
+# Singleton instance
+blob_store = BlobStore(
+    root=os.path.abspath(os.path.join(settings.photos_path, "blobs")),
+    storage=file_storage,
+)
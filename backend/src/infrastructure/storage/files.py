@@ -0,0 +1,139 @@
+"""Chunked, atomic file storage kept off the event loop."""
+
+import asyncio
+import hashlib
+import os
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import BinaryIO, Protocol
+from uuid import uuid4
+
+from src.domain.exceptions import FileTooLargeError
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class AsyncReadable(Protocol):
+    """Anything with an async ``read(size)``, e.g. FastAPI's ``UploadFile``."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """A file written by FileStorage."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+class FileStorage:
+    """Writes uploads to disk without blocking the event loop.
+
+    Data is streamed in chunks to a temporary file next to the target, so
+    memory use is bounded by the chunk size and the size limit is enforced
+    as bytes arrive, and the SHA-256 of the content is computed on the way
+    through. The file is fsynced and atomically renamed into place:
+    readers never see a partial file. Blocking calls run in worker threads.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    async def save(
+        self,
+        source: bytes | AsyncReadable,
+        path: str,
+        max_size_mb: int | None = None,
+    ) -> StoredFile:
+        """Write ``source`` to ``path``, creating parent directories."""
+        max_bytes = max_size_mb * 1024 * 1024 if max_size_mb is not None else None
+        temp_path = f"{path}.{uuid4().hex}.part"
+        f = await asyncio.to_thread(_open_temp, temp_path)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in self._chunks(source):
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileTooLargeError(max_size_mb)
+                await asyncio.to_thread(_write, f, digest, chunk)
+            await asyncio.to_thread(_commit, f, temp_path, path)
+        except BaseException:
+            await asyncio.to_thread(_discard, f, temp_path)
+            raise
+        return StoredFile(path=path, size=size, sha256=digest.hexdigest())
+
+    async def read(self, path: str) -> bytes:
+        """Read a whole file."""
+        return await asyncio.to_thread(_read, path)
+
+    async def remove(self, path: str) -> bool:
+        """Delete a file; returns False if it did not exist."""
+        return await asyncio.to_thread(_remove, path)
+
+    async def _chunks(self, source: bytes | AsyncReadable) -> AsyncIterator[bytes]:
+        if isinstance(source, bytes | bytearray | memoryview):
+            view = memoryview(source)
+            for start in range(0, len(view), self.chunk_size):
+                yield view[start : start + self.chunk_size]
+            return
+        while chunk := await source.read(self.chunk_size):
+            yield chunk
+
+
+def _open_temp(temp_path: str) -> BinaryIO:
+    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+    return open(temp_path, "wb")  # noqa: SIM115 - closed by _commit/_discard
+
+
+def _write(f: BinaryIO, digest, chunk: bytes) -> None:
+    f.write(chunk)
+    digest.update(chunk)
+
+
+def _commit(f: BinaryIO, temp_path: str, path: str) -> None:
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+    os.replace(temp_path, path)
+    _fsync_dir(os.path.dirname(path))
+
+
+def _discard(f: BinaryIO, temp_path: str) -> None:
+    f.close()
+    with suppress(FileNotFoundError):
+        os.remove(temp_path)
+
+
+def _fsync_dir(directory: str) -> None:
+    """Persist the rename itself (no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+# Singleton instance
+file_storage = FileStorage()
@@ -0,0 +1,141 @@
+"""Resized photo variants rendered in a process pool."""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from uuid import uuid4
+
+import structlog
+
+from src.core.config import get_settings
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+# Variant name -> longest edge in pixels
+PHOTO_VARIANTS = {"thumb": 320, "medium": 1280}
+
+_FORMATS = {"webp": ("WEBP", "webp"), "jpeg": ("JPEG", "jpg")}
+
+
+def variant_path(original_path: str, variant: str, fmt: str = "webp") -> str:
+    """Where the ``variant`` of an original photo is stored."""
+    directory, name = os.path.split(original_path)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, "variants", f"{stem}.{variant}.{_FORMATS[fmt][1]}")
+
+
+def undecodable_marker(original_path: str) -> str:
+    """Marker left next to the variants of a file Pillow cannot decode."""
+    directory, name = os.path.split(original_path)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, "variants", f"{stem}.undecodable")
+
+
+def render_variants(original_path: str, quality: int, fmt: str) -> list[str]:
+    """Write every variant of a photo (runs in a worker process).
+
+    EXIF orientation is applied to the pixels, and no metadata is copied to
+    the variants. Files Pillow cannot decode (PDF, HEIC) get no variants.
+    """
+    # Imported here so only worker processes load Pillow
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    pil_format = _FORMATS[fmt][0]
+    written: list[str] = []
+    try:
+        source = Image.open(original_path)
+    except UnidentifiedImageError:
+        return written
+    with source:
+        image = ImageOps.exif_transpose(source)
+        if pil_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+            has_alpha = "A" in image.getbands() or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha and pil_format == "WEBP" else "RGB")
+
+        for variant, edge in PHOTO_VARIANTS.items():
+            target = variant_path(original_path, variant, fmt)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            resized = image.copy()
+            resized.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            # Unique per render: the same variant may be rendered concurrently
+            temp_path = f"{target}.{uuid4().hex}.part"
+            try:
+                resized.save(temp_path, format=pil_format, quality=quality)
+                os.replace(temp_path, target)
+            except BaseException:
+                with suppress(FileNotFoundError):
+                    os.remove(temp_path)
+                raise
+            written.append(target)
+    return written
+
+
+class ImageProcessor:
+    """Renders photo variants without blocking the event loop.
+
+    Decoding and resizing are CPU-bound, so they run in a small process pool
+    (created on first use) rather than in threads.
+    """
+
+    def __init__(self, max_workers: int, quality: int, fmt: str):
+        self.max_workers = max_workers
+        self.quality = quality
+        self.fmt = fmt
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def variant_path(self, original_path: str, variant: str) -> str:
+        return variant_path(original_path, variant, self.fmt)
+
+    async def generate_variants(self, original_path: str) -> bool:
+        """Render all variants; returns False if the file is not a readable image.
+
+        Files that cannot be decoded are marked so they are not retried.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            written = await loop.run_in_executor(
+                self._pool(), render_variants, original_path, self.quality, self.fmt
+            )
+        except Exception:
+            logger.warning("photo_variants_failed", path=original_path, exc_info=True)
+            return False
+        if not written:
+            marker = undecodable_marker(original_path)
+            os.makedirs(os.path.dirname(marker), exist_ok=True)
+            open(marker, "w").close()
+        return bool(written)
+
+    async def ensure_variant(self, original_path: str, variant: str) -> str | None:
+        """Path of a variant, rendering it first for photos uploaded before variants existed."""
+        path = self.variant_path(original_path, variant)
+        if os.path.exists(path):
+            return path
+        if os.path.exists(undecodable_marker(original_path)):
+            return None
+        if os.path.exists(original_path) and await self.generate_variants(original_path):
+            return path
+        return None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+image_processor = ImageProcessor(
+    max_workers=settings.image_workers,
+    quality=settings.photo_quality,
+    fmt=settings.photo_variant_format,
+)
@@ -0,0 +1,130 @@
+"""Temp photos uploaded before the session they belong to exists."""
+
+import asyncio
+import os
+import re
+import time
+from uuid import uuid4
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import get_settings
+from src.infrastructure.database.connection import after_transaction, async_session_factory
+from src.infrastructure.database.repositories import BlobReferenceRepository
+from src.infrastructure.storage.blobs import BlobStore, PinnedBlob, blob_store
+from src.infrastructure.storage.files import AsyncReadable
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+TEMP_PHOTO_ID = re.compile(r"[0-9a-f]{32}")
+
+
+class TempPhotoStore:
+    """Temp photos addressed by ID.
+
+    A temp photo is a link named after its ID pointing at its blob, so every
+    lookup is a path computation rather than a directory scan. Expired
+    photos are removed by ``watch``, run as a background task.
+    """
+
+    def __init__(self, directory: str, blobs: BlobStore):
+        self.directory = directory
+        self.blobs = blobs
+
+    def path(self, photo_id: str) -> str | None:
+        """Link of a temp photo, or None for a malformed ID."""
+        if not isinstance(photo_id, str) or not TEMP_PHOTO_ID.fullmatch(photo_id):
+            return None
+        return os.path.join(self.directory, photo_id)
+
+    async def create(
+        self,
+        source: bytes | AsyncReadable,
+        ext: str,
+        max_size_mb: int | None = None,
+    ) -> str:
+        """Store a temp photo and return its ID."""
+        photo_id = uuid4().hex
+        blob = await self.blobs.put(source, ext, max_size_mb=max_size_mb)
+        await self.blobs.link(blob, os.path.join(self.directory, photo_id))
+        return photo_id
+
+    def resolve(self, photo_id: str) -> str | None:
+        """File of a temp photo, or None if it does not exist."""
+        path = self.path(photo_id)
+        return self.blobs.resolve(path) if path else None
+
+    async def claim(self, session: AsyncSession, photo_id: str) -> PinnedBlob | None:
+        """Take a temp photo to attach it to a session.
+
+        It stops being a temp photo once the session's transaction commits;
+        if it is rolled back, the temp photo is left as it was.
+        """
+        path = self.path(photo_id)
+        blob = await self.blobs.pin_link(path) if path else None
+        if blob is None:
+            return None
+
+        async def remove_link(committed: bool) -> None:
+            if committed:
+                await self.blobs.unlink(path, BlobReferenceRepository(session).count)
+
+        self.blobs.hold(session, blob)
+        after_transaction(session, remove_link)
+        return blob
+
+    async def discard(self, photo_id: str) -> None:
+        """Delete a temp photo, and its blob unless something else uses it."""
+        path = self.path(photo_id)
+        if path:
+            await self._discard(path)
+
+    async def expire(self, max_age_hours: float) -> int:
+        """Delete temp photos older than ``max_age_hours``; returns how many."""
+        cutoff = time.time() - max_age_hours * 3600
+        expired = await asyncio.to_thread(_expired_links, self.directory, cutoff)
+        for path in expired:
+            await self._discard(path)
+        return len(expired)
+
+    async def watch(self, interval: float, max_age_hours: float) -> None:
+        """Expire temp photos forever (run as a background task)."""
+        while True:
+            try:
+                expired = await self.expire(max_age_hours)
+                if expired:
+                    logger.info("temp_photos_expired", count=expired)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("temp_photos_expiry_failed", exc_info=True)
+            await asyncio.sleep(interval)
+
+    async def _discard(self, path: str) -> None:
+        async with async_session_factory() as session:
+            await self.blobs.unlink(path, BlobReferenceRepository(session).count)
+
+
+def _expired_links(directory: str, cutoff: float) -> list[str]:
+    """Temp photo links last modified before ``cutoff`` (the link, not its blob)."""
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return []
+    expired = []
+    for entry in entries:
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                expired.append(entry.path)
+        except FileNotFoundError:
+            continue
+    return expired
+
+
+# Singleton instance
+temp_photos = TempPhotoStore(
+    directory=os.path.join(settings.photos_path, "temp-photos"),
+    blobs=blob_store,
+)
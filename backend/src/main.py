@@ -1,29 +1,49 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy import select
 
-from src.api.v1.router import router as api_router
+from src.api.v1.router import API_PREFIX, routers
+from src.application.services.pdf_service import pdf_renderer
+from src.core.compression import CompressionMiddleware
 from src.core.config import get_settings
 from src.core.exceptions import register_exception_handlers
 from src.core.logging import setup_logging
 from src.core.middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware
 from src.core.rate_limit import RateLimitMiddleware
+from src.core.responses import FastJSONResponse
 from src.domain.entities.role import DEFAULT_ROLE_PERMISSIONS, Permission
+from src.infrastructure.cache import reference_catalog
+from src.infrastructure.database.change_log import change_log_janitor
 from src.infrastructure.database.connection import async_session_factory
 from src.infrastructure.database.models import RoleModel
+from src.infrastructure.storage import temp_photos
+from src.infrastructure.storage.images import image_processor
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
 async def _sync_role_permissions() -> None:
-    """Ensure system roles in DB have latest permissions from code."""
+    """Ensure system roles in DB have latest permissions from code.
+
+    Runs as a background task so serving (and health checks) does not wait
+    on the database at startup; a failure is logged, not fatal.
+    """
+    try:
+        await _update_role_permissions()
+    except Exception:
+        logger.warning("Role permission sync failed", exc_info=True)
+
+
+async def _update_role_permissions() -> None:
     async with async_session_factory() as session:
         result = await session.execute(
             select(RoleModel).where(RoleModel.is_system == True)  # noqa: E712
@@ -48,10 +68,39 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     os.makedirs(settings.photos_path, exist_ok=True)
-    await _sync_role_permissions()
+    background_tasks = [asyncio.create_task(_sync_role_permissions())]
+    if settings.reference_sync_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                reference_catalog.watch(settings.reference_sync_interval_seconds)
+            )
+        )
+    if settings.temp_photo_cleanup_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                temp_photos.watch(
+                    settings.temp_photo_cleanup_interval_seconds,
+                    settings.temp_photo_max_age_hours,
+                )
+            )
+        )
+    if settings.change_log_cleanup_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                change_log_janitor.watch(
+                    settings.change_log_cleanup_interval_seconds,
+                    settings.change_log_retention_days,
+                )
+            )
+        )
     yield
     # Shutdown
-    pass
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    image_processor.shutdown()
+    pdf_renderer.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -66,8 +115,19 @@ def create_app() -> FastAPI:
         docs_url="/api/docs" if settings.debug else None,
         redoc_url="/api/redoc" if settings.debug else None,
         openapi_url="/api/openapi.json" if settings.debug else None,
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_responses else JSONResponse
+        ),
     )
 
+    # Response compression (innermost — sees the original response body)
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            level=settings.compression_level,
+        )
+
     # CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -90,8 +150,9 @@ def create_app() -> FastAPI:
     # Register exception handlers
     register_exception_handlers(app)
 
-    # Include API router
-    app.include_router(api_router)
+    # Include API routers
+    for router in routers:
+        app.include_router(router, prefix=API_PREFIX)
 
     # Health check endpoint
     @app.get("/health", tags=["Health"])
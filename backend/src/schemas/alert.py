@@ -28,3 +28,40 @@ class PatientAlertsResponse(AppBaseModel):
     has_warnings: bool = False
     error_count: int = 0
     warning_count: int = 0
+
+    @classmethod
+    def from_alerts(cls, patient_id: str, alerts: list) -> "PatientAlertsResponse":
+        """Create response from the Alert entities of a patient."""
+        errors = sum(1 for a in alerts if a.is_error)
+        warnings = sum(1 for a in alerts if a.is_warning)
+        return cls(
+            patient_id=patient_id,
+            alerts=[
+                AlertResponse(
+                    type=a.type,
+                    severity=a.severity,
+                    message=a.message,
+                    zone_id=a.zone_id,
+                    zone_nom=a.zone_nom,
+                    details=a.details,
+                )
+                for a in alerts
+            ],
+            has_alerts=len(alerts) > 0,
+            has_errors=errors > 0,
+            has_warnings=warnings > 0,
+            error_count=errors,
+            warning_count=warnings,
+        )
+
+
+class BulkAlertsRequest(AppBaseModel):
+    """Request schema for alerts of many patients."""
+
+    patient_ids: list[str] = Field(min_length=1, max_length=500)
+
+
+class BulkAlertsResponse(AppBaseModel):
+    """Alerts keyed by patient ID."""
+
+    patients: dict[str, PatientAlertsResponse] = Field(default_factory=dict)
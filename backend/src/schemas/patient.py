@@ -74,7 +74,57 @@ class PatientDetailResponse(PatientResponse):
     zones: list["PatientZoneResponse"] = []
 
 
+class PatientDocumentResponse(AppBaseModel):
+    """Document uploaded to a patient profile."""
+
+    id: str
+    filename: str
+    content_type: str
+    size_bytes: int
+    description: str | None = None
+    url: str
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, document) -> "PatientDocumentResponse":
+        """Create response from PatientDocument entity."""
+        return cls(
+            id=document.id,
+            filename=document.filename,
+            content_type=document.content_type,
+            size_bytes=document.size_bytes,
+            description=document.description,
+            url=f"/api/v1/documents/uploads/{document.id}/file",
+            created_at=document.created_at,
+        )
+
+
+class PatientOverviewResponse(AppBaseModel):
+    """Patient detail screen in one response.
+
+    Sections not requested (or not allowed for the user) are null.
+    """
+
+    patient: PatientResponse
+    zones: list["PatientZoneResponse"] | None = None
+    sessions: list["SessionResponse"] | None = None
+    sessions_total: int | None = None
+    pre_consultation: "PreConsultationResponse | None" = None
+    alerts: "PatientAlertsResponse | None" = None
+    subscriptions: list["PatientSubscriptionResponse"] | None = None
+    payments: list["PaiementResponse"] | None = None
+    absences: list["AbsenceRecordResponse"] | None = None
+    documents: list[PatientDocumentResponse] | None = None
+
+
 # Import here to avoid circular imports
+from src.schemas.alert import PatientAlertsResponse  # noqa: E402
+from src.schemas.pack import PatientSubscriptionResponse  # noqa: E402
+from src.schemas.paiement import PaiementResponse  # noqa: E402
+from src.schemas.pre_consultation import PreConsultationResponse  # noqa: E402
+from src.schemas.schedule import AbsenceRecordResponse  # noqa: E402
+from src.schemas.session import SessionResponse  # noqa: E402
 from src.schemas.zone import PatientZoneResponse  # noqa: E402
 
 PatientDetailResponse.model_rebuild()
+PatientOverviewResponse.model_rebuild()
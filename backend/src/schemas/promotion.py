@@ -47,3 +47,31 @@ class ZonePriceResponse(AppBaseModel):
     final_price: int
     discount: int
     promotions: list[dict]
+
+
+class QuoteRequest(AppBaseModel):
+    zone_ids: list[str] = Field(min_length=1, max_length=100)
+    prices: dict[str, int] = Field(default_factory=dict)  # overrides catalog prices
+
+
+class QuoteLine(ZonePriceResponse):
+    zone_id: str
+    zone_nom: str
+
+
+class QuotePackOption(AppBaseModel):
+    pack_id: str
+    nom: str
+    prix: int
+    seances_per_zone: int
+    covered_zone_ids: list[str]
+    uncovered_zone_ids: list[str]
+    total_price: int  # pack price plus the uncovered zones at their best price
+
+
+class QuoteResponse(AppBaseModel):
+    lines: list[QuoteLine]
+    total_original: int
+    total_final: int
+    total_discount: int
+    packs: list[QuotePackOption]
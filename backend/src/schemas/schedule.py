@@ -42,6 +42,29 @@ class ScheduleEntryResponse(AppBaseModel):
     created_at: dt.datetime
     zone_warnings: list[str] = []
 
+    @classmethod
+    def from_entity(cls, e, zone_warnings: list[str] | None = None) -> "ScheduleEntryResponse":
+        """Create response from DailyScheduleEntry entity."""
+        return cls(
+            id=e.id,
+            date=e.date,
+            patient_nom=e.patient_nom,
+            patient_prenom=e.patient_prenom,
+            patient_id=e.patient_id,
+            patient_telephone=e.patient_telephone,
+            doctor_name=e.doctor_name,
+            doctor_id=e.doctor_id,
+            specialite=e.specialite,
+            duration_type=e.duration_type,
+            start_time=e.start_time,
+            end_time=e.end_time,
+            notes=e.notes,
+            zone_ids=e.zone_ids or [],
+            status=e.status,
+            created_at=e.created_at,
+            zone_warnings=zone_warnings or [],
+        )
+
 
 class ScheduleListResponse(AppBaseModel):
     entries: list[ScheduleEntryResponse]
@@ -64,6 +87,9 @@ class PhoneConflict(AppBaseModel):
 class ScheduleUploadResponse(AppBaseModel):
     message: str
     entries_created: int
+    entries_updated: int = 0
+    entries_deleted: int = 0
+    entries_preserved: int = 0
     date: dt.date | None = None
     phone_matched: int = 0
     phone_conflicts: list[PhoneConflict] = []
@@ -90,6 +116,44 @@ class QueueEntryResponse(AppBaseModel):
     patient_code_carte: str | None = None
     patient_telephone: str | None = None
 
+    @classmethod
+    def from_entity(
+        cls,
+        e,
+        zone_names: list[str] | None = None,
+        patient_code_carte: str | None = None,
+        patient_telephone: str | None = None,
+    ) -> "QueueEntryResponse":
+        """Create response from WaitingQueueEntry entity."""
+        return cls(
+            id=e.id,
+            schedule_id=e.schedule_id,
+            patient_id=e.patient_id,
+            patient_name=e.patient_name,
+            doctor_id=e.doctor_id,
+            doctor_name=e.doctor_name,
+            box_id=e.box_id,
+            box_nom=e.box_nom,
+            checked_in_at=e.checked_in_at,
+            position=e.position,
+            status=e.status,
+            called_at=e.called_at,
+            completed_at=e.completed_at,
+            zone_names=zone_names or [],
+            patient_code_carte=patient_code_carte,
+            patient_telephone=patient_telephone,
+        )
+
+    @classmethod
+    def from_enriched(cls, item: dict) -> "QueueEntryResponse":
+        """Create response from an item of ``ScheduleService.enrich_queue_entries``."""
+        return cls.from_entity(
+            item["entry"],
+            zone_names=item.get("zone_names"),
+            patient_code_carte=item.get("patient_code_carte"),
+            patient_telephone=item.get("patient_telephone"),
+        )
+
 
 class QueueListResponse(AppBaseModel):
     entries: list[QueueEntryResponse]
@@ -5,6 +5,7 @@ from typing import Any
 
 from pydantic import Field
 
+from src.application.services.session_service import SessionService
 from src.schemas.base import AppBaseModel, PaginatedResponse
 
 # Valid spot sizes per PPT
@@ -20,8 +21,23 @@ class SessionPhotoResponse(AppBaseModel):
     id: str
     filename: str
     url: str
+    thumbnail_url: str | None = None
+    medium_url: str | None = None
     created_at: datetime
 
+    @classmethod
+    def from_entity(cls, photo) -> "SessionPhotoResponse":
+        """Create response from SessionPhoto entity."""
+        variants = SessionService.get_photo_variant_urls(photo)
+        return cls(
+            id=photo.id,
+            filename=photo.filename,
+            url=SessionService.get_photo_url(photo),
+            thumbnail_url=variants["thumb"],
+            medium_url=variants["medium"],
+            created_at=photo.created_at,
+        )
+
 
 class SessionBase(AppBaseModel):
     """Base session schema."""
@@ -66,6 +82,31 @@ class SessionResponse(AppBaseModel):
     photos: list[SessionPhotoResponse]
     created_at: datetime
 
+    @classmethod
+    def from_entity(cls, session, **fields: Any) -> "SessionResponse":
+        """Create response from Session entity; ``fields`` set the remaining values."""
+        values = {
+            "id": session.id,
+            "patient_id": session.patient_id,
+            "patient_zone_id": session.patient_zone_id,
+            "zone_nom": session.zone_nom,
+            "praticien_id": session.praticien_id,
+            "praticien_nom": session.praticien_nom,
+            "patient_nom": session.patient_nom,
+            "patient_prenom": session.patient_prenom,
+            "date_seance": session.date_seance,
+            "type_laser": session.type_laser,
+            "parametres": session.parametres,
+            "spot_size": session.spot_size,
+            "fluence": session.fluence,
+            "pulse_duration_ms": session.pulse_duration_ms,
+            "frequency_hz": session.frequency_hz,
+            "notes": session.notes,
+            "duree_minutes": session.duree_minutes,
+            "photos": [SessionPhotoResponse.from_entity(p) for p in session.photos],
+            "created_at": session.created_at,
+        }
+        return cls(**(values | fields))
 
 class SessionListResponse(PaginatedResponse):
     """Session list response."""
@@ -0,0 +1,27 @@
+"""Pydantic schemas for delta sync."""
+
+from pydantic import Field
+
+from src.schemas.base import AppBaseModel
+from src.schemas.paiement import PaiementResponse
+from src.schemas.patient import PatientResponse
+from src.schemas.schedule import QueueEntryResponse, ScheduleEntryResponse
+from src.schemas.session import SessionResponse
+
+
+class SyncResponse(AppBaseModel):
+    """Rows changed since a sync cursor.
+
+    Clients apply the rows and deletions, then send ``cursor`` back as
+    ``since``; while ``has_more`` is true the next page is ready at once.
+    """
+
+    cursor: int
+    has_more: bool = False
+    patients: list[PatientResponse] = Field(default_factory=list)
+    schedule: list[ScheduleEntryResponse] = Field(default_factory=list)
+    queue: list[QueueEntryResponse] = Field(default_factory=list)
+    sessions: list[SessionResponse] = Field(default_factory=list)
+    payments: list[PaiementResponse] = Field(default_factory=list)
+    # Entity name -> IDs of rows deleted (or no longer visible)
+    deleted: dict[str, list[str]] = Field(default_factory=dict)
@@ -5,7 +5,10 @@ Tests ALL endpoints for ALL user roles.
 Run with: TEST_BASE_URL="http://localhost" PYTHONPATH=. pytest tests/integration/test_full_api.py -v
 """
 
+import asyncio
+import io
 import os
+import zipfile
 
 import pytest
 from httpx import AsyncClient
@@ -391,6 +394,46 @@ class TestPatientManagement:
         response = await admin_client.delete(f"/api/v1/patients/{patient_id}")
         assert response.status_code in [200, 204]
 
+    @pytest.mark.asyncio
+    async def test_patient_overview(self, admin_client: AsyncClient):
+        """GET /patients/{id}/overview - every section of the patient screen in one call."""
+        code_carte = f"OV{uuid4().hex[:8].upper()}"
+        create_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Overview",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": "0666666666",
+            "code_carte": code_carte,
+        })
+        patient_id = create_resp.json()["id"]
+        await admin_client.post("/api/v1/paiements", json={
+            "patient_id": patient_id,
+            "montant": 80.0,
+            "type": "encaissement",
+            "mode_paiement": "carte",
+        })
+
+        response = await admin_client.get(f"/api/v1/patients/{patient_id}/overview")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["patient"]["code_carte"] == code_carte
+        assert data["zones"] == []
+        assert data["sessions"] == [] and data["sessions_total"] == 0
+        assert data["alerts"]["patient_id"] == patient_id
+        assert [p["montant"] for p in data["payments"]] == [80]
+        assert data["documents"] == []
+
+        selected = await admin_client.get(
+            f"/api/v1/patients/{patient_id}/overview?fields=payments,zones"
+        )
+        assert selected.status_code == 200
+        assert len(selected.json()["payments"]) == 1
+        assert selected.json()["sessions"] is None
+
+        unknown = await admin_client.get(f"/api/v1/patients/{patient_id}/overview?fields=foo")
+        assert unknown.status_code == 400
+        missing = await admin_client.get(f"/api/v1/patients/{uuid4()}/overview")
+        assert missing.status_code == 404
+
 
 # ============================================================================
 # 6. PATIENT ZONES TESTS
@@ -556,6 +599,43 @@ class TestQuestionnaire:
             # Note: Skip delete to preserve test data
             # Skip create test due to backend bug (missing id argument in Question.__init__)
 
+    @pytest.mark.asyncio
+    async def test_questionnaire_bulk_upsert(self, admin_client: AsyncClient):
+        """PUT /pre-consultations/{id}/questionnaire - answers are inserted then updated."""
+        questions = (await admin_client.get("/api/v1/questionnaire/questions")).json()["questions"]
+        assert questions, "Need at least one question"
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Questionnaire",
+            "nom": f"Bulk_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"QB{uuid4().hex[:8].upper()}",
+        })
+        pc_resp = await admin_client.post("/api/v1/pre-consultations", json={
+            "patient_id": patient_resp.json()["id"],
+            "sexe": "F",
+            "age": 30,
+        })
+        pc_id = pc_resp.json()["id"]
+        url = f"/api/v1/pre-consultations/{pc_id}/questionnaire"
+
+        try:
+            for answer in ("first", "second"):
+                response = await admin_client.put(url, json={"responses": [
+                    *({"question_id": q["id"], "reponse": answer} for q in questions),
+                    {"question_id": str(uuid4()), "reponse": answer},
+                ]})
+                assert response.status_code == 200
+                data = response.json()
+                assert data["answered_questions"] == len(questions)
+                assert {r["reponse"] for r in data["responses"]} == {answer}
+
+            missing = await admin_client.put(
+                f"/api/v1/pre-consultations/{uuid4()}/questionnaire", json={"responses": []}
+            )
+            assert missing.status_code == 404
+        finally:
+            await admin_client.delete(f"/api/v1/pre-consultations/{pc_id}")
+
 
 # ============================================================================
 # 9. PACKS & SUBSCRIPTIONS TESTS
@@ -678,6 +758,44 @@ class TestPromotions:
         )
         assert price_resp.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_quote_cart(self, admin_client: AsyncClient):
+        """POST /promotions/quote - whole cart priced in one call, new promotions included."""
+        zones = (await admin_client.get("/api/v1/zones")).json()["zones"]
+        zone_ids = [z["id"] for z in zones[:3]]
+        prices = {zone_id: 10000 for zone_id in zone_ids}
+
+        before = await admin_client.post("/api/v1/promotions/quote", json={
+            "zone_ids": zone_ids, "prices": prices,
+        })
+        assert before.status_code == 200
+        data = before.json()
+        assert [line["zone_id"] for line in data["lines"]] == zone_ids
+        assert data["total_original"] == 30000
+        assert data["total_final"] == sum(line["final_price"] for line in data["lines"])
+
+        promo_resp = await admin_client.post("/api/v1/promotions", json={
+            "nom": f"Quote Promo {uuid4().hex[:6]}",
+            "type": "montant",
+            "valeur": 9999.0,
+            "zone_ids": [zone_ids[0]],
+        })
+        promo_id = promo_resp.json()["id"]
+        try:
+            after = await admin_client.post("/api/v1/promotions/quote", json={
+                "zone_ids": zone_ids, "prices": prices,
+            })
+            first = after.json()["lines"][0]
+            assert first["final_price"] <= 1
+            assert promo_id in [p["id"] for p in first["promotions"]]
+        finally:
+            await admin_client.delete(f"/api/v1/promotions/{promo_id}")
+
+        unknown = await admin_client.post("/api/v1/promotions/quote", json={
+            "zone_ids": [str(uuid4())],
+        })
+        assert unknown.status_code == 404
+
 
 # ============================================================================
 # 11. PAYMENTS TESTS
@@ -796,6 +914,30 @@ class TestBoxes:
         # Accept 200, 204, or 403 (if unassign requires admin)
         assert unassign_resp.status_code in [200, 204, 403]
 
+    @pytest.mark.asyncio
+    async def test_box_board_follows_assignments(self, admin_client: AsyncClient):
+        """GET /boxes - occupant appears on assign and leaves on unassign."""
+        numero = int(uuid4().int % 1000) + 1200
+        box_resp = await admin_client.post("/api/v1/boxes", json={
+            "nom": f"Board Box {uuid4().hex[:6]}",
+            "numero": numero
+        })
+        box_id = box_resp.json()["id"]
+
+        async def occupant():
+            boxes = (await admin_client.get("/api/v1/boxes")).json()["boxes"]
+            return next(b for b in boxes if b["id"] == box_id)["current_user_name"]
+
+        try:
+            assert await occupant() is None
+            assign_resp = await admin_client.post("/api/v1/boxes/assign", json={"box_id": box_id})
+            assert assign_resp.status_code == 200
+            assert await occupant() == assign_resp.json()["user_nom"]
+            await admin_client.delete("/api/v1/boxes/assign")
+            assert await occupant() is None
+        finally:
+            await admin_client.delete(f"/api/v1/boxes/{box_id}")
+
 
 # ============================================================================
 # 13. SCHEDULE & QUEUE TESTS
@@ -930,6 +1072,71 @@ class TestAlerts:
         response = await admin_client.get(f"/api/v1/patients/{patient_id}/alerts/summary")
         assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_alerts_summary_matches_alerts(self, admin_client: AsyncClient):
+        """GET /patients/{id}/alerts/summary - stored counts match the full alerts."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "AlertState",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"AST{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+
+        alerts = (await admin_client.get(f"/api/v1/patients/{patient_id}/alerts")).json()
+        for _ in range(2):  # computed, then read back from the stored state
+            response = await admin_client.get(f"/api/v1/patients/{patient_id}/alerts/summary")
+            assert response.status_code == 200
+            summary = response.json()
+            assert summary["has_alerts"] == alerts["has_alerts"]
+            assert summary["error_count"] == alerts["error_count"]
+            assert summary["warning_count"] == alerts["warning_count"]
+
+    @pytest.mark.asyncio
+    async def test_alerts_summary_follows_writes(self, admin_client: AsyncClient):
+        """GET /patients/{id}/alerts/summary - stored counts are dropped once a source changes."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "AlertVersion",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"ASV{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        url = f"/api/v1/patients/{patient_id}/alerts/summary"
+
+        assert (await admin_client.get(url)).json()["has_errors"] is False
+        pc_resp = await admin_client.post("/api/v1/pre-consultations", json={
+            "patient_id": patient_id,
+            "sexe": "F",
+            "age": 30,
+            "is_pregnant": True,
+        })
+        assert pc_resp.status_code == 201
+        assert (await admin_client.get(url)).json()["has_errors"] is True
+
+    @pytest.mark.asyncio
+    async def test_alerts_batch(self, admin_client: AsyncClient):
+        """POST /alerts/batch - alerts for several patients, same as per-patient."""
+        patient_ids = []
+        for _ in range(2):
+            patient_resp = await admin_client.post("/api/v1/patients", json={
+                "prenom": "AlertBatch",
+                "nom": f"Test_{uuid4().hex[:6]}",
+                "telephone": f"06{uuid4().int % 100000000:08d}",
+                "code_carte": f"ALB{uuid4().hex[:8].upper()}",
+            })
+            patient_ids.append(patient_resp.json()["id"])
+
+        response = await admin_client.post("/api/v1/alerts/batch", json={
+            "patient_ids": patient_ids,
+        })
+        assert response.status_code == 200
+        patients = response.json()["patients"]
+        assert set(patients) == set(patient_ids)
+
+        single = await admin_client.get(f"/api/v1/patients/{patient_ids[0]}/alerts")
+        assert patients[patient_ids[0]]["alerts"] == single.json()["alerts"]
+
 
 # ============================================================================
 # 16. DOCUMENTS TESTS
@@ -954,6 +1161,97 @@ class TestDocuments:
         assert response.status_code == 200
         assert response.headers.get("content-type") == "image/png"
 
+    @pytest.mark.asyncio
+    async def test_document_reprint_is_cached(self, admin_client: AsyncClient):
+        """GET /documents/patients/{id}/documents/rules - reprints reuse the render."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Pdf",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"PDF{uuid4().hex[:8].upper()}",
+        })
+        url = f"/api/v1/documents/patients/{patient_resp.json()['id']}/documents/rules"
+
+        first = await admin_client.get(url)
+        assert first.status_code == 200
+        assert first.content.startswith(b"%PDF")
+        # reportlab stamps each render with its creation time and a random ID
+        reprint = await admin_client.get(url)
+        assert reprint.content == first.content
+
+        template = await admin_client.get("/api/v1/documents/templates/rules")
+        content = {**template.json()["content"], "title": f"Reglement {uuid4().hex[:6]}"}
+        await admin_client.put("/api/v1/documents/templates/rules", json={"content": content})
+        try:
+            updated = await admin_client.get(url)
+            assert updated.status_code == 200
+            assert updated.content != first.content
+        finally:
+            await admin_client.delete("/api/v1/documents/templates/rules")
+
+    @pytest.mark.asyncio
+    async def test_document_batch(self, admin_client: AsyncClient):
+        """POST /documents/batch - ZIP (default) or merged PDF for a list of patients."""
+        patient_ids = []
+        for _ in range(2):
+            resp = await admin_client.post("/api/v1/patients", json={
+                "prenom": "Batch",
+                "nom": f"Test_{uuid4().hex[:6]}",
+                "telephone": f"06{uuid4().int % 100000000:08d}",
+                "code_carte": f"BAT{uuid4().hex[:8].upper()}",
+            })
+            patient_ids.append(resp.json()["id"])
+
+        merged = await admin_client.post("/api/v1/documents/batch", json={
+            "patient_ids": patient_ids,
+            "format": "pdf",
+        })
+        assert merged.status_code == 200
+        assert merged.content.startswith(b"%PDF")
+
+        archive = await admin_client.post("/api/v1/documents/batch", json={
+            "patient_ids": patient_ids,
+            "document_types": ["consent", "rules"],
+        })
+        assert archive.status_code == 200
+        names = zipfile.ZipFile(io.BytesIO(archive.content)).namelist()
+        assert len(names) == 4
+        assert all(name.endswith(".pdf") for name in names)
+
+        neither = await admin_client.post("/api/v1/documents/batch", json={})
+        assert neither.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_qr_code_formats_and_card_sheet(self, admin_client: AsyncClient):
+        """GET /documents/patients/{id}/qr-code?format=svg and POST /documents/qr-codes/sheet."""
+        code = f"QRS{uuid4().hex[:8].upper()}"
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Carte",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": code,
+        })
+        patient_id = patient_resp.json()["id"]
+
+        url = f"/api/v1/documents/patients/{patient_id}/qr-code"
+        png = await admin_client.get(url, params={"size": 4})
+        assert png.status_code == 200
+        assert png.content.startswith(b"\x89PNG")
+        assert (await admin_client.get(url, params={"size": 4})).content == png.content
+        svg = await admin_client.get(url, params={"format": "svg"})
+        assert svg.headers["content-type"].startswith("image/svg+xml")
+
+        sheet = await admin_client.post("/api/v1/documents/qr-codes/sheet", json={
+            "code_prefix": code,
+        })
+        assert sheet.status_code == 200
+        assert sheet.content.startswith(b"%PDF")
+
+        missing = await admin_client.post("/api/v1/documents/qr-codes/sheet", json={
+            "code_prefix": f"NONE{uuid4().hex}",
+        })
+        assert missing.status_code == 404
+
 
 # ============================================================================
 # 17. SECRETARY ROLE TESTS
@@ -1561,6 +1859,89 @@ class TestScheduleWorkflow:
                 assert today_str in entry["checked_in_at"], \
                     f"Queue entry {entry['id']} has checked_in_at from a different day: {entry['checked_in_at']}"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_check_ins_get_unique_positions(self, admin_client: AsyncClient):
+        """POST /schedule/{id}/check-in - parallel check-ins never share a queue position."""
+        today = __import__("datetime").date.today().isoformat()
+        entry_ids = []
+        for i in range(12):
+            entry_resp = await admin_client.post("/api/v1/schedule/manual", json={
+                "date": today,
+                "patient_prenom": f"Rush{i}",
+                "patient_nom": f"Queue_{uuid4().hex[:8]}",
+                "start_time": "09:00",
+            })
+            assert entry_resp.status_code == 201
+            entry_ids.append(entry_resp.json()["id"])
+
+        responses = await asyncio.gather(*(
+            admin_client.post(f"/api/v1/schedule/{entry_id}/check-in") for entry_id in entry_ids
+        ))
+        assert all(r.status_code in [200, 201] for r in responses)
+        positions = [r.json()["position"] for r in responses]
+        # Unique, not necessarily contiguous
+        assert len(set(positions)) == len(positions)
+
+        queue = (await admin_client.get("/api/v1/schedule/queue")).json()["entries"]
+        queued = [e["position"] for e in queue if e["schedule_id"] in entry_ids]
+        assert queued == sorted(positions)
+
+    @pytest.mark.asyncio
+    async def test_schedule_reupload_is_diffed(self, admin_client: AsyncClient):
+        """POST /schedule/upload - re-uploading a day updates in place and keeps check-ins."""
+        import datetime as dt
+
+        import openpyxl
+
+        day = dt.date(2031, 1, 1) + dt.timedelta(days=uuid4().int % 3000)
+        suffix = uuid4().hex[:8]
+
+        def workbook(rows: list[tuple[str, str, str | None]]) -> bytes:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.append(["Date", "Prenom", "Nom", "Medecin", "Specialite", "Duree",
+                       "Debut", "Fin", "Note"])
+            for prenom, start, note in rows:
+                ws.append([day.strftime("%d/%m/%Y"), prenom, f"Import_{suffix}", "Dr Test",
+                           None, None, start, None, note])
+            buffer = io.BytesIO()
+            wb.save(buffer)
+            return buffer.getvalue()
+
+        async def upload(rows: list[tuple[str, str, str | None]]) -> dict:
+            resp = await admin_client.post(
+                "/api/v1/schedule/upload",
+                files={"file": ("agenda.xlsx", workbook(rows), "application/octet-stream")},
+            )
+            assert resp.status_code == 200
+            return resp.json()
+
+        async def day_entries() -> dict[str, dict]:
+            resp = await admin_client.get(f"/api/v1/schedule/{day.isoformat()}")
+            return {e["patient_prenom"]: e for e in resp.json()["entries"]}
+
+        first = await upload([("Ana", "09:00", None), ("Bea", "09:30", None), ("Cid", "10:00", None)])
+        assert first["entries_created"] == 3
+        before = await day_entries()
+        checkin = await admin_client.post(f"/api/v1/schedule/{before['Ana']['id']}/check-in")
+        assert checkin.status_code in [200, 201]
+
+        # Same rows again, one note changed, Cid dropped, Dan added
+        second = await upload([
+            ("Ana", "09:00", None), ("Bea", "09:30", "Retard"), ("Dan", "11:00", None),
+        ])
+        assert second["entries_created"] == 1
+        assert second["entries_updated"] == 1
+        assert second["entries_deleted"] == 1
+        assert second["entries_preserved"] == 1
+
+        after = await day_entries()
+        assert sorted(after) == ["Ana", "Bea", "Dan"]
+        assert after["Ana"]["id"] == before["Ana"]["id"]
+        assert after["Ana"]["status"] != "expected"
+        assert after["Bea"]["id"] == before["Bea"]["id"]
+        assert after["Bea"]["notes"] == "Retard"
+
 
 # ============================================================================
 # 25. PAYMENT WITH SUBSCRIPTION TESTS
@@ -1652,3 +2033,566 @@ class TestPaymentWithSubscription:
         assert "total" in data
         assert data["page"] == 1
         assert data["size"] == 5
+
+
+# ============================================================================
+# 26. RESPONSE COMPRESSION TESTS
+# ============================================================================
+
+class TestResponseCompression:
+    """Test compression middleware behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_export_is_compressed(self, admin_client: AsyncClient):
+        """GET /patients/export - gzip-encoded CSV stream."""
+        response = await admin_client.get(
+            "/api/v1/patients/export", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert "text/csv" in response.headers["content-type"]
+        assert response.text  # httpx decodes transparently
+
+    @pytest.mark.asyncio
+    async def test_small_response_not_compressed(self, client: AsyncClient):
+        """GET /health - below size threshold, sent as-is."""
+        response = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert "accept-encoding" in response.headers.get("vary", "").lower()
+
+    @pytest.mark.asyncio
+    async def test_identity_not_compressed(self, admin_client: AsyncClient):
+        """GET /patients/export - no compression without Accept-Encoding."""
+        response = await admin_client.get(
+            "/api/v1/patients/export", headers={"Accept-Encoding": "identity"}
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert "accept-encoding" in response.headers.get("vary", "").lower()
+
+
+# ============================================================================
+# 27. CONDITIONAL GET TESTS
+# ============================================================================
+
+class TestConditionalGet:
+    """Test ETag / If-None-Match on reference data endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_zones_not_modified(self, admin_client: AsyncClient):
+        """GET /zones - 304 when If-None-Match matches."""
+        response = await admin_client.get("/api/v1/zones")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+        response = await admin_client.get("/api/v1/zones", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_etag_changes_after_write(self, admin_client: AsyncClient):
+        """GET /paiements/methods - ETag changes when a method is created."""
+        response = await admin_client.get("/api/v1/paiements/methods")
+        etag = response.headers["etag"]
+
+        create_resp = await admin_client.post("/api/v1/paiements/methods", json={
+            "nom": f"Methode_{uuid4().hex[:6]}",
+        })
+        assert create_resp.status_code == 201
+
+        response = await admin_client.get(
+            "/api/v1/paiements/methods", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        await admin_client.delete(f"/api/v1/paiements/methods/{create_resp.json()['id']}")
+
+    @pytest.mark.asyncio
+    async def test_etag_varies_with_query(self, admin_client: AsyncClient):
+        """GET /zones?include_inactive=true - distinct ETag per query string."""
+        default = await admin_client.get("/api/v1/zones")
+        inactive = await admin_client.get("/api/v1/zones?include_inactive=true")
+        assert default.headers["etag"] != inactive.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_compressed_etag_is_weak(self, admin_client: AsyncClient):
+        """GET /roles - compressed body carries a weak ETag that still revalidates."""
+        headers = {"Accept-Encoding": "gzip"}
+        response = await admin_client.get("/api/v1/roles", headers=headers)
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = await admin_client.get(
+            "/api/v1/roles", headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+        # The strong form from an uncompressed response matches too
+        response = await admin_client.get(
+            "/api/v1/roles", headers={**headers, "If-None-Match": etag.removeprefix("W/")}
+        )
+        assert response.status_code == 304
+
+
+# ============================================================================
+# 28. REFERENCE CACHE TESTS
+# ============================================================================
+
+class TestReferenceCache:
+    """Test that cached reference data reflects writes immediately."""
+
+    @pytest.mark.asyncio
+    async def test_payment_method_update_visible(self, admin_client: AsyncClient):
+        """PUT /paiements/methods/{id} - list reflects the new name."""
+        await admin_client.get("/api/v1/paiements/methods")  # warm the cache
+        create_resp = await admin_client.post("/api/v1/paiements/methods", json={
+            "nom": f"Cache_{uuid4().hex[:6]}",
+        })
+        method_id = create_resp.json()["id"]
+        new_name = f"Renamed_{uuid4().hex[:6]}"
+        await admin_client.put(f"/api/v1/paiements/methods/{method_id}", json={"nom": new_name})
+
+        response = await admin_client.get("/api/v1/paiements/methods")
+        names = {m["id"]: m["nom"] for m in response.json()}
+        assert names[method_id] == new_name
+        await admin_client.delete(f"/api/v1/paiements/methods/{method_id}")
+
+    @pytest.mark.asyncio
+    async def test_question_deactivation_visible(self, admin_client: AsyncClient):
+        """PUT /questionnaire/questions/{id} - inactive question leaves the active list."""
+        create_resp = await admin_client.post("/api/v1/questionnaire/questions", json={
+            "texte": f"Question cache {uuid4().hex[:6]}",
+            "type_reponse": "boolean",
+        })
+        question_id = create_resp.json()["id"]
+        listed = await admin_client.get("/api/v1/questionnaire/questions")
+        assert question_id in {q["id"] for q in listed.json()["questions"]}
+
+        await admin_client.put(
+            f"/api/v1/questionnaire/questions/{question_id}", json={"is_active": False}
+        )
+        listed = await admin_client.get("/api/v1/questionnaire/questions")
+        assert question_id not in {q["id"] for q in listed.json()["questions"]}
+
+
+# ============================================================================
+# 29. FILE UPLOAD TESTS
+# ============================================================================
+
+class TestFileUploads:
+    """Test streamed photo and document uploads."""
+
+    @pytest.mark.asyncio
+    async def test_temp_photo_roundtrip(self, admin_client: AsyncClient):
+        """POST/GET/DELETE /documents/temp-photo - stored bytes are served back."""
+        content = os.urandom(3 * 1024 * 1024)  # spans several storage chunks
+        response = await admin_client.post(
+            "/api/v1/documents/temp-photo",
+            files={"photo": ("photo.jpg", content, "image/jpeg")},
+        )
+        assert response.status_code == 201
+        photo_id = response.json()["id"]
+
+        served = await admin_client.get(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert served.status_code == 200
+        assert served.content == content
+
+        deleted = await admin_client.delete(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert deleted.status_code == 204
+
+    @pytest.mark.asyncio
+    async def test_patient_document_size_recorded(self, admin_client: AsyncClient):
+        """POST /documents/patients/{id}/uploads - size_bytes matches the upload."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Upload",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"UPL{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        content = os.urandom(1500)
+
+        response = await admin_client.post(
+            f"/api/v1/documents/patients/{patient_id}/uploads",
+            files={"file": ("scan.png", content, "image/png")},
+        )
+        assert response.status_code == 201
+        assert response.json()["size_bytes"] == len(content)
+
+    @pytest.mark.asyncio
+    async def test_session_photo_variants(self, admin_client: AsyncClient):
+        """POST /patients/{id}/sessions - photos expose resized variant URLs."""
+        from PIL import Image
+
+        zones_resp = await admin_client.get("/api/v1/zones")
+        zone_id = zones_resp.json()["zones"][0]["id"]
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Variant",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"VAR{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        zone_resp = await admin_client.post(f"/api/v1/patients/{patient_id}/zones", json={
+            "zone_definition_id": zone_id,
+            "seances_total": 6,
+        })
+        patient_zone_id = zone_resp.json()["id"]
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (2000, 1500), (180, 120, 90)).save(buffer, format="JPEG")
+        response = await admin_client.post(
+            f"/api/v1/patients/{patient_id}/sessions",
+            data={"patient_zone_id": patient_zone_id, "type_laser": "Diode (810nm)"},
+            files={"photos": ("zone.jpg", buffer.getvalue(), "image/jpeg")},
+        )
+        assert response.status_code == 201
+        photo = response.json()["photos"][0]
+        assert photo["thumbnail_url"] and photo["medium_url"]
+
+        thumb = await admin_client.get(photo["thumbnail_url"])
+        assert thumb.status_code == 200
+        assert len(thumb.content) < len(buffer.getvalue())
+
+    @pytest.mark.asyncio
+    async def test_duplicate_documents_share_storage(self, admin_client: AsyncClient):
+        """DELETE /documents/uploads/{id} - a duplicate upload outlives its twin."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Dedup",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"DUP{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        content = os.urandom(2048)
+
+        uploads = []
+        for _ in range(2):
+            response = await admin_client.post(
+                f"/api/v1/documents/patients/{patient_id}/uploads",
+                files={"file": ("scan.png", content, "image/png")},
+            )
+            assert response.status_code == 201
+            uploads.append(response.json())
+
+        deleted = await admin_client.delete(f"/api/v1/documents/uploads/{uploads[0]['id']}")
+        assert deleted.status_code == 204
+
+        served = await admin_client.get(uploads[1]["url"])
+        assert served.status_code == 200
+        assert served.content == content
+
+    @pytest.mark.asyncio
+    async def test_temp_photo_attached_to_session(self, admin_client: AsyncClient):
+        """POST /patients/{id}/sessions - photo_ids attach uploaded temp photos."""
+        zones_resp = await admin_client.get("/api/v1/zones")
+        zone_id = zones_resp.json()["zones"][0]["id"]
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Temp",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"TMP{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        zone_resp = await admin_client.post(f"/api/v1/patients/{patient_id}/zones", json={
+            "zone_definition_id": zone_id,
+            "seances_total": 6,
+        })
+        content = os.urandom(4096)
+        temp_resp = await admin_client.post(
+            "/api/v1/documents/temp-photo",
+            files={"photo": ("photo.jpg", content, "image/jpeg")},
+        )
+        photo_id = temp_resp.json()["id"]
+
+        response = await admin_client.post(
+            f"/api/v1/patients/{patient_id}/sessions",
+            data={
+                "patient_zone_id": zone_resp.json()["id"],
+                "type_laser": "Diode (810nm)",
+                "photo_ids": f'["{photo_id}"]',
+            },
+        )
+        assert response.status_code == 201
+        photo = response.json()["photos"][0]
+
+        served = await admin_client.get(photo["url"])
+        assert served.status_code == 200
+        assert served.content == content
+        temp = await admin_client.get(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert temp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_temp_photo_kept_when_session_fails(self, admin_client: AsyncClient):
+        """POST /patients/{id}/sessions - a failed create leaves temp photos in place."""
+        patient_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Temp",
+            "nom": f"Test_{uuid4().hex[:6]}",
+            "telephone": f"06{uuid4().int % 100000000:08d}",
+            "code_carte": f"TMP{uuid4().hex[:8].upper()}",
+        })
+        patient_id = patient_resp.json()["id"]
+        content = os.urandom(4096)
+        temp_resp = await admin_client.post(
+            "/api/v1/documents/temp-photo",
+            files={"photo": ("photo.jpeg", content, "image/jpeg")},
+        )
+        photo_id = temp_resp.json()["id"]
+
+        response = await admin_client.post(
+            f"/api/v1/patients/{patient_id}/sessions",
+            data={
+                "patient_zone_id": str(uuid4()),
+                "type_laser": "Diode (810nm)",
+                "photo_ids": f'["{photo_id}"]',
+            },
+        )
+        assert response.status_code == 404
+
+        temp = await admin_client.get(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert temp.status_code == 200
+        assert temp.content == content
+
+    @pytest.mark.asyncio
+    async def test_temp_photo_lookup_by_id(self, admin_client: AsyncClient):
+        """GET /documents/temp-photo/{id} - deleted and malformed IDs are not found."""
+        response = await admin_client.post(
+            "/api/v1/documents/temp-photo",
+            files={"photo": ("photo.png", os.urandom(512), "image/png")},
+        )
+        photo_id = response.json()["id"]
+
+        deleted = await admin_client.delete(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert deleted.status_code == 204
+        gone = await admin_client.get(f"/api/v1/documents/temp-photo/{photo_id}")
+        assert gone.status_code == 404
+        malformed = await admin_client.get(f"/api/v1/documents/temp-photo/{photo_id[:8]}")
+        assert malformed.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_stored_file_caching(self, admin_client: AsyncClient):
+        """GET /documents/temp-photo/{id} - immutable caching, 304 and Range."""
+        content = os.urandom(4096)
+        response = await admin_client.post(
+            "/api/v1/documents/temp-photo",
+            files={"photo": ("photo.jpg", content, "image/jpeg")},
+        )
+        url = response.json()["url"]
+
+        served = await admin_client.get(url)
+        assert served.status_code == 200
+        assert "immutable" in served.headers["cache-control"]
+        etag = served.headers["etag"]
+
+        cached = await admin_client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        partial = await admin_client.get(url, headers={"Range": "bytes=0-99"})
+        assert partial.status_code == 206
+        assert partial.content == content[:100]
+
+
+# ============================================================================
+# 30. BULK REORDER TESTS
+# ============================================================================
+
+class TestBulkReorder:
+    """Test reordering of ordered entities."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("length", [3, 30])
+    async def test_reorder_is_one_statement(self, length: int):
+        """reorder() sends a single UPDATE to the database whatever the list length."""
+        from sqlalchemy import event, select
+
+        from src.infrastructure.database.connection import async_session_factory, engine
+        from src.infrastructure.database.models import QuestionModel
+        from src.infrastructure.database.repositories.ordering import reorder
+
+        ids = [str(uuid4()) for _ in range(length)]
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        async with async_session_factory() as session:
+            session.add_all(
+                QuestionModel(id=qid, texte="Reorder", type_reponse="boolean", ordre=0)
+                for qid in ids
+            )
+            await session.flush()
+            event.listen(engine.sync_engine, "before_cursor_execute", record)
+            try:
+                updated = await reorder(session, QuestionModel, ids[::-1])
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", record)
+            result = await session.execute(
+                select(QuestionModel.id, QuestionModel.ordre).where(QuestionModel.id.in_(ids))
+            )
+            ordre = dict(result.all())
+            await session.rollback()
+
+        assert len(statements) == 1
+        assert updated == length
+        assert [ordre[qid] for qid in ids[::-1]] == list(range(length))
+
+    @pytest.mark.asyncio
+    async def test_question_order_roundtrip(self, admin_client: AsyncClient):
+        """PUT /questionnaire/questions/order - reversed order is applied, then restored."""
+        listed = await admin_client.get("/api/v1/questionnaire/questions")
+        original = [q["id"] for q in listed.json()["questions"]]
+        if len(original) < 2:
+            pytest.skip("Need at least two questions")
+
+        try:
+            response = await admin_client.put(
+                "/api/v1/questionnaire/questions/order",
+                json={"question_ids": original[::-1]},
+            )
+            assert response.status_code == 200
+            ordre = {q["id"]: q["ordre"] for q in response.json()["questions"]}
+            assert [ordre[qid] for qid in original[::-1]] == list(range(len(original)))
+        finally:
+            await admin_client.put(
+                "/api/v1/questionnaire/questions/order", json={"question_ids": original}
+            )
+
+
+# ============================================================================
+# 31. DELTA SYNC TESTS
+# ============================================================================
+
+class TestDeltaSync:
+    """Test the delta sync API."""
+
+    @pytest.mark.asyncio
+    async def test_sync_returns_changed_patients(self, admin_client: AsyncClient):
+        """GET /sync - a created then deleted patient comes back as changed, then deleted."""
+        start = await admin_client.get("/api/v1/sync")
+        assert start.status_code == 200
+        cursor = start.json()["cursor"]
+
+        create_resp = await admin_client.post("/api/v1/patients", json={
+            "prenom": "Sync",
+            "nom": f"Sync_{uuid4().hex[:6]}",
+            "telephone": "0611223344",
+            "code_carte": f"SYNC{uuid4().hex[:8].upper()}",
+        })
+        assert create_resp.status_code == 201
+        patient_id = create_resp.json()["id"]
+
+        async def changes_since(since: int) -> tuple[int, list[dict], list[str]]:
+            patients, deleted = [], []
+            while True:
+                response = await admin_client.get(
+                    "/api/v1/sync", params={"since": since, "entities": "patient"}
+                )
+                assert response.status_code == 200
+                data = response.json()
+                patients += data["patients"]
+                deleted += data["deleted"].get("patient", [])
+                since = data["cursor"]
+                if not data["has_more"]:
+                    return since, patients, deleted
+
+        cursor, patients, _ = await changes_since(cursor)
+        assert patient_id in [p["id"] for p in patients]
+
+        await admin_client.delete(f"/api/v1/patients/{patient_id}")
+        _, patients, deleted = await changes_since(cursor)
+        assert patient_id in deleted
+        assert patient_id not in [p["id"] for p in patients]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        not os.environ.get("TEST_DATABASE_URL"),
+        reason="needs TEST_DATABASE_URL pointing at the server's PostgreSQL database",
+    )
+    async def test_sync_follows_commit_order(self, admin_client: AsyncClient):
+        """GET /sync - a change committed after a later-logged one is not skipped."""
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from src.infrastructure.database.models import PatientModel
+
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        first, second = (
+            PatientModel(
+                id=str(uuid4()),
+                nom=f"Sync_{uuid4().hex[:6]}",
+                prenom="Ordre",
+                code_carte=f"SYNC{uuid4().hex[:8].upper()}",
+            )
+            for _ in range(2)
+        )
+
+        async def patients_since(since: int) -> tuple[int, list[str]]:
+            response = await admin_client.get(
+                "/api/v1/sync", params={"since": since, "entities": "patient"}
+            )
+            assert response.status_code == 200
+            data = response.json()
+            return data["cursor"], [p["id"] for p in data["patients"]]
+
+        start = await admin_client.get("/api/v1/sync")
+        cursor = start.json()["cursor"]
+        try:
+            async with sessions() as early, sessions() as late:
+                # Logged in this order, committed in the opposite one
+                early.add(first)
+                await early.flush()
+                late.add(second)
+                await late.flush()
+                await late.commit()
+
+                cursor, patients = await patients_since(cursor)
+                assert second.id in patients
+                assert first.id not in patients
+
+                await early.commit()
+
+            _, patients = await patients_since(cursor)
+            assert first.id in patients
+        finally:
+            for patient in (first, second):
+                await admin_client.delete(f"/api/v1/patients/{patient.id}")
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_sync_rejects_unknown_cursor(self, admin_client: AsyncClient):
+        """GET /sync - a cursor past the log is gone, unknown entities are rejected."""
+        start = await admin_client.get("/api/v1/sync")
+        future = start.json()["cursor"] + 1_000_000
+
+        response = await admin_client.get("/api/v1/sync", params={"since": future})
+        assert response.status_code == 410
+
+        response = await admin_client.get("/api/v1/sync", params={"since": 0, "entities": "foo"})
+        assert response.status_code == 400
+
+
+# ============================================================================
+# 32. STARTUP TESTS
+# ============================================================================
+
+class TestStartup:
+    """Test the import cost of the API at startup."""
+
+    def test_heavy_libraries_are_lazy(self):
+        """import src.main - reportlab, Pillow, qrcode... are not loaded."""
+        from benchmarks.bench_startup import heavy_modules, profile_import
+
+        assert heavy_modules(profile_import()) == []
+
+    def test_import_within_budget(self):
+        """import src.main - the number of modules loaded stays within budget."""
+        from benchmarks.bench_startup import IMPORT_MODULE_BUDGET, profile_import
+
+        loaded = len(profile_import())
+        assert loaded <= IMPORT_MODULE_BUDGET, f"src.main imports {loaded} modules"
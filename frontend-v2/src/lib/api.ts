@@ -78,6 +78,10 @@ import type {
   AbsencesResponse,
   PatientDocument,
   PatientDocumentsResponse,
+  PatientOverview,
+  PatientOverviewSection,
+  SyncChanges,
+  SyncEntity,
   DocumentTemplate,
   DocumentTemplateContent,
   DocumentTemplatesResponse,
@@ -256,6 +260,26 @@ export const api = {
     return handleResponse<PatientDetail>(response);
   },
 
+  async getPatientOverview(id: string, fields?: PatientOverviewSection[]) {
+    const searchParams = new URLSearchParams();
+    if (fields?.length) searchParams.set("fields", fields.join(","));
+
+    const response = await wrapFetch(
+      `${API_BASE}/patients/${id}/overview?${searchParams}`,
+    );
+    return handleResponse<PatientOverview>(response);
+  },
+
+  // Delta sync: without `since`, returns only the current cursor (410 = reload)
+  async getChanges(since?: number, entities?: SyncEntity[]) {
+    const searchParams = new URLSearchParams();
+    if (since !== undefined) searchParams.set("since", String(since));
+    if (entities?.length) searchParams.set("entities", entities.join(","));
+
+    const response = await wrapFetch(`${API_BASE}/sync?${searchParams}`);
+    return handleResponse<SyncChanges>(response);
+  },
+
   async getPatientByCard(code: string) {
     const response = await wrapFetch(
       `${API_BASE}/patients/by-card/${encodeURIComponent(code)}`,
@@ -237,10 +237,10 @@ function SessionDetailPage() {
                 <button
                   key={photo.id}
                   className="aspect-square rounded-lg overflow-hidden border hover:ring-2 hover:ring-primary transition-all"
-                  onClick={() => setSelectedPhoto(photo.url)}
+                  onClick={() => setSelectedPhoto(photo.medium_url ?? photo.url)}
                 >
                   <img
-                    src={photo.url}
+                    src={photo.thumbnail_url ?? photo.url}
                     alt={photo.filename}
                     className="w-full h-full object-cover"
                   />
@@ -484,6 +484,9 @@ function SecretaryAgendaPage() {
       const result = await api.uploadSchedule(file);
       const parts: string[] = [];
       parts.push(`${result.entries_created} entree(s) creee(s)`);
+      if (result.entries_updated > 0) parts.push(`${result.entries_updated} mise(s) a jour`);
+      if (result.entries_deleted > 0) parts.push(`${result.entries_deleted} supprimee(s)`);
+      if (result.entries_preserved > 0) parts.push(`${result.entries_preserved} deja arrivee(s) conservee(s)`);
       if (result.patients_created > 0) parts.push(`${result.patients_created} patient(s) cree(s)`);
       if (result.phone_matched > 0) parts.push(`${result.phone_matched} reliee(s) par telephone`);
       if (result.skipped_rows > 0) parts.push(`${result.skipped_rows} ligne(s) ignoree(s)`);
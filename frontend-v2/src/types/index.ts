@@ -104,6 +104,8 @@ export interface SessionPhoto {
   id: string;
   filename: string;
   url: string;
+  thumbnail_url?: string | null;
+  medium_url?: string | null;
   created_at: string;
 }
 
@@ -592,6 +594,9 @@ export interface PhoneConflict {
 export interface ScheduleUploadResponse {
   message: string;
   entries_created: number;
+  entries_updated: number;
+  entries_deleted: number;
+  entries_preserved: number;
   date: string | null;
   phone_matched: number;
   phone_conflicts: PhoneConflict[];
@@ -802,6 +807,42 @@ export interface PatientDocumentsResponse {
   total: number;
 }
 
+export type PatientOverviewSection =
+  | "zones"
+  | "sessions"
+  | "pre_consultation"
+  | "alerts"
+  | "subscriptions"
+  | "payments"
+  | "absences"
+  | "documents";
+
+export interface PatientOverview {
+  patient: Patient;
+  zones: PatientZone[] | null;
+  sessions: Session[] | null;
+  sessions_total: number | null;
+  pre_consultation: PreConsultation | null;
+  alerts: PatientAlerts | null;
+  subscriptions: PatientSubscription[] | null;
+  payments: Paiement[] | null;
+  absences: AbsenceRecord[] | null;
+  documents: PatientDocument[] | null;
+}
+
+export type SyncEntity = "patient" | "schedule" | "queue" | "session" | "payment";
+
+export interface SyncChanges {
+  cursor: number;
+  has_more: boolean;
+  patients: Patient[];
+  schedule: DailyScheduleEntry[];
+  queue: WaitingQueueEntry[];
+  sessions: Session[];
+  payments: Paiement[];
+  deleted: Partial<Record<SyncEntity, string[]>>;
+}
+
 export interface DocumentTemplateSection {
   heading: string;
   content?: string;